@@ -0,0 +1,107 @@
+"""
+Size and speed of cached answer payloads: the legacy UTF-8 JSON format against
+the binary MessagePack format, with and without zstd compression.
+
+Answers are Russian texts of typical FAQ lengths; the legacy payload also
+duplicates the question, as the exact-match tier used to store it.
+
+Run: python benchmarks/answer_payload_encoding.py [iterations]
+"""
+
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, Final
+from uuid import uuid4
+
+from clever_faq.application.common.ports.question.question_answering_port import MessageWithTokenDTO
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.infrastructure.cache.adapters.answer_payload import decode_answer, encode_answer
+
+DEFAULT_ITERATIONS: Final[int] = 5_000
+QUESTION: Final[Message] = Message("Как сбросить пароль от личного кабинета, если доступа к почте больше нет?")
+ANSWER_SENTENCES: Final[tuple[str, ...]] = (
+    "Чтобы сбросить пароль, откройте страницу входа и нажмите «Забыли пароль?». ",
+    "Если доступа к почте нет, обратитесь в службу поддержки через форму обратной связи. ",
+    "Специалист попросит подтвердить личность: укажите номер договора и последние четыре цифры телефона. ",
+    "Заявка рассматривается в течение одного рабочего дня, о результате вы получите SMS. ",
+    "После подтверждения задайте новый пароль длиной не менее двенадцати символов. ",
+    "Не используйте пароль, который уже применялся для других сервисов компании. ",
+    "Подробнее см. раздел 3.2 документа «Доступ к личному кабинету». ",
+    "Вывод: без доступа к почте восстановление возможно только через поддержку. ",
+)
+NO_COMPRESSION: Final[int] = sys.maxsize
+
+
+def build_answer(sentences: int) -> MessageWithTokenDTO:
+    return MessageWithTokenDTO(
+        message=Message("".join(ANSWER_SENTENCES[i % len(ANSWER_SENTENCES)] for i in range(sentences))),
+        tokens=Tokens(prompt=1200, completion=40 * sentences, cached_prompt=1024),
+        source_document_ids=frozenset(DocumentID(uuid4()) for _ in range(3)),
+    )
+
+
+def encode_legacy(answer_dto: MessageWithTokenDTO) -> bytes:
+    payload: dict[str, Any] = {
+        "question": QUESTION.value,
+        "answer": answer_dto.message.value,
+        "tokens": answer_dto.tokens.completion,
+        "version": "0123456789abcdef:7",
+        "source_document_ids": sorted(str(document_id) for document_id in answer_dto.source_document_ids),
+        "soft_expires_at": time.time() + 3600,
+        "hard_expires_at": time.time() + 3600,
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def measure(call: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def report(name: str, answer_dto: MessageWithTokenDTO, encode: Callable[[], bytes], iterations: int) -> None:
+    encoded: bytes = encode()
+    if decode_answer(encoded) is None:
+        msg = f"{name} payload does not decode"
+        raise RuntimeError(msg)
+
+    print(  # noqa: T201
+        f"  {name:<14} bytes={len(encoded):6d} "
+        f"ratio={len(encoded) / len(encode_legacy(answer_dto)):5.2f} "
+        f"encode={measure(encode, iterations):7.1f}us "
+        f"decode={measure(lambda: decode_answer(encoded), iterations):7.1f}us"
+    )
+
+
+def main(iterations: int) -> None:
+    for sentences in (1, 4, 8, 16):
+        answer_dto = build_answer(sentences)
+        print(f"answer of {len(answer_dto.message.value)} characters:")  # noqa: T201
+
+        report("json (legacy)", answer_dto, lambda answer_dto=answer_dto: encode_legacy(answer_dto), iterations)
+        report(
+            "msgpack",
+            answer_dto,
+            lambda answer_dto=answer_dto: encode_answer(
+                None, answer_dto, "0123456789abcdef:7", 3600, 3600, compression_threshold=NO_COMPRESSION
+            ),
+            iterations,
+        )
+        report(
+            "msgpack+zstd",
+            answer_dto,
+            lambda answer_dto=answer_dto: encode_answer(
+                None, answer_dto, "0123456789abcdef:7", 3600, 3600, compression_threshold=0
+            ),
+            iterations,
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS)
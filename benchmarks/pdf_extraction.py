@@ -0,0 +1,88 @@
+"""
+PDF text extraction time against the number of extraction processes.
+
+The PDFs from ``tests/data`` are merged ``copies`` times into one document,
+which is extracted by a single process the way it was done before and then
+by ``PdfFileProcessor`` with pools of growing size. The speedup is bounded
+by the number of cores of the machine.
+
+Run: python benchmarks/pdf_extraction.py [copies] [pages_per_task]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Final
+
+import pdfplumber
+import pypdfium2 as pdfium
+
+from clever_faq.infrastructure.adapters.file.pdf import PdfFileProcessor
+
+DATA_DIR: Final[Path] = Path(__file__).parents[1] / "tests" / "data"
+DEFAULT_COPIES: Final[int] = 8
+DEFAULT_PAGES_PER_TASK: Final[int] = 4
+RANGES_IN_FLIGHT_PER_PROCESS: Final[int] = 2
+
+
+def build_document(copies: int) -> bytes:
+    document = pdfium.PdfDocument.new()
+    sources = [pdfium.PdfDocument(path) for path in sorted(DATA_DIR.glob("*.pdf"))]
+    for _ in range(copies):
+        for source in sources:
+            document.import_pages(source)
+
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def extract_sequentially(content: bytes) -> str:
+    with pdfplumber.open(BytesIO(content)) as pdf:
+        return "".join((page.extract_text() or "") + "\n" for page in pdf.pages)
+
+
+async def extract_in_pool(content: bytes, processes: int, pages_per_task: int) -> tuple[str, float]:
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        processor = PdfFileProcessor(
+            executor,
+            pages_per_task=pages_per_task,
+            max_ranges_in_flight=RANGES_IN_FLIGHT_PER_PROCESS * processes,
+        )
+        # the first run starts the worker processes
+        "".join([part async for part in processor.extract_text(BytesIO(content))])
+
+        started = time.perf_counter()
+        extracted_text = "".join([part async for part in processor.extract_text(BytesIO(content))])
+        return extracted_text, time.perf_counter() - started
+
+
+def main(copies: int, pages_per_task: int) -> None:
+    content: bytes = build_document(copies)
+    pages: int = len(pdfium.PdfDocument(content))
+    print(f"document of {pages} pages, {len(content)} bytes, {os.cpu_count()} cores")  # noqa: T201
+
+    started = time.perf_counter()
+    expected_text: str = extract_sequentially(content)
+    sequential: float = time.perf_counter() - started
+    print(f"  sequential      {sequential:7.3f}s")  # noqa: T201
+
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        extracted_text, elapsed = asyncio.run(extract_in_pool(content, processes, pages_per_task))
+        if extracted_text != expected_text:
+            msg = f"Text extracted by {processes} processes differs from sequential extraction"
+            raise RuntimeError(msg)
+
+        print(f"  {processes:2d} processes    {elapsed:7.3f}s speedup={sequential / elapsed:5.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PAGES_PER_TASK,  # noqa: PLR2004
+    )
@@ -0,0 +1,113 @@
+"""
+Per-request setup overhead of question answering, before and after the
+retrieval chain became an APP-scoped singleton.
+
+"before" reproduces the old behaviour: every request builds new OpenAI chat and
+embedding clients (as the REQUEST-scoped providers did) and compiles the prompt,
+the stuff-documents chain and the retrieval chain before invoking it.
+"after" reuses one `LangChainQuestionAnsweringPort` built at startup.
+
+The chat model and the vector store are stubbed, so no network is involved and
+the numbers isolate construction cost.
+
+Run: python benchmarks/question_answering_setup.py [iterations]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Final, override
+
+from langchain_classic.chains.combine_documents import create_stuff_documents_chain
+from langchain_classic.chains.retrieval import create_retrieval_chain
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.infrastructure.adapters.question.langchain_question_answering_port import (
+    PROMPT_TO_LLM_RUSSIAN,
+    LangChainQuestionAnsweringPort,
+)
+
+DEFAULT_ITERATIONS: Final[int] = 300
+QUESTION: Final[Message] = Message("Как сбросить пароль?")
+
+
+class StubChatModel(FakeListChatModel):
+    @override
+    def get_num_tokens(self, text: str) -> int:
+        return len(text.split())
+
+
+def build_stub_vector_store() -> VectorStore:
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=64))
+    vector_store.add_texts([f"Раздел {i}: сброс пароля выполняется в настройках профиля." for i in range(32)])
+    return vector_store
+
+
+def build_stub_chat_model() -> StubChatModel:
+    return StubChatModel(responses=["Откройте настройки профиля и нажмите «Сбросить пароль»."])
+
+
+async def answer_rebuilding_everything(vector_store: VectorStore) -> None:
+    ChatOpenAI(model="gpt-4o-mini", api_key="sk-bench")  # type: ignore[arg-type]
+    OpenAIEmbeddings(model="text-embedding-3-large", api_key="sk-bench")  # type: ignore[arg-type]
+
+    model = build_stub_chat_model()
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", PROMPT_TO_LLM_RUSSIAN),
+            ("human", "{input}"),
+            ("human", "Контекст:\n{context}"),
+        ]
+    )
+    chain = create_retrieval_chain(
+        vector_store.as_retriever(similarity="similarity"),
+        create_stuff_documents_chain(model, prompt),
+    )
+    answer: dict[str, Any] = await chain.ainvoke({"input": QUESTION.value})
+    model.get_num_tokens(answer["answer"])
+
+
+async def measure(call: Callable[[], Awaitable[Any]], iterations: int) -> list[float]:
+    await call()
+    timings: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    print(  # noqa: T201
+        f"{name:<8} mean={statistics.fmean(timings):10.1f}us "
+        f"p50={statistics.median(timings):10.1f}us "
+        f"p95={statistics.quantiles(timings, n=20)[-1]:10.1f}us"
+    )
+
+
+async def main(iterations: int) -> None:
+    vector_store = build_stub_vector_store()
+    port = LangChainQuestionAnsweringPort(
+        large_learning_model=build_stub_chat_model(),
+        retriever=vector_store.as_retriever(similarity="similarity"),
+    )
+
+    before = await measure(lambda: answer_rebuilding_everything(vector_store), iterations)
+    after = await measure(lambda: port.answer_the_question(QUESTION), iterations)
+
+    report("before", before)
+    report("after", after)
+    print(  # noqa: T201
+        f"per-request setup overhead removed: {statistics.fmean(before) - statistics.fmean(after):.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS))
@@ -1,22 +1,27 @@
 import asyncio
 import logging
 from asyncio import Task
+from collections.abc import Coroutine
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, final
 
-from clever_faq.application.common.ports.document.document_storage import DocumentDTO, DocumentStorage
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
+from clever_faq.application.common.ports.document.document_storage import (
+    DocumentContentStream,
+    DocumentStorage,
+    DocumentUploadDTO,
+    StoredDocumentDTO,
+)
 from clever_faq.application.common.ports.document.file_processor_factory import convert_mime_type_to_type_of_file
 from clever_faq.application.common.ports.scheduler.payloads.documents import RetrievalAugmentedGenerationPayload
 from clever_faq.application.common.ports.scheduler.task_id import TaskID, TaskKey
 from clever_faq.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from clever_faq.application.common.views.document import CreateDocumentView
 from clever_faq.domain.document.ports.document_id_generator import DocumentIDGenerator
+from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_name import DocumentName
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
-    from clever_faq.domain.document.values.document_id import DocumentID
     from clever_faq.domain.document.values.document_type import DocumentType
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -25,7 +30,7 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class CreateDocumentCommand:
     name: str
-    content: bytes
+    content: DocumentContentStream
     mime_type: str
 
 
@@ -34,6 +39,7 @@ class CreateDocumentCommandHandler:
     """
     Async creation for document for RAG.
     Returns info about task id and id for document.
+    Uploading content that is already stored returns the existing document and its task.
     """
 
     def __init__(
@@ -41,10 +47,12 @@ class CreateDocumentCommandHandler:
         document_id_generator: DocumentIDGenerator,
         document_storage: DocumentStorage,
         scheduler: TaskScheduler,
+        document_content_index: DocumentContentIndex,
     ) -> None:
         self._document_storage: Final[DocumentStorage] = document_storage
         self._scheduler: Final[TaskScheduler] = scheduler
         self._document_id_generator: Final[DocumentIDGenerator] = document_id_generator
+        self._document_content_index: Final[DocumentContentIndex] = document_content_index
 
     async def __call__(self, data: CreateDocumentCommand) -> CreateDocumentView:
         logger.info("Starting add document %s", data.name)
@@ -58,7 +66,7 @@ class CreateDocumentCommandHandler:
         document_id: DocumentID = self._document_id_generator()
         logger.info("Generated document id %s", document_id)
 
-        document_dto_for_save_in_storage: DocumentDTO = DocumentDTO(
+        document_dto_for_save_in_storage: DocumentUploadDTO = DocumentUploadDTO(
             document_id=document_id,
             document_name=file_name,
             document_content=data.content,
@@ -66,25 +74,43 @@ class CreateDocumentCommandHandler:
         )
 
         logger.info("Started adding document with id: %s to storage", document_id)
-        await self._document_storage.add(
+        stored_document: StoredDocumentDTO = await self._document_storage.add(
             document=document_dto_for_save_in_storage,
         )
-        logger.info("Added document with id: %s to storage", document_id)
+        logger.info(
+            "Added document with id: %s to storage, size: %d, sha256: %s",
+            document_id,
+            stored_document.size,
+            stored_document.content_hash,
+        )
+
+        existing_document_id: DocumentID = await self._claim_content(stored_document.content_hash, document_id)
+
+        if existing_document_id != document_id:
+            logger.info("Document with id: %s has the same content as %s", document_id, existing_document_id)
+            await self._document_storage.delete(document_id)
+
+            return CreateDocumentView(
+                document_id=existing_document_id,
+                task_id=self._make_task_id(existing_document_id),
+            )
 
         logger.info("Started generating task id for RAG for document with id: %s", document_id)
-        task_id: TaskID = self._scheduler.make_task_id(
-            key=TaskKey("retrieval_augmented_generation_document"),
-            value=str(document_id),
-        )
+        task_id: TaskID = self._make_task_id(document_id)
         logger.info("Generated task id for processing: %s", task_id)
 
         background_tasks: set[Task[None]] = set()
 
-        coroutine: Coroutine[Any, Any, None] = self._scheduler.schedule(
-            task_id=task_id,
-            payload=RetrievalAugmentedGenerationPayload(
-                document_id=document_id,
+        coroutine: Coroutine[Any, Any, None] = self._release_on_failure(
+            self._scheduler.schedule(
+                task_id=task_id,
+                payload=RetrievalAugmentedGenerationPayload(
+                    document_id=document_id,
+                    content_hash=stored_document.content_hash,
+                ),
             ),
+            content_hash=stored_document.content_hash,
+            document_id=document_id,
         )
 
         task: Task[None] = asyncio.create_task(coroutine)
@@ -97,3 +123,37 @@ class CreateDocumentCommandHandler:
             document_id=document_id,
             task_id=task_id,
         )
+
+    async def _claim_content(self, content_hash: str, document_id: DocumentID) -> DocumentID:
+        """
+        Claims the content hash, taking it over from a holder whose document is no longer stored.
+        """
+        while True:
+            holder: DocumentID = await self._document_content_index.claim(
+                content_hash=content_hash,
+                document_id=document_id,
+            )
+            if holder == document_id or await self._document_storage.exists(holder):
+                return holder
+
+            logger.info("Document with id: %s holding content %s is gone, taking it over", holder, content_hash)
+            await self._document_content_index.release(content_hash=content_hash, document_id=holder)
+
+    async def _release_on_failure(
+        self,
+        scheduling: Coroutine[Any, Any, None],
+        content_hash: str,
+        document_id: DocumentID,
+    ) -> None:
+        try:
+            await scheduling
+        except Exception:
+            logger.exception("Failed to schedule retrieval augmentation for document with id: %s", document_id)
+            await self._document_content_index.release(content_hash=content_hash, document_id=document_id)
+            raise
+
+    def _make_task_id(self, document_id: DocumentID) -> TaskID:
+        return self._scheduler.make_task_id(
+            key=TaskKey("retrieval_augmented_generation_document"),
+            value=str(document_id),
+        )
@@ -1,13 +1,20 @@
 import logging
+from collections import deque
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Final, final
 from uuid import UUID
 
 from clever_faq.application.common.ports.document.document_command_gateway import DocumentCommandGateway
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
 from clever_faq.application.common.ports.document.document_storage import DocumentDTO, DocumentStorage
 from clever_faq.application.common.ports.document.file_processor_factory import FileProcessorFactory
+from clever_faq.application.common.ports.document.indexing_checkpoint_store import IndexingCheckpointStore
+from clever_faq.application.common.ports.document.lexical_index import LexicalIndex
+from clever_faq.application.common.ports.question.answer_cache_invalidator import AnswerCacheInvalidator
 from clever_faq.application.common.ports.transaction_manager import TransactionManager
 from clever_faq.application.errors.document import DocumentNotFoundError
+from clever_faq.domain.document.entities.chunk import Chunk
 from clever_faq.domain.document.services.document import DocumentService
 from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_text import DocumentText
@@ -22,6 +29,7 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RetrievalAugmentationForDocumentCommand:
     document_id: UUID
+    content_hash: str | None = None
 
 
 @final
@@ -33,18 +41,35 @@ class RetrievalAugmentationForDocumentCommandHandler:
         document_command_gateway: DocumentCommandGateway,
         transaction_manager: TransactionManager,
         document_storage: DocumentStorage,
+        answer_cache_invalidator: AnswerCacheInvalidator,
+        indexing_checkpoint_store: IndexingCheckpointStore,
+        lexical_index: LexicalIndex,
+        document_content_index: DocumentContentIndex,
     ) -> None:
         self._file_processor_factory: Final[FileProcessorFactory] = file_processor_factory
         self._document_service: Final[DocumentService] = document_service
         self._document_command_gateway: Final[DocumentCommandGateway] = document_command_gateway
         self._transaction_manager: Final[TransactionManager] = transaction_manager
         self._document_storage: Final[DocumentStorage] = document_storage
+        self._answer_cache_invalidator: Final[AnswerCacheInvalidator] = answer_cache_invalidator
+        self._indexing_checkpoint_store: Final[IndexingCheckpointStore] = indexing_checkpoint_store
+        self._lexical_index: Final[LexicalIndex] = lexical_index
+        self._document_content_index: Final[DocumentContentIndex] = document_content_index
 
     async def __call__(self, data: RetrievalAugmentationForDocumentCommand) -> None:
         logger.info("Starting retrieval augmentation for document with id %s", data.document_id)
 
         document_id: DocumentID = DocumentID(data.document_id)
 
+        try:
+            await self._index(document_id)
+        except Exception:
+            # new uploads of this content must not keep resolving to a document that never got indexed
+            if data.content_hash is not None:
+                await self._document_content_index.release(content_hash=data.content_hash, document_id=document_id)
+            raise
+
+    async def _index(self, document_id: DocumentID) -> None:
         document_dto: DocumentDTO | None = await self._document_storage.read_by_id(
             document_id=document_id,
         )
@@ -53,23 +78,61 @@ class RetrievalAugmentationForDocumentCommandHandler:
             msg = f"Document with id {document_id} not found"
             raise DocumentNotFoundError(msg)
 
-        file_processor: FileProcessor = self._file_processor_factory.create(document_dto.document_type)
-        logger.info("File processor is %s", file_processor)
-
-        raw_data_from_text: str = file_processor.extract_text(file_bytes=document_dto.document_content)
-
-        document_text: DocumentText = DocumentText(raw_data_from_text)
-
         new_document: Document = self._document_service.create_document(
             name=document_dto.document_name,
-            text=document_text,
             document_id=document_dto.document_id,
             doc_type=document_dto.document_type,
         )
 
-        logger.info("New document is %s", new_document.id)
-        await self._document_command_gateway.add(new_document)
+        # a retry resumes after the chunks the previous attempt stored, they are produced again but not stored
+        indexed_chunks: int = await self._indexing_checkpoint_store.read(new_document.id)
+        if indexed_chunks:
+            logger.info("Resuming indexing of document %s after %d chunks", new_document.id, indexed_chunks)
+
+        with document_dto.document_content as document_file:
+            file_processor: FileProcessor = self._file_processor_factory.create(document_dto.document_type)
+            logger.info("File processor is %s", file_processor)
+
+            texts: AsyncIterator[DocumentText] = (
+                DocumentText(text) async for text in file_processor.extract_text(file=document_file) if text.strip()
+            )
+            # chunks handed to the gateway wait here until it reports them stored, then go to the keyword index
+            unconfirmed_chunks: deque[Chunk] = deque()
+            chunks: AsyncIterator[Chunk] = _remember(
+                _skip(self._document_service.split_into_chunks(new_document, texts), indexed_chunks),
+                unconfirmed_chunks,
+            )
+
+            confirmed_chunks: int = 0
+            async for stored_chunks in self._document_command_gateway.add_chunks(new_document, chunks):
+                await self._lexical_index.add_chunks(
+                    [unconfirmed_chunks.popleft() for _ in range(stored_chunks - confirmed_chunks)]
+                )
+                confirmed_chunks = stored_chunks
+                await self._indexing_checkpoint_store.save(new_document.id, indexed_chunks + stored_chunks)
+
+        logger.info("New document %s is indexed", new_document.id)
         await self._transaction_manager.flush()
         await self._transaction_manager.commit()
 
+        await self._answer_cache_invalidator.invalidate_document(new_document.id)
+
+        await self._indexing_checkpoint_store.delete(new_document.id)
+
         logger.info("Finished retrieval augmentation for document with id %s", new_document.id)
+
+
+async def _skip(chunks: AsyncIterator[Chunk], count: int) -> AsyncIterator[Chunk]:
+    skipped: int = 0
+
+    async for chunk in chunks:
+        if skipped < count:
+            skipped += 1
+            continue
+        yield chunk
+
+
+async def _remember(chunks: AsyncIterator[Chunk], remembered: deque[Chunk]) -> AsyncIterator[Chunk]:
+    async for chunk in chunks:
+        remembered.append(chunk)
+        yield chunk
@@ -0,0 +1,82 @@
+import logging
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, final
+
+from clever_faq.application.common.ports.dialog.dialog_command_gateway import DialogCommandGateway
+from clever_faq.application.common.ports.question.question_answering_port import (
+    AnswerDeltaDTO,
+    MessageWithTokenDTO,
+    QuestionAnsweringPort,
+)
+from clever_faq.application.common.ports.transaction_manager import TransactionManager
+from clever_faq.application.common.views.questions import AnswerDeltaView, AnswerTheQuestionView
+from clever_faq.domain.dialog.services.dialog_service import DialogService
+from clever_faq.domain.dialog.values.message import Message
+
+if TYPE_CHECKING:
+    from clever_faq.domain.dialog.entities.dialog import Dialog
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StreamTheAnswerCommand:
+    question: str
+
+
+@final
+class StreamTheAnswerCommandHandler:
+    """
+    Answers the question, streaming parts of the answer as they are generated.
+    The dialog is saved once the answer is complete; the complete answer is the last item.
+    """
+
+    def __init__(
+        self,
+        question_answering_port: QuestionAnsweringPort,
+        dialog_service: DialogService,
+        dialog_gateway: DialogCommandGateway,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._question_answering_port: Final[QuestionAnsweringPort] = question_answering_port
+        self._dialog_service: Final[DialogService] = dialog_service
+        self._dialog_gateway: Final[DialogCommandGateway] = dialog_gateway
+        self._transaction_manager: Final[TransactionManager] = transaction_manager
+
+    async def __call__(
+        self, data: StreamTheAnswerCommand
+    ) -> AsyncGenerator[AnswerDeltaView | AnswerTheQuestionView, None]:
+        logger.info("Started streaming answer on question: %s", data.question)
+
+        validated_question: Message = Message(data.question)
+        logger.info("Question validated: %s", validated_question)
+
+        answer_on_question: MessageWithTokenDTO | None = None
+
+        async for item in self._question_answering_port.stream_the_answer(question=validated_question):
+            if isinstance(item, AnswerDeltaDTO):
+                yield AnswerDeltaView(text=item.text)
+            else:
+                answer_on_question = item
+
+        if answer_on_question is None:
+            msg = "Question answering port finished streaming without a complete answer"
+            raise RuntimeError(msg)
+
+        logger.info("Got answer %s on question: %s", answer_on_question, validated_question)
+
+        new_dialog: Dialog = self._dialog_service.create(
+            question=validated_question, answer=answer_on_question.message, tokens=answer_on_question.tokens
+        )
+
+        logger.info("Started saving dialog: %s", new_dialog)
+        await self._dialog_gateway.add(new_dialog)
+        await self._transaction_manager.flush()
+        await self._transaction_manager.commit()
+
+        logger.info("Finished streaming answer on question: %s", data.question)
+
+        yield AnswerTheQuestionView(
+            answer=answer_on_question.message.value,
+        )
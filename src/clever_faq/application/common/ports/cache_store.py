@@ -1,10 +1,17 @@
 from abc import abstractmethod
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Protocol
 
 
 class CacheStore(Protocol):
     @abstractmethod
-    async def set(self, name: str, value: bytes, ttl: int) -> None: ...
+    async def set(self, name: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        """
+        Save value.
+        :param tags: Tags to delete the value by, see ``delete_by_tags``
+        :return: Nothing
+        """
+        ...
 
     @abstractmethod
     async def get(
@@ -14,3 +21,34 @@ class CacheStore(Protocol):
 
     @abstractmethod
     async def delete(self, name: str) -> None: ...
+
+    @abstractmethod
+    async def set_many(self, values: Mapping[str, bytes], ttl: int, tags: Iterable[str] = ()) -> None: ...
+
+    @abstractmethod
+    async def get_many(self, names: Sequence[str]) -> list[bytes | None]:
+        """
+        Read several values at once.
+        :return: Values in the order of ``names``, ``None`` for missing ones
+        """
+        ...
+
+    @abstractmethod
+    async def get_many_with_ttl(self, names: Sequence[str]) -> list[tuple[bytes | None, float | None]]:
+        """
+        Read several values at once with the seconds they have left to live.
+        :return: Values and TTLs in the order of ``names``, ``None`` value for missing ones
+            and ``None`` TTL for values without expiration
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, names: Iterable[str]) -> None: ...
+
+    @abstractmethod
+    async def delete_by_tags(self, tags: Iterable[str]) -> frozenset[str]:
+        """
+        Delete all values saved with any of the tags.
+        :return: Names of deleted values
+        """
+        ...
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from typing import Protocol
 
+from clever_faq.domain.document.entities.chunk import Chunk
 from clever_faq.domain.document.entities.document import Document
 from clever_faq.domain.document.values.document_text import DocumentText
 
@@ -10,5 +11,15 @@ class DocumentCommandGateway(Protocol):
     @abstractmethod
     async def add(self, document: Document) -> None: ...
 
+    @abstractmethod
+    def add_chunks(self, document: Document, chunks: AsyncIterable[Chunk]) -> AsyncIterator[int]:
+        """
+        Stores chunks of the document as they arrive, so the first ones are searchable
+        before the rest are produced. Chunks are upserted: storing a chunk id again replaces it.
+
+        :return: After every stored batch, number of leading chunks stored so far
+        """
+        ...
+
     @abstractmethod
     async def search_similar_by_text(self, text: DocumentText, count_of_similar: int) -> Iterable[Document]: ...
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from clever_faq.domain.document.values.document_id import DocumentID
+
+
+class DocumentContentIndex(Protocol):
+    """
+    Maps a content hash to the document first stored with that content,
+    so identical uploads share one document.
+    """
+
+    @abstractmethod
+    async def claim(self, content_hash: str, document_id: DocumentID) -> DocumentID:
+        """
+        Registers the document under the hash unless another document already holds it.
+        :return: Document that holds the hash, ``document_id`` if it was registered now
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, content_hash: str, document_id: DocumentID) -> None:
+        """
+        Drops the hash only while ``document_id`` still holds it,
+        so a document that failed or is gone stops shadowing new uploads.
+        """
+        ...
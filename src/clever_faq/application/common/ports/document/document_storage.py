@@ -1,23 +1,63 @@
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Protocol
+from typing import IO, Protocol
 
 from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_name import DocumentName
 from clever_faq.domain.document.values.document_type import DocumentType
 
 
+class DocumentContentStream(Protocol):
+    async def read(self, size: int = -1) -> bytes:
+        """
+        :param size: Maximum number of bytes to read, ``-1`` reads until the end
+        :return: Next bytes of the document, empty bytes once it is exhausted
+        """
+        ...
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DocumentDTO:
+    """
+    Stored document with its content in a seekable file positioned at the start.
+    The reader owns the file and must close it.
+    """
+
+    document_id: DocumentID
+    document_name: DocumentName
+    document_type: DocumentType
+    document_content: IO[bytes]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DocumentUploadDTO:
     document_id: DocumentID
     document_name: DocumentName
     document_type: DocumentType
-    document_content: bytes
+    document_content: DocumentContentStream
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StoredDocumentDTO:
+    content_hash: str
+    size: int
 
 
 class DocumentStorage(Protocol):
     @abstractmethod
-    async def add(self, document: DocumentDTO) -> None: ...
+    async def add(self, document: DocumentUploadDTO) -> StoredDocumentDTO:
+        """
+        Streams the document content to the storage.
+
+        :return: SHA-256 hex digest and size of the stored content
+        """
+        ...
 
     @abstractmethod
     async def read_by_id(self, document_id: DocumentID) -> DocumentDTO | None: ...
+
+    @abstractmethod
+    async def exists(self, document_id: DocumentID) -> bool: ...
+
+    @abstractmethod
+    async def delete(self, document_id: DocumentID) -> None: ...
@@ -1,7 +1,16 @@
 from abc import abstractmethod
-from typing import Protocol
+from collections.abc import AsyncIterator
+from typing import IO, Protocol
 
 
 class FileProcessor(Protocol):
     @abstractmethod
-    def extract_text(self, file_bytes: bytes) -> str: ...
+    def extract_text(self, file: IO[bytes]) -> AsyncIterator[str]:
+        """
+        Yields the text in document order, part by part: a range of pages for PDF,
+        the whole text for formats that are parsed at once. Parts joined together
+        give the whole text.
+
+        :param file: Seekable binary file with the document content
+        """
+        ...
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from clever_faq.domain.document.values.document_id import DocumentID
+
+
+class IndexingCheckpointStore(Protocol):
+    """
+    Remembers how many chunks of a document are already indexed,
+    so a retried indexing resumes instead of starting over.
+    """
+
+    @abstractmethod
+    async def read(self, document_id: DocumentID) -> int:
+        """
+        :return: Number of leading chunks already indexed, zero when nothing is known
+        """
+        ...
+
+    @abstractmethod
+    async def save(self, document_id: DocumentID, indexed_chunks: int) -> None: ...
+
+    @abstractmethod
+    async def delete(self, document_id: DocumentID) -> None: ...
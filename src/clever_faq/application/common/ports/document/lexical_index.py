@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from typing import Protocol
+
+from clever_faq.domain.document.entities.chunk import Chunk
+
+
+class LexicalIndex(Protocol):
+    """
+    Keyword index over chunk texts, searched next to the vector store,
+    so exact terms like product names, error codes and API endpoints
+    are found even when their embeddings are not close to the question.
+    """
+
+    @abstractmethod
+    async def add_chunks(self, chunks: Iterable[Chunk]) -> None:
+        """
+        Indexes the chunks, indexing a chunk id again replaces its text.
+        """
+        ...
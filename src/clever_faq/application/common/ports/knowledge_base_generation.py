@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class KnowledgeBaseGeneration(Protocol):
+    """
+    Monotonic counter of knowledge base changes.
+    Anything derived from the knowledge base (e.g. cached answers)
+    is valid only for the generation it was built on.
+    """
+
+    @abstractmethod
+    async def current(self) -> int: ...
+
+    @abstractmethod
+    async def bump(self) -> int:
+        """
+        Move knowledge base to the next generation.
+        :return: New generation
+        """
+        ...
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from clever_faq.domain.document.values.document_id import DocumentID
+
+
+class AnswerCacheInvalidator(Protocol):
+    @abstractmethod
+    async def invalidate_document(self, document_id: DocumentID) -> None:
+        """
+        Drop cached answers that may change because the document was added,
+        replaced or deleted: answers built from this document and answers
+        for which no document was found.
+        :param document_id: Changed document
+        :return: Nothing
+        """
+        ...
+
+    @abstractmethod
+    async def invalidate_all(self) -> None: ...
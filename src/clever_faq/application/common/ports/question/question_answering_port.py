@@ -1,17 +1,35 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Protocol
 
 from clever_faq.domain.dialog.values.message import Message
 from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.domain.document.values.document_id import DocumentID
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class MessageWithTokenDTO:
     message: Message
     tokens: Tokens
+    source_document_ids: frozenset[DocumentID] = frozenset()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AnswerDeltaDTO:
+    text: str
 
 
 class QuestionAnsweringPort(Protocol):
     @abstractmethod
     async def answer_the_question(self, question: Message) -> MessageWithTokenDTO: ...
+
+    @abstractmethod
+    def stream_the_answer(self, question: Message) -> AsyncIterator[AnswerDeltaDTO | MessageWithTokenDTO]:
+        """
+        Streams the answer while it is being generated.
+
+        :return: Answer deltas, then the complete answer as the last item.
+          Deltas are a preview; the complete answer is the one to persist.
+        """
+        ...
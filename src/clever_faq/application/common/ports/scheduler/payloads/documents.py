@@ -7,3 +7,4 @@ from clever_faq.domain.document.values.document_id import DocumentID
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RetrievalAugmentedGenerationPayload(TaskPayload):
     document_id: DocumentID
+    content_hash: str | None = None
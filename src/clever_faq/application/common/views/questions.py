@@ -4,3 +4,8 @@ from dataclasses import dataclass
 @dataclass(frozen=True, slots=True, kw_only=True)
 class AnswerTheQuestionView:
     answer: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AnswerDeltaView:
+    text: str
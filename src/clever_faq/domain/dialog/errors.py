@@ -2,3 +2,6 @@ from clever_faq.domain.common.errors import DomainFieldError
 
 
 class BadMessageError(DomainFieldError): ...
+
+
+class BadTokensError(DomainFieldError): ...
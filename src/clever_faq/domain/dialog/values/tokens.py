@@ -2,15 +2,34 @@ from dataclasses import dataclass
 from typing import override
 
 from clever_faq.domain.common.values.base import BaseValueObject
+from clever_faq.domain.dialog.errors import BadTokensError
 
 
 @dataclass(frozen=True, eq=True, unsafe_hash=True)
 class Tokens(BaseValueObject):
-    value: int
+    """
+    Tokens spent on one answer, as reported by the model API.
+    ``cached_prompt`` is the part of ``prompt`` read from the provider's prompt cache.
+    """
+
+    prompt: int
+    completion: int
+    cached_prompt: int = 0
 
     @override
-    def _validate(self) -> None: ...
+    def _validate(self) -> None:
+        if min(self.prompt, self.completion, self.cached_prompt) < 0:
+            msg = "Token counts cannot be negative"
+            raise BadTokensError(msg)
+
+        if self.cached_prompt > self.prompt:
+            msg = "Cached prompt tokens cannot exceed prompt tokens"
+            raise BadTokensError(msg)
+
+    @property
+    def total(self) -> int:
+        return self.prompt + self.completion
 
     @override
     def __str__(self) -> str:
-        return str(self.value)
+        return f"prompt={self.prompt}, completion={self.completion}, cached_prompt={self.cached_prompt}"
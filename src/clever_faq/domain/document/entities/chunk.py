@@ -7,4 +7,9 @@ from clever_faq.domain.document.values.document_text import DocumentText
 
 @dataclass(eq=False, kw_only=True)
 class Chunk(BaseEntity[ChunkID]):
+    """
+    ``embedding`` is set when the splitter already computed a vector for the text.
+    """
+
     text: DocumentText
+    embedding: tuple[float, ...] | None = None
@@ -2,8 +2,16 @@ from abc import abstractmethod
 from typing import Protocol
 
 from clever_faq.domain.document.values.chunk_id import ChunkID
+from clever_faq.domain.document.values.document_id import DocumentID
 
 
 class ChunkIDGenerator(Protocol):
     @abstractmethod
-    def __call__(self) -> ChunkID: ...
+    def __call__(self, document_id: DocumentID, ordinal: int) -> ChunkID:
+        """
+        Must return the same id for the same arguments, so indexing the document
+        again overwrites its chunks instead of duplicating them.
+
+        :param ordinal: Position of the chunk in the document, starting from zero
+        """
+        ...
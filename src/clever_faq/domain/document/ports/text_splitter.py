@@ -1,10 +1,18 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Protocol
 
 from clever_faq.domain.document.entities.chunk import Chunk
+from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_text import DocumentText
 
 
 class TextSplitter(Protocol):
     @abstractmethod
-    def split_text(self, text: DocumentText) -> list[Chunk]: ...
+    def split_text(self, document_id: DocumentID, texts: AsyncIterable[DocumentText]) -> AsyncIterator[Chunk]:
+        """
+        Splitting the same text again gives the same chunks with the same ids.
+
+        :param texts: Consecutive parts of one document, chunks may span several parts
+        """
+        ...
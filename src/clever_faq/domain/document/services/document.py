@@ -1,8 +1,10 @@
 import logging
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Final, overload
+from typing import Final, overload
 
 from clever_faq.domain.common.services.base import DomainService
+from clever_faq.domain.document.entities.chunk import Chunk
 from clever_faq.domain.document.entities.document import Document
 from clever_faq.domain.document.events import DocumentNameChangedEvent
 from clever_faq.domain.document.ports.document_id_generator import DocumentIDGenerator
@@ -12,9 +14,6 @@ from clever_faq.domain.document.values.document_name import DocumentName
 from clever_faq.domain.document.values.document_text import DocumentText
 from clever_faq.domain.document.values.document_type import DocumentType
 
-if TYPE_CHECKING:
-    from clever_faq.domain.document.entities.chunk import Chunk
-
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
@@ -32,38 +31,41 @@ class DocumentService(DomainService):
     def create_document(
         self,
         name: DocumentName,
-        text: DocumentText,
         doc_type: DocumentType,
     ) -> Document: ...
 
     @overload
-    def create_document(
-        self, name: DocumentName, text: DocumentText, doc_type: DocumentType, document_id: DocumentID
-    ) -> Document: ...
+    def create_document(self, name: DocumentName, doc_type: DocumentType, document_id: DocumentID) -> Document: ...
 
     def create_document(
         self,
         name: DocumentName,
-        text: DocumentText,
         doc_type: DocumentType,
         document_id: DocumentID | None = None,
     ) -> Document:
+        """
+        Creates a document without chunks, they are produced from its text by ``split_into_chunks``.
+        """
         logger.info("Started creating document....")
 
         if document_id is None:
             document_id = self._document_id_generator()
 
-        chunks: list[Chunk] = self._text_splitter.split_text(text)
-
         document: Document = Document(
             id=document_id,
             name=name,
-            chunks=chunks,
+            chunks=[],
             type=doc_type,
         )
 
         return document
 
+    def split_into_chunks(self, document: Document, texts: AsyncIterable[DocumentText]) -> AsyncIterator[Chunk]:
+        """
+        :param texts: Consecutive parts of the document text
+        """
+        return self._text_splitter.split_text(document.id, texts)
+
     def change_document_name(self, document: Document, new_name: DocumentName) -> None:
         document.name = new_name
         document.updated_at = datetime.now(UTC)
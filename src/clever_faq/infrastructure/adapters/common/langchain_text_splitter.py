@@ -1,52 +1,214 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Final, override
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from itertools import pairwise
+from typing import Final, cast, override
 
+import numpy as np
 from langchain_core.embeddings import Embeddings
-from langchain_experimental.text_splitter import SemanticChunker
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from numpy.typing import NDArray
 
 from clever_faq.domain.document.entities.chunk import Chunk
 from clever_faq.domain.document.ports.chunk_id_generator import ChunkIDGenerator
 from clever_faq.domain.document.ports.text_splitter import TextSplitter
+from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_text import DocumentText
-
-if TYPE_CHECKING:
-    from langchain_core.documents import Document as LangchainDocument
+from clever_faq.setup.config.openai import OpenAISettings
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 MAX_CHUNK_LENGTH: Final[int] = 512
+MAX_SENTENCE_LENGTH: Final[int] = 1000
+
+_SENTENCE_END_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?<=[.?!])\s+|\n\s*\n")
+_BREAKPOINT_PERCENTILE: Final[float] = 95.0
 
 
 class SemanticTextSplitter(TextSplitter):
-    def __init__(self, embeddings: Embeddings, chunk_id_generator: ChunkIDGenerator) -> None:
-        self._semantic_splitter: Final[SemanticChunker] = SemanticChunker(
-            embeddings, breakpoint_threshold_type="gradient"
-        )
-        self._pre_splitter: Final[RecursiveCharacterTextSplitter] = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=100,
+    """
+    Splits text between sentences where the meaning shifts, the way LangChain's
+    ``SemanticChunker`` does with the gradient threshold.
+
+    Parts of the document are split into sentences as they arrive. Once a window of
+    ``embeddings.chunk_size * embeddings.max_concurrency`` new sentences is collected,
+    they are embedded in batches of ``embeddings.chunk_size`` with all the batches in flight,
+    and breakpoints are found over the distances of the window. Chunks before the last breakpoint
+    are yielded; the sentences after it are carried into the next window with their embeddings,
+    as the chunk may continue there. Memory is bounded by the window, not by the document.
+
+    Sentence embeddings are kept: each chunk gets the normalized sum of the embeddings
+    of its sentences, so the vector store does not embed the chunks a second time.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        chunk_id_generator: ChunkIDGenerator,
+        openai_config: OpenAISettings,
+    ) -> None:
+        self._embeddings: Final[Embeddings] = embeddings
+        self._sentence_splitter: Final[RecursiveCharacterTextSplitter] = RecursiveCharacterTextSplitter(
+            chunk_size=MAX_SENTENCE_LENGTH,
+            chunk_overlap=0,
             length_function=len,
         )
         self._chunk_id_generator: Final[ChunkIDGenerator] = chunk_id_generator
+        self._batch_size: Final[int] = openai_config.embeddings.chunk_size
+        self._max_concurrency: Final[int] = openai_config.embeddings.max_concurrency
+        self._window_size: Final[int] = self._batch_size * self._max_concurrency
 
     @override
-    def split_text(self, text: DocumentText) -> list[Chunk]:
-        pre_documents: list[LangchainDocument] = self._pre_splitter.create_documents([text.value])
+    async def split_text(self, document_id: DocumentID, texts: AsyncIterable[DocumentText]) -> AsyncIterator[Chunk]:
+        chunks_count: int = 0
+        sentences: list[str] = []
+        sentence_vectors: NDArray[np.float32] = np.empty((0, 0), dtype=np.float32)
+        # text after the last sentence end of the part, the sentence may continue in the next part
+        tail: str = ""
+
+        async for text in texts:
+            *complete_sentences, tail = _SENTENCE_END_PATTERN.split(tail + text.value)
+            if len(tail) > MAX_SENTENCE_LENGTH:
+                complete_sentences.append(tail)
+                tail = ""
+            sentences.extend(self._clean_sentences(complete_sentences))
+
+            if len(sentences) - sentence_vectors.shape[0] < self._window_size:
+                continue
+
+            chunks, sentences, sentence_vectors = await self._split_window(
+                document_id, chunks_count, sentences, sentence_vectors, is_last=False
+            )
+            chunks_count += len(chunks)
+            for chunk in chunks:
+                yield chunk
+
+        sentences.extend(self._clean_sentences([tail]))
+        if sentences:
+            chunks, _, _ = await self._split_window(
+                document_id, chunks_count, sentences, sentence_vectors, is_last=True
+            )
+            for chunk in chunks:
+                yield chunk
+
+    async def _split_window(
+        self,
+        document_id: DocumentID,
+        first_ordinal: int,
+        sentences: list[str],
+        sentence_vectors: NDArray[np.float32],
+        *,
+        is_last: bool,
+    ) -> tuple[list[Chunk], list[str], NDArray[np.float32]]:
+        """
+        :param first_ordinal: Number of chunks of the document yielded before this window
+        :param sentence_vectors: Embeddings of the sentences carried from the previous window
+        :return: Chunks of the window, sentences carried into the next window and their embeddings
+        """
+        embedded_count: int = sentence_vectors.shape[0]
+
+        if embedded_count < len(sentences):
+            # every sentence is embedded together with its neighbours to smooth out short sentences
+            combined_sentences: list[str] = [
+                " ".join(sentences[max(index - 1, 0) : index + 2]) for index in range(embedded_count, len(sentences))
+            ]
+            new_vectors: NDArray[np.float32] = await self._embed(combined_sentences)
+            sentence_vectors = np.concatenate((sentence_vectors, new_vectors)) if embedded_count else new_vectors
+
+        groups: list[slice] = _group_by_breakpoints(sentence_vectors)
+        carried: slice = groups.pop() if not is_last and len(groups) > 1 else slice(len(sentences), len(sentences))
+
+        chunks: list[Chunk] = [
+            Chunk(
+                text=DocumentText(chunk_text),
+                id=self._chunk_id_generator(document_id, ordinal),
+                embedding=tuple(vector.tolist()),
+            )
+            for ordinal, (chunk_text, vector) in enumerate(
+                (piece for group in groups for piece in _limit_length(sentences[group], sentence_vectors[group])),
+                start=first_ordinal,
+            )
+        ]
+
+        logger.debug("Split window of %d sentences into %d chunks", len(sentences), len(chunks))
+
+        return chunks, sentences[carried], sentence_vectors[carried]
+
+    def _clean_sentences(self, sentences: Iterable[str]) -> list[str]:
+        cleaned_sentences: list[str] = []
+
+        for sentence in sentences:
+            if not sentence.strip():
+                continue
+            if len(sentence) > MAX_SENTENCE_LENGTH:
+                cleaned_sentences.extend(self._sentence_splitter.split_text(sentence))
+            else:
+                cleaned_sentences.append(sentence.strip())
+
+        return cleaned_sentences
+
+    async def _embed(self, texts: list[str]) -> NDArray[np.float32]:
+        batches: list[list[str]] = [
+            texts[start : start + self._batch_size] for start in range(0, len(texts), self._batch_size)
+        ]
+        logger.debug("Embedding %d sentences in %d batches", len(texts), len(batches))
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embeddings.aembed_documents(batch)
+
+        embedded_batches: list[list[list[float]]] = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+        return _normalize_rows(np.asarray([vector for batch in embedded_batches for vector in batch], dtype=np.float32))
+
+
+def _group_by_breakpoints(sentence_vectors: NDArray[np.float32]) -> list[slice]:
+    sentences_count: int = sentence_vectors.shape[0]
+
+    # the gradient needs at least two distances, with fewer sentences each one is a chunk
+    if sentences_count < 3:  # noqa: PLR2004
+        return [slice(index, index + 1) for index in range(sentences_count)]
+
+    distances: NDArray[np.float32] = 1.0 - np.einsum("ij,ij->i", sentence_vectors[:-1], sentence_vectors[1:])
+    gradient: NDArray[np.float32] = cast("NDArray[np.float32]", np.gradient(distances))
+    breakpoints: NDArray[np.intp] = np.flatnonzero(gradient > np.percentile(gradient, _BREAKPOINT_PERCENTILE))
+
+    bounds: list[int] = [0, *(breakpoints + 1).tolist(), sentences_count]
+    return [slice(start, end) for start, end in pairwise(bounds)]
+
+
+def _limit_length(
+    sentences: list[str],
+    sentence_vectors: NDArray[np.float32],
+) -> list[tuple[str, NDArray[np.float32]]]:
+    """
+    Cuts a group of sentences into chunks of at most ``MAX_CHUNK_LENGTH``
+    at sentence boundaries. A longer sentence stays a chunk on its own.
+    """
+    pieces: list[tuple[str, NDArray[np.float32]]] = []
+    start: int = 0
+    length: int = 0
+
+    for index, sentence in enumerate(sentences):
+        if length and length + 1 + len(sentence) > MAX_CHUNK_LENGTH:
+            pieces.append((" ".join(sentences[start:index]), _pool(sentence_vectors[start:index])))
+            start, length = index, 0
+
+        length += len(sentence) + (1 if length else 0)
+
+    pieces.append((" ".join(sentences[start:]), _pool(sentence_vectors[start:])))
+
+    return pieces
 
-        final_chunks: list[Chunk] = []
-        for doc in pre_documents:
-            semantic_docs = self._semantic_splitter.create_documents([doc.page_content])
 
-            for chunk in semantic_docs:
-                if len(chunk.page_content) > MAX_CHUNK_LENGTH:
-                    sub_chunks = self._pre_splitter.split_text(chunk.page_content)
-                    final_chunks.extend(
-                        [Chunk(text=DocumentText(c), id=self._chunk_id_generator()) for c in sub_chunks]
-                    )
-                else:
-                    final_chunks.append(Chunk(text=DocumentText(chunk.page_content), id=self._chunk_id_generator()))
+def _normalize_rows(vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    norms: NDArray[np.float32] = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.where(norms == 0.0, 1.0, norms)).astype(np.float32, copy=False)
 
-        logger.debug("Split text into %d chunks", len(final_chunks))
 
-        return final_chunks
+def _pool(sentence_vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    pooled: NDArray[np.float32] = _normalize_rows(sentence_vectors.sum(axis=0, keepdims=True))[0]
+    return pooled
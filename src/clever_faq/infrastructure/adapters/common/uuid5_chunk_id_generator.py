@@ -0,0 +1,12 @@
+import uuid
+from typing import cast, override
+
+from clever_faq.domain.document.ports.chunk_id_generator import ChunkIDGenerator
+from clever_faq.domain.document.values.chunk_id import ChunkID
+from clever_faq.domain.document.values.document_id import DocumentID
+
+
+class UUID5ChunkIDGenerator(ChunkIDGenerator):
+    @override
+    def __call__(self, document_id: DocumentID, ordinal: int) -> ChunkID:
+        return cast("ChunkID", uuid.uuid5(document_id, str(ordinal)))
@@ -1,21 +1,21 @@
-import io
 import logging
 from typing import Final, override
 
 from docx import Document
 
-from clever_faq.application.common.ports.document.file_processor import FileProcessor
+from clever_faq.infrastructure.adapters.file.process_pool import ProcessPoolFileProcessor
 from clever_faq.infrastructure.errors.file import CantReadFileError
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
-class DocxFileProcessor(FileProcessor):
+class DocxFileProcessor(ProcessPoolFileProcessor):
+    @staticmethod
     @override
-    def extract_text(self, file_bytes: bytes) -> str:
+    def _extract(path: str) -> str:
         logger.info("Started extracting text from Docx file")
         try:
-            doc: Document = Document(io.BytesIO(file_bytes))
+            doc: Document = Document(path)
             extracted_text: str = "\n".join(para.text for para in doc.paragraphs)
         except ValueError as e:
             logger.exception("Error processing docx file")
@@ -1,23 +1,22 @@
 import logging
-from io import BytesIO
 from typing import Final, override
 
 from odf import teletype, text
 from odf.opendocument import OpenDocument, load
 
-from clever_faq.application.common.ports.document.file_processor import FileProcessor
+from clever_faq.infrastructure.adapters.file.process_pool import ProcessPoolFileProcessor
 from clever_faq.infrastructure.errors.file import CantReadFileError
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
-class OdtFileProcessor(FileProcessor):
+class OdtFileProcessor(ProcessPoolFileProcessor):
+    @staticmethod
     @override
-    def extract_text(self, file_bytes: bytes) -> str:
+    def _extract(path: str) -> str:
         logger.info("Started processing odt file")
         try:
-            byte_stream: BytesIO = BytesIO(file_bytes)
-            doc: OpenDocument = load(byte_stream)
+            doc: OpenDocument = load(path)
             extracted_text: str = "\n".join(
                 teletype.extractText(paragraph) for paragraph in doc.getElementsByType(text.P)
             )
@@ -1,26 +1,92 @@
-import io
+import asyncio
 import logging
-from typing import Final, override
+import tempfile
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from typing import IO, Final, override
 
 import pdfplumber
 from pdfplumber.utils.exceptions import PdfminerException
 
 from clever_faq.application.common.ports.document.file_processor import FileProcessor
+from clever_faq.infrastructure.adapters.file.process_pool import copy_to_file
 from clever_faq.infrastructure.errors.file import CantReadFileError
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
 class PdfFileProcessor(FileProcessor):
+    """
+    Extracts text page by page, with ranges of ``pages_per_task`` pages
+    parsed in parallel by the process pool and yielded in page order.
+    At most ``max_ranges_in_flight`` ranges are parsed or waiting to be
+    consumed at once, so a large document is never held in memory whole.
+
+    The document is copied to a temporary file once, so every worker
+    opens it from disk instead of receiving the whole content.
+    """
+
+    def __init__(self, executor: Executor, pages_per_task: int, max_ranges_in_flight: int) -> None:
+        self._executor: Final[Executor] = executor
+        self._pages_per_task: Final[int] = pages_per_task
+        self._max_ranges_in_flight: Final[int] = max_ranges_in_flight
+
     @override
-    def extract_text(self, file_bytes: bytes) -> str:
-        try:
-            logger.info("Started processing pdf file")
-            with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-                extracted_text: str = "\n".join(page.extract_text() for page in pdf.pages)
-                logger.info("Finished processing pdf file")
-                return extracted_text
-        except PdfminerException as e:
-            logger.exception("Failed to process pdf file")
-            msg = "Failed to process pdf file"
-            raise CantReadFileError(msg) from e
+    async def extract_text(self, file: IO[bytes]) -> AsyncIterator[str]:
+        logger.info("Started processing pdf file")
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete_on_close=False) as pdf_file:
+            await asyncio.to_thread(copy_to_file, file, pdf_file)
+
+            pages_count: int = await loop.run_in_executor(self._executor, _count_pages, pdf_file.name)
+            page_ranges: deque[asyncio.Future[list[str]]] = deque()
+
+            try:
+                for start in range(0, pages_count, self._pages_per_task):
+                    page_ranges.append(
+                        loop.run_in_executor(
+                            self._executor,
+                            _extract_pages,
+                            pdf_file.name,
+                            start,
+                            min(start + self._pages_per_task, pages_count),
+                        )
+                    )
+                    if len(page_ranges) >= self._max_ranges_in_flight:
+                        yield _join_pages(await page_ranges.popleft())
+
+                while page_ranges:
+                    yield _join_pages(await page_ranges.popleft())
+            finally:
+                for page_range in page_ranges:
+                    page_range.cancel()
+
+        logger.info("Finished processing pdf file of %d pages", pages_count)
+
+
+def _join_pages(pages: list[str]) -> str:
+    # every range ends with a page break, so ranges joined together give the whole text
+    return "".join(page_text + "\n" for page_text in pages)
+
+
+def _count_pages(path: str) -> int:
+    try:
+        with pdfplumber.open(path) as pdf:
+            return len(pdf.pages)
+    except PdfminerException as e:
+        logger.exception("Failed to process pdf file")
+        msg = "Failed to process pdf file"
+        raise CantReadFileError(msg) from e
+
+
+def _extract_pages(path: str, start: int, stop: int) -> list[str]:
+    try:
+        with pdfplumber.open(path, pages=list(range(start + 1, stop + 1))) as pdf:
+            # pages without a text layer, e.g. scans, have no text
+            return [page.extract_text() or "" for page in pdf.pages]
+    except PdfminerException as e:
+        logger.exception("Failed to process pages %d-%d of pdf file", start + 1, stop)
+        msg = "Failed to process pdf file"
+        raise CantReadFileError(msg) from e
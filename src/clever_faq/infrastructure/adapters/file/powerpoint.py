@@ -1,21 +1,21 @@
 import logging
 from collections import deque
-from io import BytesIO
 from typing import Final, override
 
 from pptx import Presentation
 
-from clever_faq.application.common.ports.document.file_processor import FileProcessor
+from clever_faq.infrastructure.adapters.file.process_pool import ProcessPoolFileProcessor
 from clever_faq.infrastructure.errors.file import CantReadFileError
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
-class PptxFileProcessor(FileProcessor):
+class PptxFileProcessor(ProcessPoolFileProcessor):
+    @staticmethod
     @override
-    def extract_text(self, file_bytes: bytes) -> str:
+    def _extract(path: str) -> str:
         try:
-            presentation: Presentation = Presentation(BytesIO(file_bytes))
+            presentation: Presentation = Presentation(path)
             text_content: deque[str] = deque()
 
             # Обработка каждого слайда
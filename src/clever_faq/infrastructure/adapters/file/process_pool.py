@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import shutil
+import tempfile
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from typing import IO, Final, override
+
+from clever_faq.application.common.ports.document.file_processor import FileProcessor
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class ProcessPoolFileProcessor(FileProcessor):
+    """
+    Base for processors whose parsing is CPU-bound.
+
+    The content is copied to a temporary file off the event loop and parsed by ``_extract``
+    in a worker process, so the worker keeps heartbeating and serving other tasks meanwhile.
+    Only the path of the file crosses the process boundary, the content is never held
+    in memory by the worker. ``_extract`` must be a static method: it is pickled and sent to the pool.
+    The text is yielded as one part.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor: Final[Executor] = executor
+
+    @override
+    async def extract_text(self, file: IO[bytes]) -> AsyncIterator[str]:
+        with tempfile.NamedTemporaryFile(delete_on_close=False) as spooled_file:
+            await asyncio.to_thread(copy_to_file, file, spooled_file)
+            logger.debug("Sending %s to %s", spooled_file.name, type(self).__name__)
+            yield await asyncio.get_running_loop().run_in_executor(self._executor, self._extract, spooled_file.name)
+
+    @staticmethod
+    @abstractmethod
+    def _extract(path: str) -> str: ...
+
+
+def copy_to_file(source: IO[bytes], destination: IO[bytes]) -> None:
+    shutil.copyfileobj(source, destination)
+    destination.flush()
@@ -1,3 +1,9 @@
+import logging
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Final
+
 from clever_faq.application.common.ports.document.file_processor_factory import FileProcessorFactory
 from clever_faq.domain.document.values.document_type import DocumentType
 from clever_faq.infrastructure.adapters.file.docx import DocxFileProcessor
@@ -5,15 +11,38 @@ from clever_faq.infrastructure.adapters.file.odt import OdtFileProcessor
 from clever_faq.infrastructure.adapters.file.pdf import PdfFileProcessor
 from clever_faq.infrastructure.adapters.file.powerpoint import PptxFileProcessor
 from clever_faq.infrastructure.adapters.file.text import TextFileProcessor
+from clever_faq.setup.config.worker import TaskIQWorkerConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+def get_extraction_process_pool(worker_config: TaskIQWorkerConfig) -> Iterator[ProcessPoolExecutor]:
+    # spawn: forking a process that already runs threads may copy locks held by them
+    executor: ProcessPoolExecutor = ProcessPoolExecutor(
+        max_workers=worker_config.extraction_processes,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    logger.info("Started text extraction pool with %d processes", worker_config.extraction_processes)
+    yield executor
+    executor.shutdown(cancel_futures=True)
+    logger.info("Text extraction pool is shut down")
 
 
-def get_file_processor_factory() -> FileProcessorFactory:
+def get_file_processor_factory(
+    executor: ProcessPoolExecutor,
+    worker_config: TaskIQWorkerConfig,
+) -> FileProcessorFactory:
     return FileProcessorFactory(
         processors_mapping={
             DocumentType.TXT: TextFileProcessor(),
-            DocumentType.PDF: PdfFileProcessor(),
-            DocumentType.DOCX: DocxFileProcessor(),
-            DocumentType.ODT: OdtFileProcessor(),
-            DocumentType.PPTX: PptxFileProcessor(),
+            DocumentType.PDF: PdfFileProcessor(
+                executor,
+                pages_per_task=worker_config.pdf_pages_per_task,
+                # keeps every process busy while the finished ranges are chunked
+                max_ranges_in_flight=2 * worker_config.extraction_processes,
+            ),
+            DocumentType.DOCX: DocxFileProcessor(executor),
+            DocumentType.ODT: OdtFileProcessor(executor),
+            DocumentType.PPTX: PptxFileProcessor(executor),
         }
     )
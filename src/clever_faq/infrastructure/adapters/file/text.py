@@ -1,14 +1,24 @@
-from typing import override
+import asyncio
+import codecs
+from collections.abc import AsyncIterator
+from typing import IO, Final, override
 
 from clever_faq.application.common.ports.document.file_processor import FileProcessor
 from clever_faq.infrastructure.errors.file import CantReadFileError
 
+TEXT_READ_SIZE_BYTES: Final[int] = 1024 * 1024
+
 
 class TextFileProcessor(FileProcessor):
     @override
-    def extract_text(self, file_bytes: bytes) -> str:
+    async def extract_text(self, file: IO[bytes]) -> AsyncIterator[str]:
+        # incremental, so a character split between two reads is still decoded
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")()
+
         try:
-            return file_bytes.decode("utf-8")
+            while content := await asyncio.to_thread(file.read, TEXT_READ_SIZE_BYTES):
+                yield decoder.decode(content)
+            yield decoder.decode(b"", final=True)
         except UnicodeDecodeError as err:
             msg = "Can't decode binary text to utf-8"
             raise CantReadFileError(msg) from err
@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import math
+import re
+import time
+from array import array
+from collections import Counter
+from collections.abc import Awaitable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final, cast, override
+
+import numpy as np
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from clever_faq.application.common.ports.document.lexical_index import LexicalIndex
+from clever_faq.domain.document.entities.chunk import Chunk
+from clever_faq.infrastructure.errors.cache import CacheError
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+(?:[-./:]\w+)*")
+_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
+_MAX_TERM_FREQUENCY: Final[int] = 2**16 - 1
+_COMPACTION_MIN_REPLACED: Final[int] = 1024
+_SYNC_BATCH_SIZE: Final[int] = 500
+_SYNC_CLOCK_SKEW_SECONDS: Final[float] = 5.0
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """
+    Lowercased words. Words joined with ``-./:`` like ``E-1023`` or ``api/v1/tasks``
+    are also yielded whole, so a code or an endpoint is matched as one rare term.
+    """
+    for match in _TOKEN_PATTERN.finditer(text.casefold()):
+        token: str = match.group()
+        yield token
+        if _WORD_PATTERN.fullmatch(token) is None:
+            yield from _WORD_PATTERN.findall(token)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LexicalHit:
+    chunk_id: str
+    score: float
+
+
+@dataclass(slots=True)
+class _Postings:
+    """
+    Slots of the chunks containing a term and the term frequency in each of them,
+    six bytes per chunk.
+    """
+
+    slots: array[int] = field(default_factory=lambda: array("I"))
+    frequencies: array[int] = field(default_factory=lambda: array("H"))
+
+
+class RedisBM25Index(LexicalIndex):
+    """
+    BM25 index over chunk texts.
+
+    Search runs in process over postings kept in flat typed arrays, scored with NumPy.
+    Chunks are addressed by slots, positions in ``_chunk_ids`` and ``_lengths``.
+    A replaced chunk gets a new slot and its old one is zeroed in ``_lengths``;
+    once most slots are stale, postings are compacted.
+
+    Redis keeps the persistent copy shared by all processes:
+
+    - ``{namespace}:chunks`` - sorted set, chunk id scored by the time it was indexed;
+    - ``{namespace}:texts`` - hash, chunk id to chunk text.
+
+    ``add_chunks`` only writes to Redis, it runs in the worker that never searches.
+    Every ``sync_interval_seconds`` the local copy pulls chunks indexed since the
+    previous sync, so chunks indexed by the worker become searchable in the web app.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        namespace: str,
+        k1: float,
+        b: float,
+        sync_interval_seconds: float,
+    ) -> None:
+        self._redis_client: Final[Redis] = redis_client
+        self._chunks_key: Final[str] = f"{namespace}:chunks"
+        self._texts_key: Final[str] = f"{namespace}:texts"
+        self._k1: Final[float] = k1
+        self._b: Final[float] = b
+        self._sync_interval_seconds: Final[float] = sync_interval_seconds
+
+        self._terms: Final[dict[str, int]] = {}
+        self._postings: Final[list[_Postings]] = []
+        self._chunk_ids: list[str] = []
+        self._slots: dict[str, int] = {}
+        self._lengths: array[int] = array("I")
+        self._total_length: int = 0
+
+        self._sync_lock: Final[asyncio.Lock] = asyncio.Lock()
+        self._last_synced_score: float | None = None
+        self._last_synced_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @override
+    async def add_chunks(self, chunks: Iterable[Chunk]) -> None:
+        texts: dict[str, str] = {str(chunk.id): chunk.text.value for chunk in chunks}
+        if not texts:
+            return
+
+        indexed_at: float = time.time()
+
+        try:
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(self._texts_key, mapping=texts)
+                pipe.zadd(self._chunks_key, dict.fromkeys(texts, indexed_at))
+                await pipe.execute()
+        except RedisError as e:
+            msg = "Failed to add chunks to keyword index"
+            raise CacheError(msg) from e
+
+    async def search(self, query: str, limit: int) -> list[LexicalHit]:
+        """
+        :return: Up to ``limit`` chunks sharing terms with the query, best first
+        """
+        await self._sync_if_due()
+        return self.search_local(query, limit)
+
+    def search_local(self, query: str, limit: int) -> list[LexicalHit]:
+        """
+        Search without pulling chunks indexed by other processes since the last sync,
+        for callers that can't await.
+        """
+        if not self._slots or limit < 1:
+            return []
+
+        lengths: NDArray[np.float32] = np.frombuffer(self._lengths, dtype=np.uint32).astype(np.float32)
+        live: NDArray[np.bool_] = lengths > 0
+        chunks_count: int = len(self._slots)
+        length_norms: NDArray[np.float32] = self._k1 * (
+            1.0 - self._b + self._b * lengths * (chunks_count / self._total_length)
+        )
+        scores: NDArray[np.float32] = np.zeros(len(self._chunk_ids), dtype=np.float32)
+
+        for term in set(tokenize(query)):
+            term_id: int | None = self._terms.get(term)
+            if term_id is None:
+                continue
+
+            postings: _Postings = self._postings[term_id]
+            slots: NDArray[np.uint32] = np.frombuffer(postings.slots, dtype=np.uint32)
+            frequencies: NDArray[np.float32] = np.frombuffer(postings.frequencies, dtype=np.uint16).astype(np.float32)
+
+            document_frequency: int = int(np.count_nonzero(live[slots]))
+            if document_frequency == 0:
+                continue
+
+            idf: float = math.log1p((chunks_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            scores[slots] += idf * frequencies * (self._k1 + 1.0) / (frequencies + length_norms[slots])
+
+        scores[~live] = 0.0
+        matched: NDArray[np.intp] = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+
+        return [LexicalHit(chunk_id=self._chunk_ids[slot], score=float(scores[slot])) for slot in matched]
+
+    async def _sync_if_due(self) -> None:
+        if self._last_synced_at is not None and (time.monotonic() - self._last_synced_at < self._sync_interval_seconds):
+            return
+
+        async with self._sync_lock:
+            if self._last_synced_at is not None and (
+                time.monotonic() - self._last_synced_at < self._sync_interval_seconds
+            ):
+                return
+
+            last_synced_score: float | None = self._last_synced_score
+            min_score: str = "-inf" if last_synced_score is None else str(last_synced_score - _SYNC_CLOCK_SKEW_SECONDS)
+
+            try:
+                entries: list[tuple[bytes, float]] = await self._redis_client.zrangebyscore(
+                    self._chunks_key, min_score, "+inf", withscores=True
+                )
+                # entries inside the clock skew window were already pulled by the previous sync
+                new_chunk_ids: list[str] = [
+                    raw_id.decode()
+                    for raw_id, score in entries
+                    if last_synced_score is None or score > last_synced_score or raw_id.decode() not in self._slots
+                ]
+
+                for start in range(0, len(new_chunk_ids), _SYNC_BATCH_SIZE):
+                    batch: list[str] = new_chunk_ids[start : start + _SYNC_BATCH_SIZE]
+                    raw_texts: list[bytes | None] = await cast(
+                        "Awaitable[list[bytes | None]]", self._redis_client.hmget(self._texts_key, batch)
+                    )
+                    for chunk_id, raw_text in zip(batch, raw_texts, strict=True):
+                        if raw_text is not None:
+                            self._add(chunk_id, raw_text.decode())
+            except RedisError:
+                logger.exception("Failed to sync keyword index, serving local copy")
+            else:
+                if entries:
+                    self._last_synced_score = max(score for _, score in entries)
+                logger.debug("Synced %d keyword index chunks, index size: %d", len(new_chunk_ids), len(self))
+            finally:
+                self._last_synced_at = time.monotonic()
+
+    def _add(self, chunk_id: str, text: str) -> None:
+        self._remove(chunk_id)
+
+        term_frequencies: Counter[str] = Counter(tokenize(text))
+        if not term_frequencies:
+            return
+
+        slot: int = len(self._chunk_ids)
+
+        for term, frequency in term_frequencies.items():
+            term_id: int = self._terms.setdefault(term, len(self._terms))
+            if term_id == len(self._postings):
+                self._postings.append(_Postings())
+
+            postings: _Postings = self._postings[term_id]
+            postings.slots.append(slot)
+            postings.frequencies.append(min(frequency, _MAX_TERM_FREQUENCY))
+
+        length: int = term_frequencies.total()
+        self._chunk_ids.append(chunk_id)
+        self._slots[chunk_id] = slot
+        self._lengths.append(length)
+        self._total_length += length
+
+    def _remove(self, chunk_id: str) -> None:
+        slot: int | None = self._slots.pop(chunk_id, None)
+        if slot is None:
+            return
+
+        self._total_length -= self._lengths[slot]
+        self._lengths[slot] = 0
+
+        replaced: int = len(self._chunk_ids) - len(self._slots)
+        if replaced >= _COMPACTION_MIN_REPLACED and replaced > len(self._slots):
+            self._compact()
+
+    def _compact(self) -> None:
+        lengths: NDArray[np.uint32] = np.frombuffer(self._lengths, dtype=np.uint32)
+        live: NDArray[np.bool_] = lengths > 0
+        new_slots: NDArray[np.uint32] = (np.cumsum(live) - 1).astype(np.uint32)
+
+        for postings in self._postings:
+            slots: NDArray[np.uint32] = np.frombuffer(postings.slots, dtype=np.uint32)
+            kept: NDArray[np.bool_] = live[slots]
+            frequencies: NDArray[np.uint16] = np.frombuffer(postings.frequencies, dtype=np.uint16)
+            postings.slots = array("I", new_slots[slots[kept]].tobytes())
+            postings.frequencies = array("H", frequencies[kept].tobytes())
+
+        self._chunk_ids = [
+            chunk_id for chunk_id, is_live in zip(self._chunk_ids, live.tolist(), strict=True) if is_live
+        ]
+        self._slots = {chunk_id: slot for slot, chunk_id in enumerate(self._chunk_ids)}
+        self._lengths = array("I", lengths[live].tobytes())
+
+        logger.debug("Compacted keyword index to %d chunks", len(self._chunk_ids))
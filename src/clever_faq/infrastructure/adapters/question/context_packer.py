@@ -0,0 +1,101 @@
+import logging
+import math
+import re
+from collections.abc import Callable, Sequence
+from typing import Final, override
+
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor
+from langchain_core.documents import Document as LangchainDocument
+
+from clever_faq.infrastructure.adapters.question.bm25_index import tokenize
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+_SHINGLE_SIZE: Final[int] = 3
+_CYRILLIC_PATTERN: Final[re.Pattern[str]] = re.compile(r"[\u0400-\u04ff]")
+# cl100k_base, the densest of the OpenAI tokenizers for Russian, averages about
+# 2.2 Cyrillic and 4 other characters per token, the ratios below round both down
+_CYRILLIC_CHARACTERS_PER_TOKEN: Final[float] = 2.0
+_OTHER_CHARACTERS_PER_TOKEN: Final[float] = 3.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Token count estimated without running a tokenizer on the event loop.
+    Errs on the high side, so the packed context stays within the budget.
+    """
+    cyrillic: int = len(_CYRILLIC_PATTERN.findall(text))
+    return math.ceil(cyrillic / _CYRILLIC_CHARACTERS_PER_TOKEN + (len(text) - cyrillic) / _OTHER_CHARACTERS_PER_TOKEN)
+
+
+def _shingles(text: str) -> frozenset[tuple[str, ...]]:
+    words: list[str] = list(tokenize(text))
+
+    if len(words) <= _SHINGLE_SIZE:
+        return frozenset((tuple(words),))
+
+    return frozenset(tuple(words[start : start + _SHINGLE_SIZE]) for start in range(len(words) - _SHINGLE_SIZE + 1))
+
+
+def _jaccard_similarity(first: frozenset[tuple[str, ...]], second: frozenset[tuple[str, ...]]) -> float:
+    union: int = len(first | second)
+    return len(first & second) / union if union else 1.0
+
+
+class TokenBudgetContextPacker(BaseDocumentCompressor):
+    """
+    Keeps the most relevant chunks that fit into ``token_budget`` tokens of context.
+
+    Chunks are expected ordered by relevance. A chunk too long for the rest of the budget
+    is skipped and a shorter, less relevant one may still fit. The most relevant chunk
+    is always kept, so the model never answers without context.
+
+    A chunk whose word shingles overlap a kept chunk by ``duplicate_threshold`` or more
+    (Jaccard similarity) is dropped as a near duplicate, e.g. the same paragraph
+    repeated in two documents.
+    """
+
+    token_budget: int
+    duplicate_threshold: float
+    count_tokens: Callable[[str], int] = estimate_tokens
+
+    @override
+    def compress_documents(
+        self,
+        documents: Sequence[LangchainDocument],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[LangchainDocument]:
+        packed_documents: list[LangchainDocument] = []
+        packed_shingles: list[frozenset[tuple[str, ...]]] = []
+        used_tokens: int = 0
+
+        for document in documents:
+            shingles: frozenset[tuple[str, ...]] = _shingles(document.page_content)
+            if any(_jaccard_similarity(shingles, kept) >= self.duplicate_threshold for kept in packed_shingles):
+                logger.debug("Dropping chunk %s, it nearly duplicates a more relevant one", document.id)
+                continue
+
+            tokens: int = self.count_tokens(document.page_content)
+            if packed_documents and used_tokens + tokens > self.token_budget:
+                continue
+
+            packed_documents.append(document)
+            packed_shingles.append(shingles)
+            used_tokens += tokens
+
+        logger.debug(
+            "Packed %d of %d chunks into %d context tokens", len(packed_documents), len(documents), used_tokens
+        )
+
+        return packed_documents
+
+    @override
+    async def acompress_documents(
+        self,
+        documents: Sequence[LangchainDocument],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[LangchainDocument]:
+        return self.compress_documents(documents, query, callbacks)
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Final, override
+
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun, CallbackManagerForRetrieverRun
+from langchain_core.documents import Document as LangchainDocument
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStore
+
+from clever_faq.infrastructure.adapters.question.bm25_index import LexicalHit, RedisBM25Index
+from clever_faq.infrastructure.cache.answer_cache_key import normalize_question
+from clever_faq.infrastructure.cache.retrieval_cache import RetrievalCache
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    Fuses the vector store search with the keyword search by reciprocal rank fusion:
+    a chunk scores ``1 / (rrf_k + rank)`` in each result list it is found in.
+    Ranks are fused instead of scores, as cosine distances and BM25 scores have different scales.
+
+    Chunks found only by the keyword search are read from the vector store by id,
+    so both kinds of results carry the same metadata.
+
+    Both searches run for the normalized question. Its embedding is computed once
+    and reused by the vector search and as the key of ``cache``.
+
+    Sync calls search one after another, without the cache, and see only the chunks
+    the keyword index has already synced.
+    """
+
+    vector_store: VectorStore
+    embeddings: Embeddings
+    lexical_index: RedisBM25Index
+    top_k: int
+    candidates: int
+    rrf_k: int
+    cache: RetrievalCache | None = None
+
+    @override
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[LangchainDocument]:
+        question: str = normalize_question(query)
+        embedding: list[float] = self.embeddings.embed_query(question)
+
+        dense_documents: list[LangchainDocument] = self.vector_store.similarity_search_by_vector(
+            embedding, k=self.candidates
+        )
+        lexical_hits: list[LexicalHit] = self.lexical_index.search_local(question, limit=self.candidates)
+
+        best_ids, documents = self._fuse(dense_documents, lexical_hits)
+        if missing_ids := [chunk_id for chunk_id in best_ids if chunk_id not in documents]:
+            documents.update(_by_id(self.vector_store.get_by_ids(missing_ids)))
+
+        return [documents[chunk_id] for chunk_id in best_ids if chunk_id in documents]
+
+    @override
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[LangchainDocument]:
+        question: str = normalize_question(query)
+        embedding: list[float] = await self.embeddings.aembed_query(question)
+
+        cache_key: str | None = await self.cache.build_key(embedding) if self.cache is not None else None
+        if self.cache is not None and cache_key is not None:
+            cached_documents: list[LangchainDocument] | None = await self.cache.get(cache_key)
+            if cached_documents is not None:
+                return cached_documents
+
+        documents: list[LangchainDocument] = await self._search(question, embedding)
+
+        if self.cache is not None and cache_key is not None:
+            await self.cache.set(cache_key, documents)
+
+        return documents
+
+    async def _search(self, question: str, embedding: list[float]) -> list[LangchainDocument]:
+        dense_documents, lexical_hits = await asyncio.gather(
+            self.vector_store.asimilarity_search_by_vector(embedding, k=self.candidates),
+            self.lexical_index.search(question, limit=self.candidates),
+        )
+
+        best_ids, documents = self._fuse(dense_documents, lexical_hits)
+        if missing_ids := [chunk_id for chunk_id in best_ids if chunk_id not in documents]:
+            documents.update(_by_id(await self.vector_store.aget_by_ids(missing_ids)))
+
+        return [documents[chunk_id] for chunk_id in best_ids if chunk_id in documents]
+
+    def _fuse(
+        self,
+        dense_documents: list[LangchainDocument],
+        lexical_hits: list[LexicalHit],
+    ) -> tuple[list[str], dict[str, LangchainDocument]]:
+        """
+        :return: Ids of the best ``top_k`` chunks and the documents found by vector search
+        """
+        documents: dict[str, LangchainDocument] = {}
+        scores: defaultdict[str, float] = defaultdict(float)
+
+        for rank, document in enumerate(dense_documents, start=1):
+            if document.id is None:
+                logger.warning("Vector store returned a chunk without id, skipping it")
+                continue
+            documents.setdefault(document.id, document)
+            scores[document.id] += 1.0 / (self.rrf_k + rank)
+
+        for rank, lexical_hit in enumerate(lexical_hits, start=1):
+            scores[lexical_hit.chunk_id] += 1.0 / (self.rrf_k + rank)
+
+        best_ids: list[str] = sorted(scores, key=scores.__getitem__, reverse=True)[: self.top_k]
+
+        logger.debug(
+            "Retrieved %d chunks, %d found by vector search, %d by keyword search",
+            len(best_ids),
+            len(dense_documents),
+            len(lexical_hits),
+        )
+
+        return best_ids, documents
+
+
+def _by_id(documents: list[LangchainDocument]) -> dict[str, LangchainDocument]:
+    return {document.id: document for document in documents if document.id is not None}
@@ -1,19 +1,27 @@
 import logging
+from collections.abc import AsyncIterator
+from functools import reduce
 from typing import TYPE_CHECKING, Any, Final, override
+from uuid import UUID
 
 from langchain_classic.chains.combine_documents import create_stuff_documents_chain
 from langchain_classic.chains.retrieval import create_retrieval_chain
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.documents import Document as LangchainDocument
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages.ai import UsageMetadata, add_usage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.vectorstores import VectorStore, VectorStoreRetriever
+from langchain_core.retrievers import BaseRetriever
 from langsmith import traceable
 
 from clever_faq.application.common.ports.question.question_answering_port import (
+    AnswerDeltaDTO,
     MessageWithTokenDTO,
     QuestionAnsweringPort,
 )
 from clever_faq.domain.dialog.values.message import Message
 from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.domain.document.values.document_id import DocumentID
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
@@ -36,19 +44,27 @@ PROMPT_TO_LLM_RUSSIAN: Final[str] = (
     "Верни только содержательный ответ без преамбулы и без указания, что ты модель."
 )
 
+_PHRASE_REPLACEMENTS: Final[tuple[tuple[str, str], ...]] = (
+    ("Согласно контексту", "Согласно документации"),
+    ("В предоставленном контексте", ""),
+)
+_LONGEST_PHRASE_LENGTH: Final[int] = max(len(phrase) for phrase, _ in _PHRASE_REPLACEMENTS)
+
 
 class LangChainQuestionAnsweringPort(QuestionAnsweringPort):
-    def __init__(self, large_learning_model: BaseChatModel, vector_store: VectorStore) -> None:
+    """
+    Retrieval-augmented answering over the chunks found by the retriever.
+
+    The prompt and the retrieval chain are compiled once, in the constructor,
+    so the port is meant to live in APP scope and be shared by all requests.
+    The chain itself keeps no per-call state, so concurrent calls are safe.
+    """
+
+    def __init__(self, large_learning_model: BaseChatModel, retriever: BaseRetriever) -> None:
         self._large_learning_model: Final[BaseChatModel] = large_learning_model
-        self._retrieval: Final[VectorStoreRetriever] = vector_store.as_retriever(
-            similarity="similarity",
-        )
+        self._retrieval: Final[BaseRetriever] = retriever
 
-    @traceable
-    @override
-    async def answer_the_question(self, question: Message) -> MessageWithTokenDTO:
         logger.debug("Building prompt for chat...")
-
         prompt: ChatPromptTemplate = ChatPromptTemplate.from_messages(
             [
                 ("system", PROMPT_TO_LLM_RUSSIAN),
@@ -63,29 +79,139 @@ class LangChainQuestionAnsweringPort(QuestionAnsweringPort):
         )
 
         logger.debug("Building retrieval chain for question answering...")
-        chain: Runnable[dict[str, Any], Any] = create_retrieval_chain(self._retrieval, question_answer_chain)
+        self._chain: Final[Runnable[dict[str, Any], Any]] = create_retrieval_chain(
+            self._retrieval, question_answer_chain
+        )
 
+    @traceable
+    @override
+    async def answer_the_question(self, question: Message) -> MessageWithTokenDTO:
         logger.debug("Answering Large Learning Model...")
-        answer_from_llm = await chain.ainvoke(
+        usage_handler: UsageMetadataCallbackHandler = UsageMetadataCallbackHandler()
+        answer_from_llm = await self._chain.ainvoke(
             {
                 "input": question.value,
-            }
+            },
+            config={"callbacks": [usage_handler]},
         )
 
         logger.debug("Got answer from Large Learning Model...")
         raw_answer: str = answer_from_llm.get("answer", "") or answer_from_llm.get("result", "")
 
-        answer: str = raw_answer.replace("Согласно контексту", "Согласно документации").replace(
-            "В предоставленном контексте", ""
-        )
+        return self._build_answer(raw_answer, answer_from_llm.get("context", []), usage_handler.usage_metadata)
+
+    @override
+    async def stream_the_answer(self, question: Message) -> AsyncIterator[AnswerDeltaDTO | MessageWithTokenDTO]:
+        logger.debug("Streaming answer from Large Learning Model...")
+        raw_answer_parts: list[str] = []
+        context: list[LangchainDocument] = []
+        rewriter: _StreamingAnswerRewriter = _StreamingAnswerRewriter()
+        usage_handler: UsageMetadataCallbackHandler = UsageMetadataCallbackHandler()
+
+        async for chunk in self._chain.astream({"input": question.value}, config={"callbacks": [usage_handler]}):
+            if "context" in chunk:
+                context = chunk["context"]
+
+            delta: str = chunk.get("answer", "")
+            if not delta:
+                continue
+
+            raw_answer_parts.append(delta)
+            if text := rewriter.feed(delta):
+                yield AnswerDeltaDTO(text=text)
+
+        if text := rewriter.flush():
+            yield AnswerDeltaDTO(text=text)
+
+        logger.debug("Finished streaming answer from Large Learning Model...")
+        yield self._build_answer("".join(raw_answer_parts), context, usage_handler.usage_metadata)
+
+    def _build_answer(
+        self,
+        raw_answer: str,
+        context: list[LangchainDocument],
+        usage_by_model: dict[str, UsageMetadata],
+    ) -> MessageWithTokenDTO:
+        answer: str = _rewrite_phrases(raw_answer)
+
+        source_document_ids: frozenset[DocumentID] = frozenset()
 
         if "Информация не найдена" not in answer:
             answer = answer.replace("но я не нашел информации", "")
+            source_document_ids = self._collect_source_document_ids(context)
 
         message: Message = Message(answer.strip())
-        tokens: Tokens = Tokens(self._large_learning_model.get_num_tokens(raw_answer))
 
         return MessageWithTokenDTO(
             message=message,
-            tokens=tokens,
+            tokens=_tokens_from_usage(usage_by_model),
+            source_document_ids=source_document_ids,
         )
+
+    @staticmethod
+    def _collect_source_document_ids(context: list[LangchainDocument]) -> frozenset[DocumentID]:
+        source_document_ids: set[DocumentID] = set()
+
+        for document in context:
+            try:
+                source_document_ids.add(DocumentID(UUID(document.metadata["document_id"])))
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Retrieved chunk %s has no valid document id", document.id)
+
+        return frozenset(source_document_ids)
+
+
+def _tokens_from_usage(usage_by_model: dict[str, UsageMetadata]) -> Tokens:
+    """
+    Sums the usage reported by the model API over all model calls of one answer.
+    """
+    if not usage_by_model:
+        logger.warning("Model returned no usage metadata, tokens of the answer are not counted")
+        return Tokens(prompt=0, completion=0)
+
+    usage: UsageMetadata = reduce(add_usage, usage_by_model.values())
+
+    return Tokens(
+        prompt=usage["input_tokens"],
+        completion=usage["output_tokens"],
+        cached_prompt=usage.get("input_token_details", {}).get("cache_read", 0),
+    )
+
+
+def _rewrite_phrases(text: str) -> str:
+    for phrase, replacement in _PHRASE_REPLACEMENTS:
+        text = text.replace(phrase, replacement)
+    return text
+
+
+class _StreamingAnswerRewriter:
+    """
+    Applies ``_PHRASE_REPLACEMENTS`` to an answer arriving in deltas.
+
+    A phrase may be split between deltas, so the tail of the text that could
+    still grow into one of the phrases is held back until the next delta.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: str = ""
+
+    def feed(self, delta: str) -> str:
+        self._buffer = _rewrite_phrases(self._buffer + delta)
+
+        held_back: int = self._held_back_length()
+        ready: str = self._buffer[: len(self._buffer) - held_back]
+        self._buffer = self._buffer[len(self._buffer) - held_back :]
+
+        return ready
+
+    def flush(self) -> str:
+        rest: str = self._buffer
+        self._buffer = ""
+        return rest
+
+    def _held_back_length(self) -> int:
+        for length in range(min(len(self._buffer), _LONGEST_PHRASE_LENGTH - 1), 0, -1):
+            tail: str = self._buffer[-length:]
+            if any(phrase.startswith(tail) for phrase, _ in _PHRASE_REPLACEMENTS):
+                return length
+        return 0
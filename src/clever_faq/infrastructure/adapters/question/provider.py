@@ -1,13 +1,39 @@
 from collections.abc import AsyncIterator
 
+import httpx
+from langchain_classic.retrievers import ContextualCompressionRetriever
+from langchain_classic.retrievers.document_compressors import DocumentCompressorPipeline
+from langchain_core.documents import BaseDocumentCompressor
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStore
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from redis.asyncio import Redis
 
+from clever_faq.infrastructure.adapters.question.bm25_index import RedisBM25Index
+from clever_faq.infrastructure.adapters.question.context_packer import TokenBudgetContextPacker
+from clever_faq.infrastructure.adapters.question.hybrid_retriever import HybridRetriever
+from clever_faq.infrastructure.adapters.question.term_overlap_reranker import TermOverlapReranker
+from clever_faq.infrastructure.cache.retrieval_cache import RetrievalCache
 from clever_faq.setup.config.openai import OpenAISettings
+from clever_faq.setup.config.retrieval import RetrievalConfig
 
 
-async def get_embeddings(config: OpenAISettings) -> AsyncIterator[Embeddings]:
+async def get_openai_http_client(config: OpenAISettings) -> AsyncIterator[httpx.AsyncClient]:
+    client: httpx.AsyncClient = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+        ),
+    )
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+async def get_embeddings(config: OpenAISettings, http_client: httpx.AsyncClient) -> AsyncIterator[Embeddings]:
     yield OpenAIEmbeddings(
         model=config.embeddings.model,
         api_key=config.api_key,
@@ -17,10 +43,11 @@ async def get_embeddings(config: OpenAISettings) -> AsyncIterator[Embeddings]:
         max_retries=config.embeddings.max_retries,
         base_url=config.base_url,
         chunk_size=config.embeddings.chunk_size,
+        http_async_client=http_client,
     )
 
 
-async def get_chat_model(config: OpenAISettings) -> AsyncIterator[BaseChatModel]:
+async def get_chat_model(config: OpenAISettings, http_client: httpx.AsyncClient) -> AsyncIterator[BaseChatModel]:
     yield ChatOpenAI(
         model=config.chat.model,
         api_key=config.api_key,
@@ -31,4 +58,54 @@ async def get_chat_model(config: OpenAISettings) -> AsyncIterator[BaseChatModel]
         timeout=config.chat.timeout,
         max_retries=config.chat.max_retries,
         base_url=config.base_url,
+        http_async_client=http_client,
+        stream_usage=True,
+    )
+
+
+def get_bm25_index(redis_client: Redis, config: RetrievalConfig) -> RedisBM25Index:
+    return RedisBM25Index(
+        redis_client=redis_client,
+        namespace="retrieval:bm25",
+        k1=config.bm25_k1,
+        b=config.bm25_b,
+        sync_interval_seconds=config.lexical_sync_interval_seconds,
+    )
+
+
+def get_reranker() -> BaseDocumentCompressor:
+    """
+    Any document compressor returning chunks ordered by relevance fits here,
+    e.g. ``CrossEncoderReranker`` over a local cross-encoder model.
+    """
+    return TermOverlapReranker()
+
+
+def get_retriever(
+    vector_store: VectorStore,
+    embeddings: Embeddings,
+    lexical_index: RedisBM25Index,
+    retrieval_cache: RetrievalCache,
+    reranker: BaseDocumentCompressor,
+    config: RetrievalConfig,
+) -> BaseRetriever:
+    return ContextualCompressionRetriever(
+        base_retriever=HybridRetriever(
+            vector_store=vector_store,
+            embeddings=embeddings,
+            lexical_index=lexical_index,
+            top_k=config.top_k,
+            candidates=config.candidates,
+            rrf_k=config.rrf_k,
+            cache=retrieval_cache if config.cache_ttl_seconds else None,
+        ),
+        base_compressor=DocumentCompressorPipeline(
+            transformers=[
+                reranker,
+                TokenBudgetContextPacker(
+                    token_budget=config.context_token_budget,
+                    duplicate_threshold=config.duplicate_similarity_threshold,
+                ),
+            ],
+        ),
     )
@@ -0,0 +1,102 @@
+import logging
+import math
+from collections.abc import Sequence
+from itertools import pairwise
+from typing import Final, override
+
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor
+from langchain_core.documents import Document as LangchainDocument
+
+from clever_faq.infrastructure.adapters.question.bm25_index import tokenize
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+_STEM_LENGTH: Final[int] = 5
+
+
+def _terms(text: str) -> list[str]:
+    """
+    Words cut to their first letters, a crude stemming that lets inflected forms
+    like ``ошибка`` and ``ошибку`` match. Codes and numbers are kept whole.
+    """
+    return [token[:_STEM_LENGTH] if token.isalpha() else token for token in tokenize(text)]
+
+
+class TermOverlapReranker(BaseDocumentCompressor):
+    """
+    Cheap local reranker, without a model or network calls.
+
+    Relevance mixes the retrieval rank with how well a chunk covers the question:
+    the share of question terms found in the chunk, weighted by how rare each term
+    is among the candidates, and the share of adjacent question term pairs found
+    adjacent in the chunk. The rank keeps chunks that vector search found by meaning
+    although they share few words with the question.
+
+    The score is stored in ``relevance_score`` metadata, like other LangChain rerankers do.
+    """
+
+    retrieval_weight: float = 0.3
+    phrase_weight: float = 0.25
+
+    @override
+    def compress_documents(
+        self,
+        documents: Sequence[LangchainDocument],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[LangchainDocument]:
+        query_terms: list[str] = _terms(query)
+        if not documents or not query_terms:
+            return list(documents)
+
+        document_terms: list[list[str]] = [_terms(document.page_content) for document in documents]
+        document_term_sets: list[set[str]] = [set(terms) for terms in document_terms]
+
+        # terms found in no candidate can't tell candidates apart, they are left out
+        term_weights: dict[str, float] = {}
+        for term in query_terms:
+            if document_frequency := sum(term in term_set for term_set in document_term_sets):
+                term_weights[term] = math.log1p(len(documents) / document_frequency)
+        total_weight: float = sum(term_weights.values())
+        query_pairs: set[tuple[str, str]] = set(pairwise(query_terms))
+
+        scored_documents: list[tuple[float, LangchainDocument]] = []
+
+        for rank, (document, terms, term_set) in enumerate(
+            zip(documents, document_terms, document_term_sets, strict=True)
+        ):
+            coverage: float = (
+                sum(weight for term, weight in term_weights.items() if term in term_set) / total_weight
+                if total_weight
+                else 0.0
+            )
+            phrase_coverage: float = (
+                len(query_pairs.intersection(pairwise(terms))) / len(query_pairs) if query_pairs else 0.0
+            )
+            lexical_score: float = (1.0 - self.phrase_weight) * coverage + self.phrase_weight * phrase_coverage
+            retrieval_score: float = 1.0 - rank / len(documents)
+
+            relevance: float = self.retrieval_weight * retrieval_score + (1.0 - self.retrieval_weight) * lexical_score
+            scored_documents.append((relevance, document))
+
+        scored_documents.sort(key=lambda scored_document: scored_document[0], reverse=True)
+
+        return [
+            LangchainDocument(
+                id=document.id,
+                page_content=document.page_content,
+                metadata={**document.metadata, "relevance_score": relevance},
+            )
+            for relevance, document in scored_documents
+        ]
+
+    @override
+    async def acompress_documents(
+        self,
+        documents: Sequence[LangchainDocument],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[LangchainDocument]:
+        # scoring a few dozen chunks is cheaper than a hop to the thread pool
+        return self.compress_documents(documents, query, callbacks)
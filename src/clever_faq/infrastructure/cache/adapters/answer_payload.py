@@ -0,0 +1,201 @@
+"""
+Cached answer encoding.
+
+Current format is one byte of format id followed by a MessagePack array
+(see ``_AnswerRecord``), compressed with zstd when it is bigger than the
+compression threshold. Entries written before the binary format are UTF-8
+JSON objects; they start with ``{`` and are still decoded.
+
+Tokens are stored as ``[prompt, completion, cached prompt]``. Older entries hold
+a single number, the completion tokens, and are decoded with zero prompt tokens.
+"""
+
+import json
+import logging
+import time
+from typing import Final, NotRequired, TypedDict
+from uuid import UUID
+
+import ormsgpack
+import zstandard
+
+from clever_faq.application.common.ports.question.question_answering_port import MessageWithTokenDTO
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.domain.document.values.document_id import DocumentID
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSION_THRESHOLD_BYTES: Final[int] = 512
+
+_FORMAT_MSGPACK: Final[int] = 1
+_FORMAT_MSGPACK_ZSTD: Final[int] = 2
+_LEGACY_JSON_PREFIX: Final[bytes] = b"{"
+_ZSTD_LEVEL: Final[int] = 3
+
+_compressor: Final[zstandard.ZstdCompressor] = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+_decompressor: Final[zstandard.ZstdDecompressor] = zstandard.ZstdDecompressor()
+
+# answer, tokens, version, source document ids as 16-byte UUIDs, soft expiry, hard expiry, question
+type _AnswerRecord = tuple[str, list[int], str, list[bytes], float | None, float | None, str | None]
+
+
+class AnswerWithTokenInCache(TypedDict):
+    answer: str
+    # completion tokens, the key predates prompt token accounting
+    tokens: int
+    prompt_tokens: NotRequired[int]
+    cached_prompt_tokens: NotRequired[int]
+    question: NotRequired[str]
+    version: NotRequired[str]
+    source_document_ids: NotRequired[list[str]]
+    soft_expires_at: NotRequired[float]
+    hard_expires_at: NotRequired[float]
+
+
+def encode_answer(
+    question: Message | None,
+    answer_dto: MessageWithTokenDTO,
+    version: str,
+    soft_ttl: int | None = None,
+    hard_ttl: int | None = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD_BYTES,
+) -> bytes:
+    """
+    :param question: Original question, only worth storing when the cache key does not identify it
+    :param soft_ttl: Seconds after which the answer should be refreshed
+    :param hard_ttl: Seconds after which the answer must not be served
+    :param compression_threshold: Size in bytes from which the payload is compressed
+    """
+    now: float = time.time()
+    record: _AnswerRecord = (
+        answer_dto.message.value,
+        [answer_dto.tokens.prompt, answer_dto.tokens.completion, answer_dto.tokens.cached_prompt],
+        version,
+        [document_id.bytes for document_id in sorted(answer_dto.source_document_ids)],
+        now + soft_ttl if soft_ttl is not None else None,
+        now + hard_ttl if hard_ttl is not None else None,
+        question.value if question is not None else None,
+    )
+    packed: bytes = ormsgpack.packb(record)
+
+    if len(packed) >= compression_threshold:
+        return bytes((_FORMAT_MSGPACK_ZSTD,)) + _compressor.compress(packed)
+
+    return bytes((_FORMAT_MSGPACK,)) + packed
+
+
+def decode_answer(cached_bytes: bytes) -> AnswerWithTokenInCache | None:
+    if cached_bytes.startswith(_LEGACY_JSON_PREFIX):
+        return _decode_legacy_answer(cached_bytes)
+
+    try:
+        packed: bytes = _unwrap(cached_bytes)
+        answer, tokens, version, source_document_ids, soft_expires_at, hard_expires_at, question = ormsgpack.unpackb(
+            packed
+        )
+        payload: AnswerWithTokenInCache = {
+            "answer": _expect(answer, str),
+            "tokens": 0,
+            "version": _expect(version, str),
+            "source_document_ids": [str(UUID(bytes=document_id)) for document_id in source_document_ids],
+        }
+
+        if isinstance(tokens, int):
+            payload["tokens"] = tokens
+        else:
+            prompt_tokens, completion_tokens, cached_prompt_tokens = _expect(tokens, list)
+            payload["prompt_tokens"] = _expect(prompt_tokens, int)
+            payload["tokens"] = _expect(completion_tokens, int)
+            payload["cached_prompt_tokens"] = _expect(cached_prompt_tokens, int)
+    except (zstandard.ZstdError, ormsgpack.MsgpackDecodeError, TypeError, ValueError):
+        logger.warning("Failed to decode cached answer")
+        return None
+
+    if soft_expires_at is not None:
+        payload["soft_expires_at"] = float(soft_expires_at)
+    if hard_expires_at is not None:
+        payload["hard_expires_at"] = float(hard_expires_at)
+    if question is not None:
+        payload["question"] = str(question)
+
+    return payload
+
+
+def _unwrap(cached_bytes: bytes) -> bytes:
+    if not cached_bytes:
+        msg = "Empty cached answer"
+        raise ValueError(msg)
+
+    payload_format, body = cached_bytes[0], cached_bytes[1:]
+
+    if payload_format == _FORMAT_MSGPACK:
+        return body
+    if payload_format == _FORMAT_MSGPACK_ZSTD:
+        return _decompressor.decompress(body)
+
+    msg = f"Unknown cached answer format {payload_format}"
+    raise ValueError(msg)
+
+
+def _expect[T](value: object, expected_type: type[T]) -> T:
+    if not isinstance(value, expected_type):
+        msg = f"Expected {expected_type.__name__}, got {type(value).__name__}"
+        raise TypeError(msg)
+    return value
+
+
+def _decode_legacy_answer(cached_bytes: bytes) -> AnswerWithTokenInCache | None:
+    try:
+        payload = json.loads(cached_bytes.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        logger.warning("Failed to decode cached answer")
+        return None
+
+    if not isinstance(payload, dict):
+        logger.warning("Cached answer has invalid format")
+        return None
+
+    if not {"answer", "tokens"} <= payload.keys():
+        logger.warning("Cached answer missing required fields")
+        return None
+
+    try:
+        payload["tokens"] = int(payload["tokens"])
+        for field in ("soft_expires_at", "hard_expires_at"):
+            if field in payload:
+                payload[field] = float(payload[field])
+    except (TypeError, ValueError):
+        logger.warning("Cached answer has invalid token count or expiration time")
+        return None
+
+    try:
+        for document_id in payload.get("source_document_ids", []):
+            UUID(document_id)
+    except (AttributeError, TypeError, ValueError):
+        logger.warning("Cached answer has invalid source document ids")
+        return None
+
+    return payload  # type: ignore[return-value]
+
+
+def is_stale(payload: AnswerWithTokenInCache) -> bool:
+    return time.time() >= payload.get("soft_expires_at", float("inf"))
+
+
+def is_expired(payload: AnswerWithTokenInCache) -> bool:
+    return time.time() >= payload.get("hard_expires_at", float("inf"))
+
+
+def build_dto_from_cache(payload: AnswerWithTokenInCache) -> MessageWithTokenDTO:
+    return MessageWithTokenDTO(
+        message=Message(payload["answer"]),
+        tokens=Tokens(
+            prompt=payload.get("prompt_tokens", 0),
+            completion=payload["tokens"],
+            cached_prompt=payload.get("cached_prompt_tokens", 0),
+        ),
+        source_document_ids=frozenset(
+            DocumentID(UUID(document_id)) for document_id in payload.get("source_document_ids", [])
+        ),
+    )
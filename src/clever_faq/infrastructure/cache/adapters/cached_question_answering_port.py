@@ -1,85 +1,195 @@
-import hashlib
-import json
+import asyncio
 import logging
-from typing import Final, TypedDict, override
+from collections.abc import AsyncIterator
+from typing import Final, override
 
 from clever_faq.application.common.ports.cache_store import CacheStore
 from clever_faq.application.common.ports.question.question_answering_port import (
+    AnswerDeltaDTO,
     MessageWithTokenDTO,
     QuestionAnsweringPort,
 )
 from clever_faq.domain.dialog.values.message import Message
-from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.infrastructure.cache.adapters.answer_payload import (
+    AnswerWithTokenInCache,
+    build_dto_from_cache,
+    decode_answer,
+    encode_answer,
+    is_expired,
+    is_stale,
+)
+from clever_faq.infrastructure.cache.answer_cache_key import AnswerCacheKeyBuilder
+from clever_faq.infrastructure.cache.answer_tags import answer_tags
+from clever_faq.infrastructure.cache.single_flight import RedisSingleFlight
 from clever_faq.infrastructure.errors.cache import CacheError
+from clever_faq.setup.config.cache import AnswerCacheConfig
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 
-class AnswerWithTokenInCache(TypedDict):
-    question: str
-    answer: str
-    tokens: int
+class CachedQuestionAnsweringPort(QuestionAnsweringPort):
+    """
+    Exact-match answer cache.
+
+    With ``stale_while_revalidate_seconds`` set, an answer older than its TTL is
+    still served for that long, while a single background task regenerates it.
+    Refreshes are deduplicated by cache key and at most ``refresh_concurrency``
+    of them run at once; the rest are skipped until a later hit.
 
+    Streamed answers bypass the single flight: a follower would have nothing
+    to stream until the leader finished, which defeats streaming.
+    """
 
-class CachedQuestionAnsweringPort(QuestionAnsweringPort):
     def __init__(
         self,
         question_answering_port: QuestionAnsweringPort,
         cache: CacheStore,
+        key_builder: AnswerCacheKeyBuilder,
+        single_flight: RedisSingleFlight,
+        config: AnswerCacheConfig,
     ) -> None:
         self._question_answering_port: Final[QuestionAnsweringPort] = question_answering_port
         self._cache: Final[CacheStore] = cache
-        self._default_ttl_seconds: Final[int] = 3600
+        self._key_builder: Final[AnswerCacheKeyBuilder] = key_builder
+        self._single_flight: Final[RedisSingleFlight] = single_flight
+        self._default_ttl_seconds: Final[int] = config.ttl_seconds
+        self._hard_ttl_seconds: Final[int] = config.ttl_seconds + config.stale_while_revalidate_seconds
+        self._compression_threshold: Final[int] = config.compression_threshold_bytes
+
+        self._refresh_semaphore: Final[asyncio.Semaphore] = asyncio.Semaphore(config.refresh_concurrency)
+        self._refreshing: Final[set[str]] = set()
+        self._refresh_tasks: Final[set[asyncio.Task[None]]] = set()
 
     @override
     async def answer_the_question(self, question: Message) -> MessageWithTokenDTO:
-        cache_key = self._build_cache_key(question)
-
         try:
+            version: str = await self._key_builder.version()
+            cache_key: str = self._key_builder.build_key(question, version)
             cached_bytes = await self._cache.get(cache_key)
         except CacheError:
             logger.exception("Cache get failed for question: %s", question.value)
             return await self._question_answering_port.answer_the_question(question)
 
         if cached_bytes:
-            cached_payload = self._decode_cached_answer(cached_bytes)
-            if cached_payload:
-                logger.info("Cache hit for question: %s", question.value)
-                return self._build_dto_from_cache(cached_payload)
+            cached_payload = decode_answer(cached_bytes)
+            if cached_payload and not is_expired(cached_payload):
+                if is_stale(cached_payload):
+                    logger.info("Stale cache hit for question: %s", question.value)
+                    self._schedule_refresh(cache_key, question, version)
+                else:
+                    logger.info("Cache hit for question: %s", question.value)
+                return build_dto_from_cache(cached_payload)
 
         logger.info("Cache miss for question: %s", question.value)
+
+        return await self._single_flight.run(
+            cache_key,
+            compute=lambda: self._answer_and_store(cache_key, question, version),
+            read_result=lambda: self._read_fresh_answer(cache_key),
+        )
+
+    @override
+    async def stream_the_answer(self, question: Message) -> AsyncIterator[AnswerDeltaDTO | MessageWithTokenDTO]:
+        try:
+            version: str = await self._key_builder.version()
+            cache_key: str = self._key_builder.build_key(question, version)
+            cached_bytes = await self._cache.get(cache_key)
+        except CacheError:
+            logger.exception("Cache get failed for question: %s", question.value)
+            async for item in self._question_answering_port.stream_the_answer(question):
+                yield item
+            return
+
+        if cached_bytes:
+            cached_payload = decode_answer(cached_bytes)
+            if cached_payload and not is_expired(cached_payload):
+                if is_stale(cached_payload):
+                    logger.info("Stale cache hit for question: %s", question.value)
+                    self._schedule_refresh(cache_key, question, version)
+                else:
+                    logger.info("Cache hit for question: %s", question.value)
+                yield build_dto_from_cache(cached_payload)
+                return
+
+        logger.info("Cache miss for question: %s", question.value)
+
+        async for item in self._question_answering_port.stream_the_answer(question):
+            if isinstance(item, MessageWithTokenDTO):
+                await self._store_in_cache(cache_key, question, item, version)
+            yield item
+
+    async def _answer_and_store(self, cache_key: str, question: Message, version: str) -> MessageWithTokenDTO:
         answer_dto = await self._question_answering_port.answer_the_question(question)
 
-        await self._store_in_cache(cache_key, question, answer_dto)
+        await self._store_in_cache(cache_key, question, answer_dto, version)
 
         return answer_dto
 
-    @staticmethod
-    def _build_cache_key(question: Message) -> str:
-        key_json: str = json.dumps(
-            {
-                "question_for_llm": question.value,
-            },
-            ensure_ascii=False,
-            separators=(",", ":"),
-        )
-        return hashlib.sha256(key_json.encode("utf-8")).hexdigest()
+    async def _read_fresh_answer(self, cache_key: str) -> MessageWithTokenDTO | None:
+        try:
+            cached_bytes = await self._cache.get(cache_key)
+        except CacheError:
+            logger.exception("Cache get failed for key: %s", cache_key)
+            return None
+
+        cached_payload: AnswerWithTokenInCache | None = decode_answer(cached_bytes) if cached_bytes else None
+        if cached_payload is None or is_stale(cached_payload):
+            return None
+
+        return build_dto_from_cache(cached_payload)
+
+    def _schedule_refresh(self, cache_key: str, question: Message, version: str) -> None:
+        if cache_key in self._refreshing:
+            logger.debug("Answer for question: %s is already being refreshed", question.value)
+            return
+
+        if self._refresh_semaphore.locked():
+            logger.warning("Too many answers are being refreshed, skipping question: %s", question.value)
+            return
+
+        self._refreshing.add(cache_key)
+        task: asyncio.Task[None] = asyncio.create_task(self._refresh(cache_key, question, version))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, cache_key: str, question: Message, version: str) -> None:
+        try:
+            async with self._refresh_semaphore:
+                await self._single_flight.run(
+                    cache_key,
+                    compute=lambda: self._answer_and_store(cache_key, question, version),
+                    read_result=lambda: self._read_fresh_answer(cache_key),
+                )
+        except Exception:
+            logger.exception("Failed to refresh answer for question: %s", question.value)
+        else:
+            logger.info("Refreshed answer for question: %s", question.value)
+        finally:
+            self._refreshing.discard(cache_key)
 
     async def _store_in_cache(
         self,
         cache_key: str,
         question: Message,
         answer_dto: MessageWithTokenDTO,
+        version: str,
     ) -> None:
-        payload: AnswerWithTokenInCache = {
-            "question": question.value,
-            "answer": answer_dto.message.value,
-            "tokens": answer_dto.tokens.value,
-        }
-        encoded_payload = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        encoded_payload = encode_answer(
+            None,
+            answer_dto,
+            version,
+            soft_ttl=self._default_ttl_seconds,
+            hard_ttl=self._hard_ttl_seconds,
+            compression_threshold=self._compression_threshold,
+        )
 
         try:
-            await self._cache.set(cache_key, encoded_payload, ttl=self._default_ttl_seconds)
+            await self._cache.set(
+                cache_key,
+                encoded_payload,
+                ttl=self._hard_ttl_seconds,
+                tags=answer_tags(answer_dto.source_document_ids),
+            )
         except CacheError:
             logger.exception("Failed to cache answer for question: %s", question.value)
         else:
@@ -88,34 +198,3 @@ class CachedQuestionAnsweringPort(QuestionAnsweringPort):
                 question.value,
                 self._default_ttl_seconds,
             )
-
-    @staticmethod
-    def _decode_cached_answer(cached_bytes: bytes) -> AnswerWithTokenInCache | None:
-        try:
-            payload = json.loads(cached_bytes.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError):
-            logger.warning("Failed to decode cached answer")
-            return None
-
-        if not isinstance(payload, dict):
-            logger.warning("Cached answer has invalid format")
-            return None
-
-        if not {"question", "answer", "tokens"} <= payload.keys():
-            logger.warning("Cached answer missing required fields")
-            return None
-
-        try:
-            payload["tokens"] = int(payload["tokens"])
-        except (TypeError, ValueError):
-            logger.warning("Cached answer has invalid token count")
-            return None
-
-        return payload  # type: ignore[return-value]
-
-    @staticmethod
-    def _build_dto_from_cache(payload: AnswerWithTokenInCache) -> MessageWithTokenDTO:
-        return MessageWithTokenDTO(
-            message=Message(payload["answer"]),
-            tokens=Tokens(payload["tokens"]),
-        )
@@ -0,0 +1,163 @@
+import logging
+from collections.abc import AsyncIterator
+from typing import Final, override
+
+from langchain_core.embeddings import Embeddings
+
+from clever_faq.application.common.ports.question.question_answering_port import (
+    AnswerDeltaDTO,
+    MessageWithTokenDTO,
+    QuestionAnsweringPort,
+)
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.infrastructure.cache.adapters.answer_payload import (
+    build_dto_from_cache,
+    decode_answer,
+    encode_answer,
+)
+from clever_faq.infrastructure.cache.answer_cache_key import AnswerCacheKeyBuilder, normalize_question
+from clever_faq.infrastructure.cache.semantic_answer_index import RedisSemanticAnswerIndex, SemanticNeighbour
+from clever_faq.infrastructure.cache.stats import SemanticCacheStats
+from clever_faq.infrastructure.errors.cache import CacheError
+from clever_faq.setup.config.cache import AnswerCacheConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class SemanticCachedQuestionAnsweringPort(QuestionAnsweringPort):
+    """
+    Second cache tier: reuses the answer of a previously asked question
+    whose embedding is close enough to the embedding of the new one.
+    Catches paraphrases that the exact-match tier misses.
+    Answers cached under another cache version are treated as misses.
+
+    The normalized question is embedded, like in the retriever, so on a miss
+    the retriever finds its embedding already cached.
+    """
+
+    def __init__(
+        self,
+        question_answering_port: QuestionAnsweringPort,
+        embeddings: Embeddings,
+        index: RedisSemanticAnswerIndex,
+        key_builder: AnswerCacheKeyBuilder,
+        stats: SemanticCacheStats,
+        config: AnswerCacheConfig,
+    ) -> None:
+        self._question_answering_port: Final[QuestionAnsweringPort] = question_answering_port
+        self._embeddings: Final[Embeddings] = embeddings
+        self._index: Final[RedisSemanticAnswerIndex] = index
+        self._key_builder: Final[AnswerCacheKeyBuilder] = key_builder
+        self._stats: Final[SemanticCacheStats] = stats
+        self._similarity_threshold: Final[float] = config.semantic_similarity_threshold
+        self._near_hit_threshold: Final[float] = config.semantic_near_hit_threshold
+        self._ttl_seconds: Final[int] = config.ttl_seconds
+        self._compression_threshold: Final[int] = config.compression_threshold_bytes
+
+    @override
+    async def answer_the_question(self, question: Message) -> MessageWithTokenDTO:
+        try:
+            version: str = await self._key_builder.version()
+        except CacheError:
+            logger.exception("Failed to read cache version for question: %s", question.value)
+            return await self._question_answering_port.answer_the_question(question)
+
+        try:
+            embedding: list[float] = await self._embeddings.aembed_query(normalize_question(question.value))
+        except Exception:
+            logger.exception("Failed to embed question for semantic cache: %s", question.value)
+            return await self._question_answering_port.answer_the_question(question)
+
+        cached_answer: MessageWithTokenDTO | None = await self._lookup(question, embedding, version)
+        if cached_answer is not None:
+            return cached_answer
+
+        answer_dto: MessageWithTokenDTO = await self._question_answering_port.answer_the_question(question)
+
+        await self._add_to_index(question, embedding, answer_dto, version)
+
+        return answer_dto
+
+    @override
+    async def stream_the_answer(self, question: Message) -> AsyncIterator[AnswerDeltaDTO | MessageWithTokenDTO]:
+        try:
+            version: str = await self._key_builder.version()
+            embedding: list[float] = await self._embeddings.aembed_query(normalize_question(question.value))
+        except Exception:
+            logger.exception("Failed to prepare semantic cache lookup for question: %s", question.value)
+            async for item in self._question_answering_port.stream_the_answer(question):
+                yield item
+            return
+
+        cached_answer: MessageWithTokenDTO | None = await self._lookup(question, embedding, version)
+        if cached_answer is not None:
+            yield cached_answer
+            return
+
+        async for item in self._question_answering_port.stream_the_answer(question):
+            if isinstance(item, MessageWithTokenDTO):
+                await self._add_to_index(question, embedding, item, version)
+            yield item
+
+    async def _add_to_index(
+        self,
+        question: Message,
+        embedding: list[float],
+        answer_dto: MessageWithTokenDTO,
+        version: str,
+    ) -> None:
+        try:
+            await self._index.add(
+                embedding,
+                encode_answer(question, answer_dto, version, compression_threshold=self._compression_threshold),
+                ttl=self._ttl_seconds,
+                source_document_ids=answer_dto.source_document_ids,
+            )
+        except CacheError:
+            logger.exception("Failed to add answer to semantic cache for question: %s", question.value)
+
+    async def _lookup(self, question: Message, embedding: list[float], version: str) -> MessageWithTokenDTO | None:
+        try:
+            neighbour: SemanticNeighbour | None = await self._index.nearest(embedding)
+
+            if neighbour is not None and neighbour.similarity >= self._similarity_threshold:
+                cached_bytes: bytes | None = await self._index.read_answer(neighbour.entry_id)
+                cached_payload = decode_answer(cached_bytes) if cached_bytes else None
+
+                if cached_payload and cached_payload.get("version") != version:
+                    logger.debug("Semantic cache entry %s is outdated, discarding it", neighbour.entry_id)
+                    await self._index.discard(neighbour.entry_id)
+                elif cached_payload:
+                    self._stats.hits += 1
+                    logger.info(
+                        "Semantic cache hit for question: %s, matched: %s, similarity: %.4f",
+                        question.value,
+                        cached_payload.get("question"),
+                        neighbour.similarity,
+                    )
+                    self._log_stats()
+                    return build_dto_from_cache(cached_payload)
+        except CacheError:
+            logger.exception("Semantic cache lookup failed for question: %s", question.value)
+            return None
+
+        if neighbour is not None and self._near_hit_threshold <= neighbour.similarity < self._similarity_threshold:
+            self._stats.near_hits += 1
+            logger.info(
+                "Semantic cache near hit for question: %s, similarity: %.4f", question.value, neighbour.similarity
+            )
+        else:
+            self._stats.misses += 1
+            logger.info("Semantic cache miss for question: %s", question.value)
+
+        self._log_stats()
+        return None
+
+    def _log_stats(self) -> None:
+        logger.info(
+            "Semantic cache stats: hits=%d near_hits=%d misses=%d hit_ratio=%.3f",
+            self._stats.hits,
+            self._stats.near_hits,
+            self._stats.misses,
+            self._stats.hit_ratio,
+        )
@@ -0,0 +1,51 @@
+import hashlib
+import json
+import string
+import unicodedata
+from typing import Final
+
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.infrastructure.adapters.question.langchain_question_answering_port import PROMPT_TO_LLM_RUSSIAN
+from clever_faq.setup.config.openai import OpenAISettings
+
+_TRIMMED_CHARACTERS: Final[str] = string.punctuation + string.whitespace + "«»„“”‘’…–—¿¡"
+
+
+def normalize_question(text: str) -> str:
+    """
+    Folds questions that differ only in Unicode form, case, spacing,
+    surrounding punctuation or spelling of Russian ``ё`` into one string.
+    """
+    normalized: str = unicodedata.normalize("NFKC", text).casefold().replace("ё", "е")
+    return " ".join(normalized.split()).strip(_TRIMMED_CHARACTERS)
+
+
+class AnswerCacheKeyBuilder:
+    """
+    Builds cache keys for answers. The key includes a version made of
+    everything the answer depends on besides the question: the prompt,
+    the chat model and the knowledge base generation. Changing any of
+    them makes previously cached answers unreachable.
+    """
+
+    def __init__(self, knowledge_base_generation: KnowledgeBaseGeneration, openai_config: OpenAISettings) -> None:
+        self._knowledge_base_generation: Final[KnowledgeBaseGeneration] = knowledge_base_generation
+        self._static_version: Final[str] = hashlib.sha256(
+            f"{PROMPT_TO_LLM_RUSSIAN}\0{openai_config.chat.model}".encode()
+        ).hexdigest()[:16]
+
+    async def version(self) -> str:
+        return f"{self._static_version}:{await self._knowledge_base_generation.current()}"
+
+    @staticmethod
+    def build_key(question: Message, version: str) -> str:
+        key_json: str = json.dumps(
+            {
+                "question_for_llm": normalize_question(question.value),
+                "version": version,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(key_json.encode("utf-8")).hexdigest()
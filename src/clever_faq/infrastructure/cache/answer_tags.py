@@ -0,0 +1,18 @@
+from collections.abc import Iterable
+from typing import Final
+
+from clever_faq.domain.document.values.document_id import DocumentID
+
+UNANSWERED_TAG: Final[str] = "answer:unanswered"
+
+
+def document_tag(document_id: DocumentID) -> str:
+    return f"answer:document:{document_id}"
+
+
+def answer_tags(source_document_ids: Iterable[DocumentID]) -> list[str]:
+    """
+    Tags of a cached answer: the documents it was built from,
+    or ``UNANSWERED_TAG`` when no document contained the answer.
+    """
+    return [document_tag(document_id) for document_id in source_document_ids] or [UNANSWERED_TAG]
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Final, override
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from clever_faq.infrastructure.cache.stats import EmbeddingCacheStats
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings decorator keeping computed vectors in Redis as float32 bytes under
+    ``{namespace}:document:{sha256}`` and ``{namespace}:query:{sha256}``,
+    where the namespace identifies the model and its dimensions.
+
+    Only texts missing from the cache are sent to the model, each unique text once per call.
+    Sync methods are cached too: the semantic chunker and the vector store call them,
+    so they go through a sync client sharing the same keys.
+    When Redis fails the model is called directly.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        redis_client: Redis,
+        sync_redis_client: SyncRedis,
+        namespace: str,
+        ttl_seconds: int,
+        stats: EmbeddingCacheStats,
+    ) -> None:
+        self._embeddings: Final[Embeddings] = embeddings
+        self._redis_client: Final[Redis] = redis_client
+        self._sync_redis_client: Final[SyncRedis] = sync_redis_client
+        self._document_key_prefix: Final[str] = f"{namespace}:document:"
+        self._query_key_prefix: Final[str] = f"{namespace}:query:"
+        self._ttl_seconds: Final[int] = ttl_seconds
+        self._stats: Final[EmbeddingCacheStats] = stats
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._embed_cached(texts, self._document_key_prefix, self._embeddings.embed_documents)
+
+    @override
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed_cached(
+            [text], self._query_key_prefix, lambda texts: [self._embeddings.embed_query(texts[0])]
+        )[0]
+
+    @override
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self._aembed_cached(texts, self._document_key_prefix, self._embeddings.aembed_documents)
+
+    @override
+    async def aembed_query(self, text: str) -> list[float]:
+        async def compute(texts: list[str]) -> list[list[float]]:
+            return [await self._embeddings.aembed_query(texts[0])]
+
+        return (await self._aembed_cached([text], self._query_key_prefix, compute))[0]
+
+    def _embed_cached(
+        self,
+        texts: list[str],
+        key_prefix: str,
+        compute: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        if not texts:
+            return []
+
+        keys: list[str] = [self._build_key(key_prefix, text) for text in texts]
+
+        try:
+            cached: list[bytes | None] = self._sync_redis_client.mget(keys)  # type: ignore[assignment]
+        except RedisError:
+            logger.exception("Failed to read cached embeddings")
+            return compute(texts)
+
+        missing_texts: list[str] = self._collect_missing(texts, cached)
+        computed: dict[str, list[float]] = (
+            dict(zip(missing_texts, compute(missing_texts), strict=True)) if missing_texts else {}
+        )
+
+        if computed:
+            try:
+                with self._sync_redis_client.pipeline(transaction=False) as pipe:
+                    for text, vector in computed.items():
+                        pipe.set(self._build_key(key_prefix, text), _encode(vector), ex=self._ttl_seconds)
+                    pipe.execute()
+            except RedisError:
+                logger.exception("Failed to cache embeddings")
+
+        return self._merge(texts, cached, computed)
+
+    async def _aembed_cached(
+        self,
+        texts: list[str],
+        key_prefix: str,
+        compute: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        if not texts:
+            return []
+
+        keys: list[str] = [self._build_key(key_prefix, text) for text in texts]
+
+        try:
+            cached: list[bytes | None] = await self._redis_client.mget(keys)
+        except RedisError:
+            logger.exception("Failed to read cached embeddings")
+            return await compute(texts)
+
+        missing_texts: list[str] = self._collect_missing(texts, cached)
+        computed: dict[str, list[float]] = (
+            dict(zip(missing_texts, await compute(missing_texts), strict=True)) if missing_texts else {}
+        )
+
+        if computed:
+            try:
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    for text, vector in computed.items():
+                        pipe.set(self._build_key(key_prefix, text), _encode(vector), ex=self._ttl_seconds)
+                    await pipe.execute()
+            except RedisError:
+                logger.exception("Failed to cache embeddings")
+
+        return self._merge(texts, cached, computed)
+
+    def _collect_missing(self, texts: Sequence[str], cached: Sequence[bytes | None]) -> list[str]:
+        missing_texts: list[str] = list(dict.fromkeys(text for text, raw in zip(texts, cached, strict=True) if not raw))
+
+        hits: int = sum(1 for raw in cached if raw)
+        self._stats.hits += hits
+        self._stats.misses += len(texts) - hits
+        logger.debug(
+            "Embedding cache: %d of %d texts cached, %d sent to the model, hit_ratio=%.3f",
+            hits,
+            len(texts),
+            len(missing_texts),
+            self._stats.hit_ratio,
+        )
+
+        return missing_texts
+
+    @staticmethod
+    def _merge(
+        texts: Sequence[str],
+        cached: Sequence[bytes | None],
+        computed: dict[str, list[float]],
+    ) -> list[list[float]]:
+        return [_decode(raw) if raw else computed[text] for text, raw in zip(texts, cached, strict=True)]
+
+    @staticmethod
+    def _build_key(key_prefix: str, text: str) -> str:
+        return key_prefix + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _encode(vector: list[float]) -> bytes:
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _decode(raw: bytes) -> list[float]:
+    return np.frombuffer(raw, dtype=np.float32).tolist()
@@ -0,0 +1,234 @@
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Final, override
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+_INVALIDATION_SEPARATOR: Final[bytes] = b"\0"
+
+
+@dataclass(slots=True, kw_only=True)
+class _LocalEntry:
+    value: bytes
+    expires_at: float
+    remote_expires_at: float | None
+
+
+class LocalLRUCacheStore(CacheStore):
+    """
+    In-process LRU in front of another (remote) cache store.
+
+    The cache is bounded by the total size of stored values; values bigger than
+    ``max_entry_bytes`` are not kept locally. Each value lives locally at most
+    ``ttl_seconds``, which bounds staleness if an invalidation message is lost,
+    and never longer than it has left to live in the remote store.
+
+    Writes and deletes are published to ``channel`` so other replicas drop
+    their local copies. redis-py restores a broken subscription silently, so the
+    local cache is cleared on every subscribe confirmation, as invalidations
+    published while it was down are lost. If the subscription fails for good,
+    the local cache is cleared and bypassed.
+    """
+
+    def __init__(
+        self,
+        cache_store: CacheStore,
+        redis_client: Redis,
+        channel: str,
+        max_bytes: int,
+        max_entry_bytes: int,
+        ttl_seconds: int,
+    ) -> None:
+        self._cache_store: Final[CacheStore] = cache_store
+        self._redis_client: Final[Redis] = redis_client
+        self._channel: Final[str] = channel
+        self._max_bytes: Final[int] = max_bytes
+        self._max_entry_bytes: Final[int] = min(max_entry_bytes, max_bytes)
+        self._ttl_seconds: Final[int] = ttl_seconds
+
+        self._entries: Final[OrderedDict[str, _LocalEntry]] = OrderedDict()
+        self._size: int = 0
+        self._invalidations: int = 0
+        self._instance_id: Final[bytes] = uuid4().hex.encode()
+
+        self._listener: asyncio.Task[None] | None = None
+        self._listener_lock: Final[asyncio.Lock] = asyncio.Lock()
+
+    @override
+    async def set(self, name: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        await self.set_many({name: value}, ttl=ttl, tags=tags)
+
+    @override
+    async def get(
+        self,
+        name: str,
+    ) -> bytes | None:
+        [value] = await self.get_many([name])
+        return value
+
+    @override
+    async def delete(self, name: str) -> None:
+        await self.delete_many([name])
+
+    @override
+    async def set_many(self, values: Mapping[str, bytes], ttl: int, tags: Iterable[str] = ()) -> None:
+        await self._cache_store.set_many(values, ttl=ttl, tags=tags)
+
+        if self._is_listening():
+            for name, value in values.items():
+                self._put(name, value, ttl)
+
+        await self._publish_invalidation(values.keys())
+
+    @override
+    async def get_many(self, names: Sequence[str]) -> list[bytes | None]:
+        return [value for value, _ in await self.get_many_with_ttl(names)]
+
+    @override
+    async def get_many_with_ttl(self, names: Sequence[str]) -> list[tuple[bytes | None, float | None]]:
+        if not await self._ensure_listener():
+            return await self._cache_store.get_many_with_ttl(names)
+
+        values: dict[str, tuple[bytes | None, float | None]] = {}
+        now: float = time.monotonic()
+
+        for name in names:
+            entry: _LocalEntry | None = self._entries.get(name)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(name)
+                values[name] = (
+                    entry.value,
+                    entry.remote_expires_at - now if entry.remote_expires_at is not None else None,
+                )
+            elif entry is not None:
+                self._pop(name)
+
+        missing: list[str] = [name for name in dict.fromkeys(names) if name not in values]
+        if missing:
+            invalidations_before: int = self._invalidations
+            remote_values: list[tuple[bytes | None, float | None]] = await self._cache_store.get_many_with_ttl(missing)
+
+            for name, (value, remote_ttl) in zip(missing, remote_values, strict=True):
+                values[name] = (value, remote_ttl)
+                # A value read while some key was invalidated may already be outdated
+                if value is not None and invalidations_before == self._invalidations:
+                    self._put(name, value, remote_ttl)
+
+        return [values[name] for name in names]
+
+    @override
+    async def delete_many(self, names: Iterable[str]) -> None:
+        names = list(names)
+        await self._cache_store.delete_many(names)
+        self._pop_many(names)
+        await self._publish_invalidation(names)
+
+    @override
+    async def delete_by_tags(self, tags: Iterable[str]) -> frozenset[str]:
+        names: frozenset[str] = await self._cache_store.delete_by_tags(tags)
+        self._pop_many(names)
+        await self._publish_invalidation(names)
+        return names
+
+    async def aclose(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+
+    def _put(self, name: str, value: bytes, remote_ttl: float | None) -> None:
+        self._pop(name)
+
+        if len(value) > self._max_entry_bytes or (remote_ttl is not None and remote_ttl <= 0):
+            return
+
+        while self._size + len(value) > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.value)
+
+        now: float = time.monotonic()
+        remote_expires_at: float | None = now + remote_ttl if remote_ttl is not None else None
+        self._entries[name] = _LocalEntry(
+            value=value,
+            expires_at=min(now + self._ttl_seconds, remote_expires_at or math.inf),
+            remote_expires_at=remote_expires_at,
+        )
+        self._size += len(value)
+
+    def _pop_many(self, names: Iterable[str]) -> None:
+        for name in names:
+            self._pop(name)
+        self._invalidations += 1
+
+    def _pop(self, name: str) -> None:
+        entry: _LocalEntry | None = self._entries.pop(name, None)
+        if entry is not None:
+            self._size -= len(entry.value)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+        self._invalidations += 1
+
+    async def _publish_invalidation(self, names: Iterable[str]) -> None:
+        message: bytes = _INVALIDATION_SEPARATOR.join([self._instance_id, *(name.encode() for name in names)])
+
+        try:
+            await self._redis_client.publish(self._channel, message)
+        except RedisError:
+            logger.exception("Failed to publish cache invalidation, other replicas will see it after local TTL")
+
+    def _is_listening(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    async def _ensure_listener(self) -> bool:
+        if self._is_listening():
+            return True
+
+        async with self._listener_lock:
+            if self._is_listening():
+                return True
+
+            try:
+                # subscribe confirmations are kept, they tell that the connection was restored
+                pubsub: PubSub = self._redis_client.pubsub()
+                await pubsub.subscribe(self._channel)
+            except RedisError:
+                logger.exception("Failed to subscribe to cache invalidations, serving without local cache")
+                return False
+
+            self._clear()
+            self._listener = asyncio.create_task(self._listen(pubsub))
+            return True
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    logger.debug("Subscribed to cache invalidations, clearing local cache")
+                    self._clear()
+                    continue
+                if message["type"] != "message":
+                    continue
+
+                instance_id, *names = message["data"].split(_INVALIDATION_SEPARATOR)
+                if instance_id != self._instance_id:
+                    self._pop_many(name.decode() for name in names)
+        except RedisError:
+            logger.exception("Lost subscription to cache invalidations, clearing local cache")
+        finally:
+            self._clear()
+            await pubsub.aclose()
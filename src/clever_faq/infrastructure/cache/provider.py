@@ -1,8 +1,25 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 
+from langchain_core.embeddings import Embeddings
+from redis import Redis as SyncRedis
 from redis.asyncio import ConnectionPool, Redis
 
-from clever_faq.setup.config.cache import RedisConfig
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.infrastructure.cache.cached_embeddings import CachedEmbeddings
+from clever_faq.infrastructure.cache.local_cache_store import LocalLRUCacheStore
+from clever_faq.infrastructure.cache.retrieval_cache import RetrievalCache
+from clever_faq.infrastructure.cache.semantic_answer_index import RedisSemanticAnswerIndex
+from clever_faq.infrastructure.cache.single_flight import RedisSingleFlight
+from clever_faq.infrastructure.cache.stats import (
+    EmbeddingCacheStats,
+    RetrievalCacheStats,
+    SemanticCacheStats,
+    SingleFlightStats,
+)
+from clever_faq.setup.config.cache import AnswerCacheConfig, RedisConfig
+from clever_faq.setup.config.openai import OpenAISettings
+from clever_faq.setup.config.retrieval import RetrievalConfig
 
 
 async def get_redis_pool(redis_config: RedisConfig) -> ConnectionPool:
@@ -14,8 +31,136 @@ async def get_redis_pool(redis_config: RedisConfig) -> ConnectionPool:
 
 
 async def get_redis(connection_pool: ConnectionPool) -> AsyncIterator[Redis]:
+    """
+    One client per process: the client is a thin wrapper over the pool
+    and is safe to share between concurrent requests.
+    """
     client: Redis = Redis.from_pool(connection_pool=connection_pool)
     try:
         yield client
     finally:
         await client.aclose()
+
+
+def get_sync_redis(redis_config: RedisConfig) -> Iterator[SyncRedis]:
+    """
+    For code that LangChain calls synchronously, e.g. embeddings inside a vector store.
+    """
+    client: SyncRedis = SyncRedis.from_url(
+        url=redis_config.cache_uri,
+        max_connections=redis_config.max_connections,
+        decode_responses=False,
+    )
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+async def get_local_cache_store(
+    cache_store: CacheStore,
+    redis_client: Redis,
+    redis_config: RedisConfig,
+) -> AsyncIterator[CacheStore]:
+    if redis_config.local_cache_max_bytes == 0:
+        yield cache_store
+        return
+
+    local_cache_store: LocalLRUCacheStore = LocalLRUCacheStore(
+        cache_store=cache_store,
+        redis_client=redis_client,
+        channel="cache:invalidations",
+        max_bytes=redis_config.local_cache_max_bytes,
+        max_entry_bytes=redis_config.local_cache_max_entry_bytes,
+        ttl_seconds=redis_config.local_cache_ttl_seconds,
+    )
+    try:
+        yield local_cache_store
+    finally:
+        await local_cache_store.aclose()
+
+
+def get_semantic_answer_index(
+    redis_client: Redis,
+    cache: CacheStore,
+    answer_cache_config: AnswerCacheConfig,
+    openai_config: OpenAISettings,
+) -> RedisSemanticAnswerIndex:
+    return RedisSemanticAnswerIndex(
+        redis_client=redis_client,
+        cache=cache,
+        namespace=(
+            f"answer_cache:semantic:{openai_config.embeddings.model}:{openai_config.embeddings.dimensions or 'default'}"
+        ),
+        max_entries=answer_cache_config.semantic_max_entries,
+        sync_interval_seconds=answer_cache_config.semantic_sync_interval_seconds,
+    )
+
+
+def get_semantic_cache_stats() -> SemanticCacheStats:
+    return SemanticCacheStats()
+
+
+def get_single_flight_stats() -> SingleFlightStats:
+    return SingleFlightStats()
+
+
+async def get_single_flight(
+    redis_client: Redis,
+    answer_cache_config: AnswerCacheConfig,
+    stats: SingleFlightStats,
+) -> AsyncIterator[RedisSingleFlight]:
+    single_flight: RedisSingleFlight = RedisSingleFlight(
+        redis_client=redis_client,
+        namespace="answer_cache:single_flight",
+        lock_ttl_seconds=answer_cache_config.single_flight_lock_ttl_seconds,
+        stats=stats,
+    )
+    try:
+        yield single_flight
+    finally:
+        await single_flight.aclose()
+
+
+def get_embedding_cache_stats() -> EmbeddingCacheStats:
+    return EmbeddingCacheStats()
+
+
+def get_cached_embeddings(
+    embeddings: Embeddings,
+    redis_client: Redis,
+    sync_redis_client: SyncRedis,
+    stats: EmbeddingCacheStats,
+    redis_config: RedisConfig,
+    openai_config: OpenAISettings,
+) -> Embeddings:
+    if redis_config.embedding_cache_ttl_seconds == 0:
+        return embeddings
+
+    return CachedEmbeddings(
+        embeddings=embeddings,
+        redis_client=redis_client,
+        sync_redis_client=sync_redis_client,
+        namespace=f"embedding:{openai_config.embeddings.model}:{openai_config.embeddings.dimensions or 'default'}",
+        ttl_seconds=redis_config.embedding_cache_ttl_seconds,
+        stats=stats,
+    )
+
+
+def get_retrieval_cache_stats() -> RetrievalCacheStats:
+    return RetrievalCacheStats()
+
+
+def get_retrieval_cache(
+    cache: CacheStore,
+    knowledge_base_generation: KnowledgeBaseGeneration,
+    stats: RetrievalCacheStats,
+    retrieval_config: RetrievalConfig,
+) -> RetrievalCache:
+    return RetrievalCache(
+        cache=cache,
+        knowledge_base_generation=knowledge_base_generation,
+        settings_version=retrieval_config.model_dump_json(),
+        ttl_seconds=retrieval_config.cache_ttl_seconds,
+        stats=stats,
+    )
@@ -0,0 +1,56 @@
+import logging
+from typing import Final, override
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.application.common.ports.question.answer_cache_invalidator import AnswerCacheInvalidator
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.infrastructure.cache.answer_tags import UNANSWERED_TAG, document_tag
+from clever_faq.infrastructure.cache.retrieval_cache import RETRIEVAL_RESULTS_TAG
+from clever_faq.infrastructure.errors.cache import CacheError
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class RedisAnswerCacheInvalidator(AnswerCacheInvalidator):
+    """
+    Invalidation is best effort: it runs after the document is indexed, so a Redis
+    error must not fail the indexing. When tagged entries can't be deleted,
+    the knowledge base generation is bumped instead, and if Redis is down for that
+    too, stale answers live until their TTL.
+    """
+
+    def __init__(
+        self,
+        cache: CacheStore,
+        knowledge_base_generation: KnowledgeBaseGeneration,
+    ) -> None:
+        self._cache: Final[CacheStore] = cache
+        self._knowledge_base_generation: Final[KnowledgeBaseGeneration] = knowledge_base_generation
+
+    @override
+    async def invalidate_document(self, document_id: DocumentID) -> None:
+        # a changed document may belong to the retrieval results of any question
+        try:
+            deleted: frozenset[str] = await self._cache.delete_by_tags(
+                [document_tag(document_id), UNANSWERED_TAG, RETRIEVAL_RESULTS_TAG]
+            )
+        except CacheError:
+            logger.exception("Failed to invalidate cached answers after change of document %s", document_id)
+            await self._bump_generation()
+            return
+
+        logger.info(
+            "Invalidated %d cached answers and retrieval results after change of document %s", len(deleted), document_id
+        )
+
+    async def _bump_generation(self) -> None:
+        try:
+            await self.invalidate_all()
+        except CacheError:
+            logger.exception("Failed to bump knowledge base generation, stale answers expire with their TTL")
+
+    @override
+    async def invalidate_all(self) -> None:
+        generation: int = await self._knowledge_base_generation.bump()
+        logger.info("Invalidated all cached answers, knowledge base moved to generation %s", generation)
@@ -1,25 +1,124 @@
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Final, cast, override
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
 
 from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.infrastructure.errors.cache import CacheError
+
+TAG_KEY_PREFIX: Final[str] = "cache:tag:"
 
 
 class RedisCacheStore(CacheStore):
+    """
+    Each tag is a Redis set of value names. A tag set lives as long as
+    the longest-living value added to it, so it never outlives its values
+    for long and never loses a value that is still cached.
+    """
+
     def __init__(self, redis_client: Redis) -> None:
         self._redis_client: Final[Redis] = redis_client
 
     @override
-    async def set(self, name: str, value: bytes, ttl: int = 30) -> None:
-        await self._redis_client.set(name=name, value=value, ex=ttl)
+    async def set(self, name: str, value: bytes, ttl: int = 30, tags: Iterable[str] = ()) -> None:
+        await self.set_many({name: value}, ttl=ttl, tags=tags)
 
     @override
     async def get(
         self,
         name: str,
-    ) -> bytes:
-        return cast("bytes", await self._redis_client.get(name=name))
+    ) -> bytes | None:
+        try:
+            return cast("bytes | None", await self._redis_client.get(name=name))
+        except RedisError as e:
+            msg = f"Failed to get {name} from cache"
+            raise CacheError(msg) from e
 
     @override
     async def delete(self, name: str) -> None:
-        await self._redis_client.delete(name)
+        await self.delete_many([name])
+
+    @override
+    async def set_many(self, values: Mapping[str, bytes], ttl: int, tags: Iterable[str] = ()) -> None:
+        if not values:
+            return
+
+        try:
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    self._tag(pipe, tag, values.keys(), ttl)
+                for name, value in values.items():
+                    pipe.set(name=name, value=value, ex=ttl)
+                await pipe.execute()
+        except RedisError as e:
+            msg = "Failed to save values to cache"
+            raise CacheError(msg) from e
+
+    @override
+    async def get_many(self, names: Sequence[str]) -> list[bytes | None]:
+        if not names:
+            return []
+
+        try:
+            return cast("list[bytes | None]", await self._redis_client.mget(names))
+        except RedisError as e:
+            msg = "Failed to get values from cache"
+            raise CacheError(msg) from e
+
+    @override
+    async def get_many_with_ttl(self, names: Sequence[str]) -> list[tuple[bytes | None, float | None]]:
+        if not names:
+            return []
+
+        try:
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                pipe.mget(names)
+                for name in names:
+                    pipe.pttl(name)
+                values, *ttls_ms = await pipe.execute()
+        except RedisError as e:
+            msg = "Failed to get values from cache"
+            raise CacheError(msg) from e
+
+        # PTTL is -1 for a value without expiration and -2 for a missing one
+        return [(value, ttl_ms / 1000 if ttl_ms >= 0 else None) for value, ttl_ms in zip(values, ttls_ms, strict=True)]
+
+    @override
+    async def delete_many(self, names: Iterable[str]) -> None:
+        names = list(names)
+        if not names:
+            return
+
+        try:
+            await self._redis_client.unlink(*names)
+        except RedisError as e:
+            msg = "Failed to delete values from cache"
+            raise CacheError(msg) from e
+
+    @override
+    async def delete_by_tags(self, tags: Iterable[str]) -> frozenset[str]:
+        tag_keys: list[str] = [TAG_KEY_PREFIX + tag for tag in tags]
+        if not tag_keys:
+            return frozenset()
+
+        try:
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                pipe.sunion(tag_keys)
+                pipe.unlink(*tag_keys)
+                raw_names, _ = await pipe.execute()
+        except RedisError as e:
+            msg = "Failed to read cache tags"
+            raise CacheError(msg) from e
+
+        names: frozenset[str] = frozenset(raw_name.decode() for raw_name in raw_names)
+        await self.delete_many(names)
+        return names
+
+    @staticmethod
+    def _tag(pipe: Pipeline, tag: str, names: Iterable[str], ttl: int) -> None:
+        tag_key: str = TAG_KEY_PREFIX + tag
+        pipe.sadd(tag_key, *names)
+        pipe.expire(tag_key, ttl, nx=True)
+        pipe.expire(tag_key, ttl, gt=True)
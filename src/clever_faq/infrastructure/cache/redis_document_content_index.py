@@ -0,0 +1,58 @@
+import logging
+from typing import Final, override
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
+from clever_faq.domain.document.values.document_id import DocumentID
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+DOCUMENT_CONTENT_KEY_PREFIX: Final[str] = "document:content:"
+
+# compare-and-delete, a hash taken over by another document in the meantime is kept
+_RELEASE_SCRIPT: Final[str] = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisDocumentContentIndex(DocumentContentIndex):
+    """
+    Keeps ``document:content:{sha256}`` keys holding document ids, without expiry.
+    ``SET NX GET`` registers the hash and reads the current holder in one atomic step,
+    so concurrent uploads of the same content agree on a single document.
+    ``release`` deletes the key with a Lua compare-and-delete, only while it holds the given id.
+
+    Deduplication is best effort: when Redis is unavailable the new document is kept.
+    """
+
+    def __init__(self, redis_client: Redis) -> None:
+        self._redis_client: Final[Redis] = redis_client
+
+    @override
+    async def claim(self, content_hash: str, document_id: DocumentID) -> DocumentID:
+        try:
+            holder: bytes | None = await self._redis_client.set(
+                DOCUMENT_CONTENT_KEY_PREFIX + content_hash, document_id.bytes, nx=True, get=True
+            )
+        except RedisError:
+            logger.exception("Failed to claim content hash %s for document %s", content_hash, document_id)
+            return document_id
+
+        if holder is None:
+            return document_id
+
+        return DocumentID(UUID(bytes=holder))
+
+    @override
+    async def release(self, content_hash: str, document_id: DocumentID) -> None:
+        key: str = DOCUMENT_CONTENT_KEY_PREFIX + content_hash
+        try:
+            await self._redis_client.eval(_RELEASE_SCRIPT, 1, key, document_id.bytes)  # type: ignore[arg-type, misc]
+        except RedisError:
+            logger.exception("Failed to release content hash %s of document %s", content_hash, document_id)
@@ -0,0 +1,55 @@
+import logging
+from typing import Final, override
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from clever_faq.application.common.ports.document.indexing_checkpoint_store import IndexingCheckpointStore
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.setup.config.cache import RedisConfig
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+INDEXING_CHECKPOINT_KEY_PREFIX: Final[str] = "document:indexing:"
+
+
+class RedisIndexingCheckpointStore(IndexingCheckpointStore):
+    """
+    Keeps ``document:indexing:{document_id}`` keys holding the number of indexed chunks.
+    Every save extends the key lifetime, so only abandoned indexings expire.
+
+    Checkpoints are best effort: without Redis the document is indexed from the start,
+    which is still correct as chunks are upserted under deterministic ids.
+    """
+
+    def __init__(self, redis_client: Redis, redis_config: RedisConfig) -> None:
+        self._redis_client: Final[Redis] = redis_client
+        self._ttl_seconds: Final[int] = redis_config.indexing_checkpoint_ttl_seconds
+
+    @override
+    async def read(self, document_id: DocumentID) -> int:
+        try:
+            indexed_chunks: bytes | None = await self._redis_client.get(self._build_key(document_id))
+        except RedisError:
+            logger.exception("Failed to read indexing checkpoint of document %s", document_id)
+            return 0
+
+        return int(indexed_chunks) if indexed_chunks is not None else 0
+
+    @override
+    async def save(self, document_id: DocumentID, indexed_chunks: int) -> None:
+        try:
+            await self._redis_client.set(self._build_key(document_id), indexed_chunks, ex=self._ttl_seconds)
+        except RedisError:
+            logger.exception("Failed to save indexing checkpoint of document %s", document_id)
+
+    @override
+    async def delete(self, document_id: DocumentID) -> None:
+        try:
+            await self._redis_client.delete(self._build_key(document_id))
+        except RedisError:
+            logger.exception("Failed to delete indexing checkpoint of document %s", document_id)
+
+    @staticmethod
+    def _build_key(document_id: DocumentID) -> str:
+        return f"{INDEXING_CHECKPOINT_KEY_PREFIX}{document_id}"
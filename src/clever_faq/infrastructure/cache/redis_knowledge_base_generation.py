@@ -0,0 +1,32 @@
+from typing import Final, override
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.infrastructure.errors.cache import CacheError
+
+KNOWLEDGE_BASE_GENERATION_KEY: Final[str] = "knowledge_base:generation"
+
+
+class RedisKnowledgeBaseGeneration(KnowledgeBaseGeneration):
+    def __init__(self, redis_client: Redis) -> None:
+        self._redis_client: Final[Redis] = redis_client
+
+    @override
+    async def current(self) -> int:
+        try:
+            raw_generation: bytes | None = await self._redis_client.get(KNOWLEDGE_BASE_GENERATION_KEY)
+        except RedisError as e:
+            msg = "Failed to read knowledge base generation"
+            raise CacheError(msg) from e
+
+        return int(raw_generation) if raw_generation is not None else 0
+
+    @override
+    async def bump(self) -> int:
+        try:
+            return int(await self._redis_client.incr(KNOWLEDGE_BASE_GENERATION_KEY))
+        except RedisError as e:
+            msg = "Failed to bump knowledge base generation"
+            raise CacheError(msg) from e
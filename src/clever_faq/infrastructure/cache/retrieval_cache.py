@@ -0,0 +1,103 @@
+import hashlib
+import logging
+from collections.abc import Sequence
+from typing import Any, Final
+
+import numpy as np
+import ormsgpack
+from langchain_core.documents import Document as LangchainDocument
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.infrastructure.cache.stats import RetrievalCacheStats
+from clever_faq.infrastructure.errors.cache import CacheError
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+RETRIEVAL_RESULTS_TAG: Final[str] = "retrieval:results"
+
+# chunk id, text, metadata
+type _ChunkRecord = tuple[str | None, str, dict[str, Any]]
+
+
+class RetrievalCache:
+    """
+    Keeps chunks retrieved for a question embedding under
+    ``retrieval:{sha256 of the embedding and the settings}:{knowledge base generation}``,
+    so a question answered again, e.g. after a prompt change, skips the searches.
+
+    All entries are tagged with ``RETRIEVAL_RESULTS_TAG`` and dropped together whenever
+    a document changes, as any new chunk may belong to the results of any question.
+
+    The cache is best effort: on Redis errors the chunks are retrieved again.
+    """
+
+    def __init__(
+        self,
+        cache: CacheStore,
+        knowledge_base_generation: KnowledgeBaseGeneration,
+        settings_version: str,
+        ttl_seconds: int,
+        stats: RetrievalCacheStats,
+    ) -> None:
+        self._cache: Final[CacheStore] = cache
+        self._knowledge_base_generation: Final[KnowledgeBaseGeneration] = knowledge_base_generation
+        self._settings_version: Final[bytes] = settings_version.encode()
+        self._ttl_seconds: Final[int] = ttl_seconds
+        self._stats: Final[RetrievalCacheStats] = stats
+
+    async def build_key(self, embedding: Sequence[float]) -> str | None:
+        """
+        :return: Key of the results, ``None`` when the knowledge base generation is unknown
+        """
+        try:
+            generation: int = await self._knowledge_base_generation.current()
+        except CacheError:
+            logger.exception("Failed to read knowledge base generation for retrieval cache")
+            return None
+
+        embedding_hash: str = hashlib.sha256(
+            np.asarray(embedding, dtype=np.float32).tobytes() + b"\0" + self._settings_version
+        ).hexdigest()
+
+        return f"retrieval:{embedding_hash}:{generation}"
+
+    async def get(self, key: str) -> list[LangchainDocument] | None:
+        try:
+            cached_bytes: bytes | None = await self._cache.get(key)
+        except CacheError:
+            logger.exception("Failed to read cached retrieval results")
+            return None
+
+        documents: list[LangchainDocument] | None = _decode(cached_bytes) if cached_bytes else None
+
+        if documents is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        logger.debug(
+            "Retrieval cache %s, hit_ratio=%.3f", "hit" if documents is not None else "miss", self._stats.hit_ratio
+        )
+
+        return documents
+
+    async def set(self, key: str, documents: Sequence[LangchainDocument]) -> None:
+        records: list[_ChunkRecord] = [
+            (document.id, document.page_content, document.metadata) for document in documents
+        ]
+
+        try:
+            await self._cache.set(key, ormsgpack.packb(records), ttl=self._ttl_seconds, tags=[RETRIEVAL_RESULTS_TAG])
+        except (CacheError, TypeError):
+            logger.exception("Failed to cache retrieval results")
+
+
+def _decode(cached_bytes: bytes) -> list[LangchainDocument] | None:
+    try:
+        records: list[_ChunkRecord] = ormsgpack.unpackb(cached_bytes)
+        return [
+            LangchainDocument(id=chunk_id, page_content=text, metadata=metadata) for chunk_id, text, metadata in records
+        ]
+    except (ormsgpack.MsgpackDecodeError, TypeError, ValueError):
+        logger.warning("Failed to decode cached retrieval results")
+        return None
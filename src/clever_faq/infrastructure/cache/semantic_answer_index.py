@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Final, cast
+from uuid import uuid4
+
+import numpy as np
+from numpy.typing import NDArray
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.infrastructure.cache.answer_tags import answer_tags
+from clever_faq.infrastructure.errors.cache import CacheError
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+_SYNC_BATCH_SIZE: Final[int] = 500
+_SYNC_CLOCK_SKEW_SECONDS: Final[float] = 5.0
+_INITIAL_CAPACITY: Final[int] = 64
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SemanticNeighbour:
+    entry_id: str
+    similarity: float
+
+
+class RedisSemanticAnswerIndex:
+    """
+    Nearest-neighbour index over embeddings of already answered questions.
+
+    Search runs in process as a cosine scan over a NumPy matrix of unit vectors.
+    Redis keeps the persistent copy shared by all replicas:
+
+    - ``{namespace}:entries`` - sorted set, entry id scored by creation time;
+    - ``{namespace}:vectors`` - hash, entry id to float32 vector bytes;
+    - ``{namespace}:answer:{entry_id}`` - encoded answer kept in the cache store,
+      expires with the answer TTL and is tagged with the documents it was built from.
+
+    Every ``sync_interval_seconds`` the local copy pulls entries created since the
+    previous sync, so answers cached by other replicas become reusable here too.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        cache: CacheStore,
+        namespace: str,
+        max_entries: int,
+        sync_interval_seconds: float,
+    ) -> None:
+        self._redis_client: Final[Redis] = redis_client
+        self._cache: Final[CacheStore] = cache
+        self._entries_key: Final[str] = f"{namespace}:entries"
+        self._vectors_key: Final[str] = f"{namespace}:vectors"
+        self._answer_key_prefix: Final[str] = f"{namespace}:answer:"
+        self._max_entries: Final[int] = max_entries
+        self._sync_interval_seconds: Final[float] = sync_interval_seconds
+
+        self._vectors: NDArray[np.float32] = np.empty((0, 0), dtype=np.float32)
+        self._created_at: NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+
+        self._sync_lock: Final[asyncio.Lock] = asyncio.Lock()
+        self._last_synced_score: float | None = None
+        self._last_synced_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def nearest(self, embedding: Sequence[float]) -> SemanticNeighbour | None:
+        await self._sync_if_due()
+
+        if not self._ids:
+            return None
+
+        query: NDArray[np.float32] | None = self._normalize(embedding)
+        if query is None or query.shape[0] != self._vectors.shape[1]:
+            return None
+
+        similarities: NDArray[np.float32] = self._vectors[: len(self._ids)] @ query
+        best: int = int(np.argmax(similarities))
+
+        return SemanticNeighbour(entry_id=self._ids[best], similarity=float(similarities[best]))
+
+    async def read_answer(self, entry_id: str) -> bytes | None:
+        payload: bytes | None = await self._cache.get(self._answer_key_prefix + entry_id)
+
+        if payload is None:
+            logger.debug("Semantic cache entry %s expired, forgetting it", entry_id)
+            await self.discard(entry_id)
+
+        return payload
+
+    async def add(
+        self,
+        embedding: Sequence[float],
+        answer: bytes,
+        ttl: int,
+        source_document_ids: Iterable[DocumentID],
+    ) -> None:
+        vector: NDArray[np.float32] | None = self._normalize(embedding)
+        if vector is None:
+            return
+
+        entry_id: str = uuid4().hex
+        created_at: float = time.time()
+
+        await self._cache.set(
+            self._answer_key_prefix + entry_id, answer, ttl=ttl, tags=answer_tags(source_document_ids)
+        )
+
+        try:
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(self._vectors_key, mapping={entry_id: vector.tobytes()})
+                pipe.zadd(self._entries_key, {entry_id: created_at})
+                pipe.zcard(self._entries_key)
+                *_, entries_count = await pipe.execute()
+
+            if entries_count > self._max_entries:
+                evicted = await self._redis_client.zpopmin(self._entries_key, entries_count - self._max_entries)
+                await self._delete_remote([raw_id.decode() for raw_id, _ in evicted])
+        except RedisError as e:
+            msg = "Failed to add answer to semantic cache"
+            raise CacheError(msg) from e
+
+        self._append(entry_id, vector, created_at)
+
+    async def discard(self, entry_id: str) -> None:
+        position: int | None = self._positions.get(entry_id)
+        if position is not None:
+            self._remove_at(position)
+
+        try:
+            await self._delete_remote([entry_id])
+        except (RedisError, CacheError):
+            logger.exception("Failed to remove semantic cache entry %s", entry_id)
+
+    async def _sync_if_due(self) -> None:
+        if self._last_synced_at is not None and (time.monotonic() - self._last_synced_at < self._sync_interval_seconds):
+            return
+
+        async with self._sync_lock:
+            if self._last_synced_at is not None and (
+                time.monotonic() - self._last_synced_at < self._sync_interval_seconds
+            ):
+                return
+
+            min_score: str = (
+                "-inf" if self._last_synced_score is None else str(self._last_synced_score - _SYNC_CLOCK_SKEW_SECONDS)
+            )
+
+            try:
+                entries: list[tuple[bytes, float]] = await self._redis_client.zrangebyscore(
+                    self._entries_key, min_score, "+inf", withscores=True
+                )
+                new_entries: list[tuple[str, float]] = [
+                    (raw_id.decode(), score) for raw_id, score in entries if raw_id.decode() not in self._positions
+                ]
+
+                for start in range(0, len(new_entries), _SYNC_BATCH_SIZE):
+                    batch: list[tuple[str, float]] = new_entries[start : start + _SYNC_BATCH_SIZE]
+                    raw_vectors: list[bytes | None] = await cast(
+                        "Awaitable[list[bytes | None]]",
+                        self._redis_client.hmget(self._vectors_key, [entry_id for entry_id, _ in batch]),
+                    )
+                    for (entry_id, score), raw_vector in zip(batch, raw_vectors, strict=True):
+                        if raw_vector is not None:
+                            self._append(entry_id, np.frombuffer(raw_vector, dtype=np.float32), score)
+            except RedisError:
+                logger.exception("Failed to sync semantic cache index, serving local copy")
+            else:
+                if entries:
+                    self._last_synced_score = max(score for _, score in entries)
+                logger.debug("Synced %d semantic cache entries, index size: %d", len(new_entries), len(self))
+            finally:
+                self._last_synced_at = time.monotonic()
+
+    def _append(self, entry_id: str, vector: NDArray[np.float32], created_at: float) -> None:
+        if entry_id in self._positions:
+            return
+
+        size: int = len(self._ids)
+
+        if size == 0 and self._vectors.shape[1] != vector.shape[0]:
+            self._vectors = np.empty((_INITIAL_CAPACITY, vector.shape[0]), dtype=np.float32)
+            self._created_at = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+
+        if vector.shape[0] != self._vectors.shape[1]:
+            logger.warning("Skipping semantic cache entry %s with unexpected dimensions", entry_id)
+            return
+
+        if size == self._vectors.shape[0]:
+            self._vectors = np.resize(self._vectors, (size * 2, self._vectors.shape[1]))
+            self._created_at = np.resize(self._created_at, size * 2)
+
+        self._vectors[size] = vector
+        self._created_at[size] = created_at
+        self._ids.append(entry_id)
+        self._positions[entry_id] = size
+
+        if len(self._ids) > self._max_entries:
+            self._remove_at(int(np.argmin(self._created_at[: len(self._ids)])))
+
+    def _remove_at(self, position: int) -> None:
+        last: int = len(self._ids) - 1
+        removed_id: str = self._ids[position]
+
+        if position != last:
+            moved_id: str = self._ids[last]
+            self._vectors[position] = self._vectors[last]
+            self._created_at[position] = self._created_at[last]
+            self._ids[position] = moved_id
+            self._positions[moved_id] = position
+
+        self._ids.pop()
+        del self._positions[removed_id]
+
+    async def _delete_remote(self, entry_ids: list[str]) -> None:
+        if not entry_ids:
+            return
+
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.zrem(self._entries_key, *entry_ids)
+            pipe.hdel(self._vectors_key, *entry_ids)
+            await pipe.execute()
+
+        await self._cache.delete_many(self._answer_key_prefix + entry_id for entry_id in entry_ids)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> NDArray[np.float32] | None:
+        vector: NDArray[np.float32] = np.asarray(embedding, dtype=np.float32)
+        norm: float = float(np.linalg.norm(vector))
+
+        if vector.ndim != 1 or norm == 0.0:
+            logger.warning("Can't index empty or malformed embedding")
+            return None
+
+        return vector / norm
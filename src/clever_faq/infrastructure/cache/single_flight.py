@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, Final
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from clever_faq.infrastructure.cache.stats import SingleFlightStats
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+_RELEASE_LOCK_SCRIPT: Final[str] = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSingleFlight:
+    """
+    Runs at most one computation per key at a time.
+
+    Inside a process concurrent callers with the same key share one future.
+    Across replicas the first caller takes a short Redis lock, the others
+    wait for a pub/sub notification and read the result the leader stored
+    (e.g. in cache) via ``read_result``. If the leader does not finish within
+    the lock TTL, waiters compute the result themselves.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        namespace: str,
+        lock_ttl_seconds: float,
+        stats: SingleFlightStats,
+    ) -> None:
+        self._redis_client: Final[Redis] = redis_client
+        self._lock_prefix: Final[str] = f"{namespace}:lock:"
+        self._done_prefix: Final[str] = f"{namespace}:done:"
+        self._lock_ttl_seconds: Final[float] = lock_ttl_seconds
+        self._stats: Final[SingleFlightStats] = stats
+        self._release_lock = redis_client.register_script(_RELEASE_LOCK_SCRIPT)
+
+        self._in_flight: Final[dict[str, asyncio.Future[Any]]] = {}
+        self._waiters: Final[dict[str, asyncio.Event]] = {}
+        self._listener: asyncio.Task[None] | None = None
+        self._listener_lock: Final[asyncio.Lock] = asyncio.Lock()
+
+    async def run[T](
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        read_result: Callable[[], Awaitable[T | None]],
+    ) -> T:
+        in_flight: asyncio.Future[T] | None = self._in_flight.get(key)
+
+        if in_flight is not None:
+            await asyncio.wait((in_flight,))
+            if not in_flight.cancelled():
+                self._stats.coalesced_local += 1
+                logger.info("Coalesced call %s with the one in flight in this process", key)
+                return in_flight.result()
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            result: T = await self._run_across_replicas(key, compute, read_result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters are optional, mark the exception as retrieved
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def aclose(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+
+    async def _run_across_replicas[T](
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        read_result: Callable[[], Awaitable[T | None]],
+    ) -> T:
+        token: str = uuid4().hex
+
+        try:
+            acquired: bool | None = await self._redis_client.set(
+                self._lock_prefix + key, token, nx=True, px=int(self._lock_ttl_seconds * 1000)
+            )
+        except RedisError:
+            logger.exception("Failed to take single flight lock for %s, computing without it", key)
+            return await compute()
+
+        if acquired:
+            self._stats.leaders += 1
+            try:
+                return await compute()
+            finally:
+                await self._release(key, token)
+
+        result: T | None = await self._wait_for_leader(key, read_result)
+        if result is not None:
+            self._stats.coalesced_remote += 1
+            logger.info("Coalesced call %s with the one in flight on another replica", key)
+            return result
+
+        self._stats.wait_timeouts += 1
+        logger.warning("Another replica did not finish call %s in time, computing it here", key)
+        return await compute()
+
+    async def _wait_for_leader[T](self, key: str, read_result: Callable[[], Awaitable[T | None]]) -> T | None:
+        event: asyncio.Event = asyncio.Event()
+        self._waiters[key] = event
+
+        try:
+            await self._ensure_listener()
+
+            result: T | None = await read_result()
+            if result is not None:
+                return result
+
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self._lock_ttl_seconds):
+                    await event.wait()
+
+            return await read_result()
+        except RedisError:
+            logger.exception("Failed to wait for single flight leader of %s", key)
+            return None
+        finally:
+            self._waiters.pop(key, None)
+
+    async def _release(self, key: str, token: str) -> None:
+        try:
+            await self._release_lock(keys=[self._lock_prefix + key], args=[token])
+            await self._redis_client.publish(self._done_prefix + key, b"")
+        except RedisError:
+            logger.exception("Failed to release single flight lock for %s", key)
+
+    async def _ensure_listener(self) -> None:
+        if self._listener is not None and not self._listener.done():
+            return
+
+        async with self._listener_lock:
+            if self._listener is not None and not self._listener.done():
+                return
+
+            pubsub: PubSub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.psubscribe(self._done_prefix + "*")
+            self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        try:
+            async for message in pubsub.listen():
+                key: str = message["channel"].decode().removeprefix(self._done_prefix)
+                event: asyncio.Event | None = self._waiters.get(key)
+                if event is not None:
+                    event.set()
+        except RedisError:
+            logger.exception("Single flight listener lost connection, it will be restarted on next wait")
+        finally:
+            await pubsub.aclose()
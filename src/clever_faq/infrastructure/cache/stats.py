@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, kw_only=True)
+class SemanticCacheStats:
+    """
+    Process-wide counters of the semantic answer cache.
+
+    A near hit is a miss whose closest neighbour was above the near-hit
+    threshold: it shows how many more LLM calls a lower threshold would save.
+    """
+
+    hits: int = 0
+    near_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.near_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass(slots=True, kw_only=True)
+class SingleFlightStats:
+    """
+    Process-wide counters of answer computations deduplication.
+
+    ``coalesced_local`` and ``coalesced_remote`` count calls that reused a result
+    computed by another request in this process or on another replica.
+    ``wait_timeouts`` count calls that waited for another replica in vain
+    and computed the result themselves.
+    """
+
+    leaders: int = 0
+    coalesced_local: int = 0
+    coalesced_remote: int = 0
+    wait_timeouts: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        return self.coalesced_local + self.coalesced_remote
+
+
+@dataclass(slots=True, kw_only=True)
+class EmbeddingCacheStats:
+    """
+    Process-wide counters of the embedding cache, one per embedded text.
+    Every miss is a text sent to the embedding model.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True, kw_only=True)
+class RetrievalCacheStats:
+    """
+    Process-wide counters of the retrieval results cache.
+    Every miss is a vector and a keyword search.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
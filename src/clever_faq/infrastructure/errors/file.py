@@ -2,3 +2,6 @@ from clever_faq.infrastructure.errors.base import InfrastructureError
 
 
 class CantReadFileError(InfrastructureError): ...
+
+
+class DocumentTooLargeError(InfrastructureError): ...
@@ -1,52 +1,97 @@
-import io
+import hashlib
 import logging
+import tempfile
 from datetime import UTC, datetime
-from typing import Any, Final, override
+from typing import IO, Any, Final, override
 
 from aiobotocore.client import AioBaseClient
+from aiobotocore.response import StreamingBody
 from botocore.exceptions import ClientError, EndpointConnectionError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from clever_faq.application.common.ports.document.document_storage import DocumentDTO, DocumentStorage
+from clever_faq.application.common.ports.document.document_storage import (
+    DocumentContentStream,
+    DocumentDTO,
+    DocumentStorage,
+    DocumentUploadDTO,
+    StoredDocumentDTO,
+)
 from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_name import DocumentName
 from clever_faq.domain.document.values.document_type import DocumentType
+from clever_faq.infrastructure.errors.file import DocumentTooLargeError
 from clever_faq.infrastructure.errors.persistence import FileStorageError
-from clever_faq.infrastructure.persistence.adapters.constants import DOWNLOAD_FILE_FAILED, UPLOAD_FILE_FAILED
+from clever_faq.infrastructure.persistence.adapters.constants import (
+    DELETE_FILE_FAILED,
+    DOWNLOAD_FILE_FAILED,
+    HEAD_FILE_FAILED,
+    UPLOAD_FILE_FAILED,
+)
 from clever_faq.setup.config.s3 import S3Config
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
+_DOWNLOAD_CHUNK_SIZE_BYTES: Final[int] = 1024 * 1024
+
+
+class _HashingPartReader:
+    """
+    Reads a document stream in parts of ``part_size`` bytes,
+    hashing and counting the content on the way.
+    """
+
+    def __init__(self, content: DocumentContentStream, part_size: int, max_size: int) -> None:
+        self._content: Final[DocumentContentStream] = content
+        self._part_size: Final[int] = part_size
+        self._max_size: Final[int] = max_size
+        self._digest: Final = hashlib.sha256()
+        self._size: int = 0
+
+    async def read_part(self) -> bytes:
+        """
+        :return: Next part, shorter than ``part_size`` only at the end of the stream
+        :raises DocumentTooLargeError: Stream is longer than ``max_size``
+        """
+        part: bytearray = bytearray()
+
+        while len(part) < self._part_size:
+            chunk: bytes = await self._content.read(self._part_size - len(part))
+            if not chunk:
+                break
+
+            self._size += len(chunk)
+            if self._size > self._max_size:
+                msg = f"Document is bigger than {self._max_size} bytes"
+                raise DocumentTooLargeError(msg)
+
+            self._digest.update(chunk)
+            part += chunk
+
+        return bytes(part)
+
+    def result(self) -> StoredDocumentDTO:
+        return StoredDocumentDTO(content_hash=self._digest.hexdigest(), size=self._size)
+
 
 class AiobotocoreDocumentStorage(DocumentStorage):
     def __init__(self, client: AioBaseClient, s3_config: S3Config) -> None:
         self._client: Final[AioBaseClient] = client
         self._bucket_name: Final[str] = s3_config.documents_bucket_name
+        self._max_upload_size_bytes: Final[int] = s3_config.max_upload_size_bytes
+        self._multipart_chunk_size_bytes: Final[int] = s3_config.multipart_chunk_size_bytes
+        self._read_spool_max_bytes: Final[int] = s3_config.read_spool_max_bytes
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-    )
     @override
-    async def add(self, document: DocumentDTO) -> None:
+    async def add(self, document: DocumentUploadDTO) -> StoredDocumentDTO:
+        s3_key: str = f"documents/{document.document_id!s}"
+        logger.debug("Build s3 key for storage: %s", s3_key)
+
         try:
-            s3_key: str = f"documents/{document.document_id!s}"
-            logger.debug("Build s3 key for storage: %s", s3_key)
-
-            await self._client.upload_fileobj(
-                io.BytesIO(document.document_content),
-                self._bucket_name,
-                s3_key,
-                ExtraArgs={
-                    "Metadata": {
-                        "original_filename": document.document_name.value,
-                        "document_type": document.document_type.value,
-                        "created_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                        "updated_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                    },
-                    "ContentType": "application/octet-stream",
-                },
-            )
+            stored_document: StoredDocumentDTO = await self._stream_to_storage(s3_key, document)
+
+        except DocumentTooLargeError:
+            logger.warning("Document %s exceeds %d bytes", document.document_id, self._max_upload_size_bytes)
+            raise
 
         except EndpointConnectionError as e:
             logger.exception(UPLOAD_FILE_FAILED)
@@ -60,6 +105,91 @@ class AiobotocoreDocumentStorage(DocumentStorage):
             logger.exception(UPLOAD_FILE_FAILED)
             raise FileStorageError(UPLOAD_FILE_FAILED) from e
 
+        logger.debug("Stored %d bytes for %s, sha256: %s", stored_document.size, s3_key, stored_document.content_hash)
+        return stored_document
+
+    async def _stream_to_storage(self, s3_key: str, document: DocumentUploadDTO) -> StoredDocumentDTO:
+        """
+        Uploads the content part by part, so at most one part is held in memory.
+        A document smaller than one part is sent with a single request.
+        """
+        reader: _HashingPartReader = _HashingPartReader(
+            document.document_content,
+            part_size=self._multipart_chunk_size_bytes,
+            max_size=self._max_upload_size_bytes,
+        )
+        object_args: dict[str, Any] = self._build_object_args(document)
+
+        part: bytes = await reader.read_part()
+
+        if len(part) < self._multipart_chunk_size_bytes:
+            await self._put_object(s3_key, part, object_args)
+            return reader.result()
+
+        response = await self._client.create_multipart_upload(Bucket=self._bucket_name, Key=s3_key, **object_args)
+        upload_id: str = response["UploadId"]
+
+        try:
+            parts: list[dict[str, Any]] = []
+
+            while part:
+                part_number: int = len(parts) + 1
+                etag: str = await self._upload_part(s3_key, upload_id, part_number, part)
+                parts.append({"ETag": etag, "PartNumber": part_number})
+                part = await reader.read_part()
+
+            await self._client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            await self._abort_multipart_upload(s3_key, upload_id)
+            raise
+
+        return reader.result()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    async def _put_object(self, s3_key: str, content: bytes, object_args: dict[str, Any]) -> None:
+        await self._client.put_object(Bucket=self._bucket_name, Key=s3_key, Body=content, **object_args)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    async def _upload_part(self, s3_key: str, upload_id: str, part_number: int, content: bytes) -> str:
+        response = await self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=s3_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=content,
+        )
+        return str(response["ETag"])
+
+    async def _abort_multipart_upload(self, s3_key: str, upload_id: str) -> None:
+        try:
+            await self._client.abort_multipart_upload(Bucket=self._bucket_name, Key=s3_key, UploadId=upload_id)
+        except Exception:
+            logger.exception("Failed to abort multipart upload %s for %s", upload_id, s3_key)
+
+    @staticmethod
+    def _build_object_args(document: DocumentUploadDTO) -> dict[str, Any]:
+        now: str = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return {
+            "Metadata": {
+                "original_filename": document.document_name.value,
+                "document_type": document.document_type.value,
+                "created_at": now,
+                "updated_at": now,
+            },
+            "ContentType": "application/octet-stream",
+        }
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
@@ -74,7 +204,7 @@ class AiobotocoreDocumentStorage(DocumentStorage):
             metadata: dict[str, Any] = response.get("Metadata", {})
             original_filename: str = metadata.get("original_filename", s3_key.split("/")[-1])
 
-            file_data = await response["Body"].read()
+            file_data: IO[bytes] = await self._spool(response["Body"])
 
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
@@ -95,3 +225,64 @@ class AiobotocoreDocumentStorage(DocumentStorage):
                 document_content=file_data,
                 document_type=DocumentType(metadata["document_type"]),
             )
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    @override
+    async def exists(self, document_id: DocumentID) -> bool:
+        s3_key: str = f"documents/{document_id!s}"
+        logger.debug("Build s3 key for storage: %s", s3_key)
+
+        try:
+            await self._client.head_object(Bucket=self._bucket_name, Key=s3_key)
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] in {"404", "NoSuchKey", "NotFound"}:
+                return False
+            logger.exception(HEAD_FILE_FAILED)
+            raise FileStorageError(HEAD_FILE_FAILED) from e
+        except EndpointConnectionError as e:
+            logger.exception(HEAD_FILE_FAILED)
+            raise FileStorageError(HEAD_FILE_FAILED) from e
+        else:
+            return True
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    @override
+    async def delete(self, document_id: DocumentID) -> None:
+        s3_key: str = f"documents/{document_id!s}"
+        logger.debug("Build s3 key for storage: %s", s3_key)
+
+        try:
+            await self._client.delete_object(Bucket=self._bucket_name, Key=s3_key)
+
+        except EndpointConnectionError as e:
+            logger.exception(DELETE_FILE_FAILED)
+            raise FileStorageError(DELETE_FILE_FAILED) from e
+
+        except ClientError as e:
+            logger.exception(DELETE_FILE_FAILED)
+            raise FileStorageError(DELETE_FILE_FAILED) from e
+
+    async def _spool(self, body: StreamingBody) -> IO[bytes]:
+        """
+        Copies the object body to a file kept in memory up to ``read_spool_max_bytes``
+        and rolled over to a temporary file on disk above it.
+        """
+        spooled_file: IO[bytes] = tempfile.SpooledTemporaryFile(max_size=self._read_spool_max_bytes)  # noqa: SIM115
+
+        try:
+            async with body:
+                async for chunk in body.iter_chunks(_DOWNLOAD_CHUNK_SIZE_BYTES):
+                    spooled_file.write(chunk)
+            spooled_file.seek(0)
+        except BaseException:
+            spooled_file.close()
+            raise
+
+        return spooled_file
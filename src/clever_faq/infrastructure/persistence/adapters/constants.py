@@ -13,4 +13,5 @@ DB_ROLLBACK_FAILED: Final[str] = "Rollback failed."
 UPLOAD_FILE_FAILED: Final[str] = "upload for file was failed"
 DOWNLOAD_FILE_FAILED: Final[str] = "download for file was failed"
 DELETE_FILE_FAILED: Final[str] = "delete for file was failed"
+HEAD_FILE_FAILED: Final[str] = "head for file was failed"
 STREAM_FILE_FAILED: Final[str] = "stream file failed"
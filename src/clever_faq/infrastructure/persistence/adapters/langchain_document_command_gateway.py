@@ -1,11 +1,15 @@
+import asyncio
 import logging
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Final, cast, override
 
+from langchain_chroma import Chroma
 from langchain_core.documents import Document as LangchainDocument
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 from clever_faq.application.common.ports.document.document_command_gateway import DocumentCommandGateway
 from clever_faq.domain.document.entities.chunk import Chunk
@@ -14,50 +18,130 @@ from clever_faq.domain.document.values.document_name import DocumentName
 from clever_faq.domain.document.values.document_text import DocumentText
 from clever_faq.domain.document.values.document_type import DocumentType
 from clever_faq.infrastructure.errors.persistence import EntityAddError, RepoError
+from clever_faq.setup.config.chroma import ChromaDBConfig
 
 if TYPE_CHECKING:
     from clever_faq.domain.document.values.chunk_id import ChunkID
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
+_JSON_FLOAT_BYTES: Final[int] = 24
+
 
 class LangchainVectorStoreGateway(DocumentCommandGateway):
+    """
+    Chunks of a document are stored in batches limited by ``insert_batch_size`` chunks
+    and ``insert_batch_max_bytes``, with up to ``insert_concurrency`` batches in flight.
+    A failed batch is retried on its own; the chunks of the other batches are kept.
+    """
+
     def __init__(
         self,
         vector_store: VectorStore,
         embedding_model: Embeddings,
+        chroma_config: ChromaDBConfig,
     ) -> None:
         self._vector_store: Final[VectorStore] = vector_store
         self._embedding_model: Final[Embeddings] = embedding_model
+        self._insert_batch_size: Final[int] = chroma_config.insert_batch_size
+        self._insert_batch_max_bytes: Final[int] = chroma_config.insert_batch_max_bytes
+        self._insert_concurrency: Final[int] = chroma_config.insert_concurrency
 
     @override
     async def add(self, document: Document) -> None:
+        logger.info("Adding document %s to vector store", document.id)
+        await self._insert(document, document.chunks)
+
+    @override
+    async def add_chunks(self, document: Document, chunks: AsyncIterable[Chunk]) -> AsyncIterator[int]:
+        logger.info("Adding chunks of document %s to vector store", document.id)
+
+        # inserts are awaited in order, so a yielded count never has a gap before it
+        inserts: deque[tuple[asyncio.Task[None], int]] = deque()
+        chunks_count: int = 0
+
         try:
-            logger.info("Adding document %s to vector store", document.id)
-
-            langchain_docs: list[LangchainDocument] = [
-                LangchainDocument(
-                    page_content=str(chunk_text.text),
-                    metadata={
-                        "document_id": str(document.id),
-                        "document_title": str(document.name),
-                        "created_at": datetime.now(UTC).isoformat(),
-                        "updated_at": datetime.now(UTC).isoformat(),
-                        "document_type": document.type.value,
-                    },
-                    id=str(chunk_text.id),
-                )
-                for chunk_text in document.chunks
-            ]
+            async for batch in _batched(chunks, self._insert_batch_size, self._insert_batch_max_bytes):
+                chunks_count += len(batch)
+                inserts.append((asyncio.create_task(self._insert(document, batch)), chunks_count))
 
-            # Добавляем документы в векторное хранилище
-            await self._vector_store.aadd_documents(langchain_docs)
+                if len(inserts) == self._insert_concurrency:
+                    insert, stored_count = inserts.popleft()
+                    await insert
+                    yield stored_count
+
+            while inserts:
+                insert, stored_count = inserts.popleft()
+                await insert
+                yield stored_count
+        finally:
+            for insert, _ in inserts:
+                insert.cancel()
+            await asyncio.gather(*(insert for insert, _ in inserts), return_exceptions=True)
+
+        logger.info("Added %d chunks of document %s to vector store", chunks_count, document.id)
+
+    async def _insert(self, document: Document, chunks: Sequence[Chunk]) -> None:
+        langchain_docs: list[LangchainDocument] = [
+            LangchainDocument(
+                page_content=str(chunk_text.text),
+                metadata={
+                    "document_id": str(document.id),
+                    "document_title": str(document.name),
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "updated_at": datetime.now(UTC).isoformat(),
+                    "document_type": document.type.value,
+                },
+                id=str(chunk_text.id),
+            )
+            for chunk_text in chunks
+        ]
 
+        try:
+            await self._upsert(langchain_docs, [chunk.embedding for chunk in chunks])
         except Exception as e:
             logger.exception("Vector store insert failed")
             msg = "Saving to database failed"
             raise EntityAddError(msg) from e
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+        reraise=True,
+    )
+    async def _upsert(
+        self,
+        langchain_docs: list[LangchainDocument],
+        embeddings: list[tuple[float, ...] | None],
+    ) -> None:
+        """
+        Stores chunks under their ids, replacing chunks stored before with the same ids.
+        Vectors computed by the text splitter are reused, the missing ones are computed here.
+        LangChain's vector store interface has no way to pass vectors, so this goes to the Chroma collection.
+        """
+        if not langchain_docs:
+            return
+
+        if not isinstance(self._vector_store, Chroma):
+            await self._vector_store.aadd_documents(langchain_docs)
+            return
+
+        vectors: list[Sequence[float]] = [embedding for embedding in embeddings if embedding is not None]
+        if len(vectors) < len(langchain_docs):
+            vectors = [
+                *await self._embedding_model.aembed_documents(
+                    [langchain_doc.page_content for langchain_doc in langchain_docs]
+                )
+            ]
+
+        await asyncio.to_thread(
+            self._vector_store._collection.upsert,  # noqa: SLF001
+            ids=[cast("str", langchain_doc.id) for langchain_doc in langchain_docs],
+            embeddings=vectors,
+            metadatas=[langchain_doc.metadata for langchain_doc in langchain_docs],
+            documents=[langchain_doc.page_content for langchain_doc in langchain_docs],
+        )
+
     @override
     async def search_similar_by_text(self, text: DocumentText, count_of_similar: int) -> Iterable[Document]:
         try:
@@ -85,3 +169,34 @@ class LangchainVectorStoreGateway(DocumentCommandGateway):
             logger.exception("Vector store search failed")
             msg = "Search failed"
             raise RepoError(msg) from e
+
+
+async def _batched(chunks: AsyncIterable[Chunk], max_count: int, max_bytes: int) -> AsyncIterator[list[Chunk]]:
+    batch: list[Chunk] = []
+    batch_bytes: int = 0
+
+    async for chunk in chunks:
+        chunk_bytes: int = _estimate_size_bytes(chunk)
+
+        if batch and batch_bytes + chunk_bytes > max_bytes:
+            yield batch
+            batch, batch_bytes = [], 0
+
+        batch.append(chunk)
+        batch_bytes += chunk_bytes
+
+        if len(batch) == max_count:
+            yield batch
+            batch, batch_bytes = [], 0
+
+    if batch:
+        yield batch
+
+
+def _estimate_size_bytes(chunk: Chunk) -> int:
+    """
+    Size of the chunk in an insert request: its text and its vector, sent as JSON numbers.
+    Metadata is a few hundred bytes at most and is left out.
+    """
+    embedding_size: int = len(chunk.embedding) * _JSON_FLOAT_BYTES if chunk.embedding is not None else 0
+    return len(chunk.text.value.encode()) + embedding_size
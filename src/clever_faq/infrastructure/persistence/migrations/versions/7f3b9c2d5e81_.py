@@ -0,0 +1,33 @@
+"""split dialog tokens into prompt, completion and cached prompt
+
+Revision ID: 7f3b9c2d5e81
+Revises: 426836fce6c3
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3b9c2d5e81"
+down_revision: str | Sequence[str] | None = "426836fce6c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the column always held tokens of the generated answer only
+    op.alter_column("dialogs", "tokens", new_column_name="completion_tokens")
+    op.add_column("dialogs", sa.Column("prompt_tokens", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("dialogs", sa.Column("cached_prompt_tokens", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("dialogs", "cached_prompt_tokens")
+    op.drop_column("dialogs", "prompt_tokens")
+    op.alter_column("dialogs", "completion_tokens", new_column_name="tokens")
@@ -14,7 +14,9 @@ dialogs_table: Final[sa.Table] = sa.Table(
     sa.Column("id", sa.UUID(as_uuid=True), primary_key=True),
     sa.Column("question", sa.Text, nullable=False),
     sa.Column("answer", sa.Text, nullable=False),
-    sa.Column("tokens", sa.Integer, nullable=False),
+    sa.Column("prompt_tokens", sa.Integer, nullable=False, server_default="0"),
+    sa.Column("completion_tokens", sa.Integer, nullable=False),
+    sa.Column("cached_prompt_tokens", sa.Integer, nullable=False, server_default="0"),
     sa.Column(
         "created_at",
         sa.DateTime(timezone=True),
@@ -39,7 +41,12 @@ def map_dialog_table() -> None:
             "id": dialogs_table.c.id,
             "question": composite(Message, dialogs_table.c.question),
             "answer": composite(Message, dialogs_table.c.answer),
-            "tokens": composite(Tokens, dialogs_table.c.tokens),
+            "tokens": composite(
+                Tokens,
+                dialogs_table.c.prompt_tokens,
+                dialogs_table.c.completion_tokens,
+                dialogs_table.c.cached_prompt_tokens,
+            ),
             "created_at": dialogs_table.c.created_at,
             "updated_at": dialogs_table.c.updated_at,
         },
@@ -37,6 +37,7 @@ async def retrieval_augmentation_for_document_task(
     try:
         command: RetrievalAugmentationForDocumentCommand = RetrievalAugmentationForDocumentCommand(
             document_id=request_schema.document_id,
+            content_hash=request_schema.content_hash,
         )
 
         await interactor(data=command)
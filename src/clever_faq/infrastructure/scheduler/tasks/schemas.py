@@ -6,3 +6,6 @@ from pydantic import BaseModel, Field
 
 class RetrievalAugmentationForDocumentRequestTask(BaseModel):
     document_id: Annotated[UUID, Field(description="Unique document id for processing")]
+    content_hash: Annotated[
+        str | None, Field(default=None, description="SHA-256 of the document content, released on failure")
+    ]
@@ -22,7 +22,7 @@ from clever_faq.domain.dialog.errors import BadMessageError
 from clever_faq.domain.document.errors import BadDocumentNameError, BadDocumentTextError
 from clever_faq.infrastructure.errors.base import InfrastructureError
 from clever_faq.infrastructure.errors.cache import CacheError
-from clever_faq.infrastructure.errors.file import CantReadFileError
+from clever_faq.infrastructure.errors.file import CantReadFileError, DocumentTooLargeError
 from clever_faq.infrastructure.errors.persistence import EntityAddError, FileStorageError, RepoError, RollbackError
 from clever_faq.presentation.errors.base import PresentationError
 from clever_faq.presentation.errors.document import BadFileFormatError
@@ -54,6 +54,8 @@ class ExceptionHandler:
             InconsistentTimeError: status.HTTP_400_BAD_REQUEST,
             # 401
             # 403
+            # 413
+            DocumentTooLargeError: status.HTTP_413_CONTENT_TOO_LARGE,
             # 415
             CantReadFileError: status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             UnknownMimeTypeError: status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
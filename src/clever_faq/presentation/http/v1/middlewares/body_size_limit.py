@@ -0,0 +1,76 @@
+import logging
+from typing import Final
+
+from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from clever_faq.presentation.http.v1.common.exception_handler import ExceptionSchema
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class BodySizeLimitMiddleware:
+    """Pure ASGI middleware that refuses request bodies bigger than `max_body_size` bytes.
+
+    Parameters
+    ----------
+    app: ASGIApp
+        The next application in the chain.
+    max_body_size: int
+        Biggest request body, in bytes, passed on to the application.
+
+    Note
+    ----
+        - A declared `Content-Length` above the limit is answered with 413 before the body is read,
+        so an oversized upload is never spooled to disk by the multipart parser.
+        - Bodies without `Content-Length` (chunked) are counted while they are received and the
+        read fails with 413 as soon as the limit is crossed.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self._app: Final[ASGIApp] = app
+        self._max_body_size: Final[int] = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        content_length: int | None = self._content_length(scope)
+        if content_length is not None and content_length > self._max_body_size:
+            logger.warning(
+                "Request body of %s bytes exceeds the limit of %s bytes.", content_length, self._max_body_size
+            )
+            response = ORJSONResponse(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                content=ExceptionSchema(self._message()),
+            )
+            await response(scope, receive, send)
+            return
+
+        received: int = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message: Message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self._max_body_size:
+                    raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=self._message())
+            return message
+
+        await self._app(scope, limited_receive, send)
+
+    def _message(self) -> str:
+        return f"Request body exceeds the limit of {self._max_body_size} bytes."
+
+    @staticmethod
+    def _content_length(scope: Scope) -> int | None:
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
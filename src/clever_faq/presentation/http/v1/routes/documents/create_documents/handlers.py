@@ -29,6 +29,7 @@ create_documents_router: Final[APIRouter] = APIRouter(
     description=getdoc(CreateDocumentCommandHandler),
     responses={
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": ExceptionSchema},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": ExceptionSchema},
         status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
     },
@@ -44,12 +45,11 @@ async def create_document_handler(
     letters: str = string.ascii_lowercase
     result_str: str = "".join(random.choice(letters) for _ in range(20))  # nosec B311
 
-    content: bytes = await image.read()
     filename: str = image.filename if image.filename is not None else result_str
 
     command: CreateDocumentCommand = CreateDocumentCommand(
         name=filename,
-        content=content,
+        content=image,
         mime_type=image.content_type,
     )
 
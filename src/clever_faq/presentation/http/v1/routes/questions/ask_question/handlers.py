@@ -1,22 +1,33 @@
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 from inspect import getdoc
-from typing import TYPE_CHECKING, Final
+from typing import Final
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from starlette import status
 
 from clever_faq.application.commands.questions.answer_the_question import (
     AnswerTheQuestionCommand,
     AnswerTheQuestionCommandHandler,
 )
+from clever_faq.application.commands.questions.stream_the_answer import (
+    StreamTheAnswerCommand,
+    StreamTheAnswerCommandHandler,
+)
+from clever_faq.application.common.views.questions import AnswerDeltaView, AnswerTheQuestionView
 from clever_faq.presentation.http.v1.routes.questions.ask_question.schemas import (
+    AnswerDeltaSchemaEvent,
+    AnswerErrorSchemaEvent,
     AskQuestionSchemaRequest,
     AskQuestionSchemaResponse,
 )
 
-if TYPE_CHECKING:
-    from clever_faq.application.common.views.questions import AnswerTheQuestionView
+logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 ask_question_router: Final[APIRouter] = APIRouter(route_class=DishkaRoute, tags=["Question"])
 
@@ -40,3 +51,55 @@ async def ask_the_question_handler(
     return AskQuestionSchemaResponse(
         answer=view.answer,
     )
+
+
+@ask_question_router.post(
+    "/ask/stream/",
+    status_code=status.HTTP_200_OK,
+    summary="Handler for answering question from user with streaming over Server-Sent Events",
+    description=getdoc(StreamTheAnswerCommandHandler),
+    response_class=StreamingResponse,
+)
+async def stream_the_answer_handler(
+    request_schema: AskQuestionSchemaRequest, interactor: FromDishka[StreamTheAnswerCommandHandler]
+) -> StreamingResponse:
+    command: StreamTheAnswerCommand = StreamTheAnswerCommand(
+        question=request_schema.question,
+    )
+
+    views: AsyncGenerator[AnswerDeltaView | AnswerTheQuestionView, None] = interactor(command)
+    # Errors raised before the first event still reach the exception handlers as a regular response
+    first_view: AnswerDeltaView | AnswerTheQuestionView = await anext(views)
+
+    return StreamingResponse(
+        _to_server_sent_events(first_view, views),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _to_server_sent_events(
+    first_view: AnswerDeltaView | AnswerTheQuestionView,
+    views: AsyncGenerator[AnswerDeltaView | AnswerTheQuestionView, None],
+) -> AsyncIterator[str]:
+    # When the client disconnects, the response closes this generator and the answer
+    # stops being generated, the dialog of an unfinished answer is not saved
+    try:
+        async with aclosing(views):
+            yield _format_event(first_view)
+
+            async for view in views:
+                yield _format_event(view)
+    except Exception:
+        logger.exception("Failed to stream answer")
+        yield _format_server_sent_event("error", AnswerErrorSchemaEvent(description="Internal server error."))
+
+
+def _format_event(view: AnswerDeltaView | AnswerTheQuestionView) -> str:
+    if isinstance(view, AnswerDeltaView):
+        return _format_server_sent_event("delta", AnswerDeltaSchemaEvent(text=view.text))
+    return _format_server_sent_event("answer", AskQuestionSchemaResponse(answer=view.answer))
+
+
+def _format_server_sent_event(event: str, data: BaseModel) -> str:
+    return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
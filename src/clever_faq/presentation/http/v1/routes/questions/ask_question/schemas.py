@@ -9,3 +9,11 @@ class AskQuestionSchemaRequest(BaseModel):
 
 class AskQuestionSchemaResponse(BaseModel):
     answer: Annotated[str, Field(min_length=1)]
+
+
+class AnswerDeltaSchemaEvent(BaseModel):
+    text: str
+
+
+class AnswerErrorSchemaEvent(BaseModel):
+    description: str
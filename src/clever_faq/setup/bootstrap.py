@@ -14,6 +14,7 @@ from clever_faq.infrastructure.persistence.models.dialog import map_dialog_table
 from clever_faq.infrastructure.scheduler.tasks.document_tasks import setup_documents_task
 from clever_faq.presentation.http.v1.common.exception_handler import ExceptionHandler
 from clever_faq.presentation.http.v1.common.routes import healthcheck, index
+from clever_faq.presentation.http.v1.middlewares.body_size_limit import BodySizeLimitMiddleware
 from clever_faq.presentation.http.v1.middlewares.client_cache import ClientCacheMiddleware
 from clever_faq.presentation.http.v1.middlewares.logs import LoggingMiddleware
 from clever_faq.presentation.http.v1.routes.documents import documents_router
@@ -21,11 +22,15 @@ from clever_faq.presentation.http.v1.routes.questions import questions_router
 from clever_faq.setup.config.asgi import ASGIConfig
 from clever_faq.setup.config.cache import RedisConfig
 from clever_faq.setup.config.rabbit import RabbitConfig
+from clever_faq.setup.config.s3 import S3Config
 from clever_faq.setup.config.settings import AppConfig
 from clever_faq.setup.config.worker import TaskIQWorkerConfig
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
+# Room for multipart boundaries and part headers around the uploaded document itself.
+_MULTIPART_OVERHEAD_BYTES: Final[int] = 64 * 1024
+
 
 @lru_cache(maxsize=1)
 def setup_configs() -> AppConfig:
@@ -59,13 +64,14 @@ def setup_map_tables() -> None:
     map_dialog_table()
 
 
-def setup_http_middlewares(app: FastAPI, /, api_config: ASGIConfig) -> None:
+def setup_http_middlewares(app: FastAPI, /, api_config: ASGIConfig, s3_config: S3Config) -> None:
     """
     Registers all middlewares for FastAPI application.
 
     Args:
         app: FastAPI application
         api_config: ASGIConfig
+        s3_config: S3Config, its upload limit caps request bodies
     Returns:
         None
     """
@@ -83,6 +89,10 @@ def setup_http_middlewares(app: FastAPI, /, api_config: ASGIConfig) -> None:
     )
     app.add_middleware(ClientCacheMiddleware, max_age=60)  # type: ignore[arg-type, unused-ignore]
     app.add_middleware(LoggingMiddleware)  # type: ignore[arg-type, unused-ignore]
+    app.add_middleware(
+        BodySizeLimitMiddleware,  # type: ignore[arg-type, unused-ignore]
+        max_body_size=s3_config.max_upload_size_bytes + _MULTIPART_OVERHEAD_BYTES,
+    )
 
 
 def setup_http_routes(app: FastAPI, /) -> None:
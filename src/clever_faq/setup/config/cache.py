@@ -1,6 +1,6 @@
-from typing import Final
+from typing import Final, Self
 
-from pydantic import BaseModel, Field, RedisDsn, field_validator
+from pydantic import BaseModel, Field, RedisDsn, field_validator, model_validator
 
 from clever_faq.setup.config.consts import PORT_MAX, PORT_MIN
 
@@ -44,6 +44,41 @@ class RedisConfig(BaseModel):
         description="Redis max connections",
         validate_default=True
     )
+    local_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        alias="REDIS_LOCAL_CACHE_MAX_BYTES",
+        description="Memory budget of the in-process cache in front of Redis, 0 disables it",
+        validate_default=True
+    )
+    local_cache_max_entry_bytes: int = Field(
+        default=1024 * 1024,
+        ge=1,
+        alias="REDIS_LOCAL_CACHE_MAX_ENTRY_BYTES",
+        description="Values bigger than this are read from Redis only",
+        validate_default=True
+    )
+    local_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=1,
+        alias="REDIS_LOCAL_CACHE_TTL_SECONDS",
+        description="Max time a value is served from the in-process cache without asking Redis",
+        validate_default=True
+    )
+    embedding_cache_ttl_seconds: int = Field(
+        default=30 * 24 * 60 * 60,
+        ge=0,
+        alias="REDIS_EMBEDDING_CACHE_TTL_SECONDS",
+        description="How long computed embeddings are kept in Redis, 0 disables the embedding cache",
+        validate_default=True
+    )
+    indexing_checkpoint_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=1,
+        alias="REDIS_INDEXING_CHECKPOINT_TTL_SECONDS",
+        description="How long progress of an unfinished document indexing is kept for retries to resume",
+        validate_default=True
+    )
 
     @field_validator("port")
     @classmethod
@@ -110,3 +145,81 @@ class RedisConfig(BaseModel):
                 path=f"/{self.schedule_source_db}"
             )
         )
+
+
+class AnswerCacheConfig(BaseModel):
+    ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        alias="ANSWER_CACHE_TTL_SECONDS",
+        description="How long an answer stays in cache",
+        validate_default=True,
+    )
+    stale_while_revalidate_seconds: int = Field(
+        default=0,
+        ge=0,
+        alias="ANSWER_CACHE_STALE_WHILE_REVALIDATE_SECONDS",
+        description="How long an expired answer is still served while it is refreshed in background, 0 disables it",
+        validate_default=True,
+    )
+    refresh_concurrency: int = Field(
+        default=4,
+        ge=1,
+        alias="ANSWER_CACHE_REFRESH_CONCURRENCY",
+        description="Max background refreshes of expired answers running at once",
+        validate_default=True,
+    )
+    compression_threshold_bytes: int = Field(
+        default=512,
+        ge=0,
+        alias="ANSWER_CACHE_COMPRESSION_THRESHOLD_BYTES",
+        description="Size from which cached answers are compressed with zstd",
+        validate_default=True,
+    )
+    semantic_similarity_threshold: float = Field(
+        default=0.92,
+        gt=0.0,
+        le=1.0,
+        alias="ANSWER_CACHE_SEMANTIC_SIMILARITY_THRESHOLD",
+        description="Cosine similarity from which a previously answered question is reused",
+        validate_default=True,
+    )
+    semantic_near_hit_threshold: float = Field(
+        default=0.85,
+        gt=0.0,
+        le=1.0,
+        alias="ANSWER_CACHE_SEMANTIC_NEAR_HIT_THRESHOLD",
+        description="Cosine similarity from which a miss is reported as a near hit",
+        validate_default=True,
+    )
+    semantic_max_entries: int = Field(
+        default=10_000,
+        ge=1,
+        alias="ANSWER_CACHE_SEMANTIC_MAX_ENTRIES",
+        description="Max questions kept in the semantic index",
+        validate_default=True,
+    )
+    semantic_sync_interval_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        alias="ANSWER_CACHE_SEMANTIC_SYNC_INTERVAL_SECONDS",
+        description="How often the local semantic index pulls entries added by other replicas",
+        validate_default=True,
+    )
+    single_flight_lock_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        alias="ANSWER_CACHE_SINGLE_FLIGHT_LOCK_TTL_SECONDS",
+        description="How long replicas wait for another replica answering the same question",
+        validate_default=True,
+    )
+
+    @model_validator(mode="after")
+    def validate_semantic_thresholds(self) -> Self:
+        if self.semantic_near_hit_threshold > self.semantic_similarity_threshold:
+            raise ValueError(
+                "ANSWER_CACHE_SEMANTIC_NEAR_HIT_THRESHOLD must not exceed "
+                f"ANSWER_CACHE_SEMANTIC_SIMILARITY_THRESHOLD, got {self.semantic_near_hit_threshold} > "
+                f"{self.semantic_similarity_threshold}."
+            )
+        return self
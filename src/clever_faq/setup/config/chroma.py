@@ -6,3 +6,21 @@ class ChromaDBConfig(BaseModel):
     chunk_overlap: int = 50
     host: str = Field(..., alias="CHROMA_SERVER_HTTP_HOST")
     port: int = Field(..., alias="CHROMA_SERVER_HTTP_PORT")
+    insert_batch_size: int = Field(
+        default=64,
+        ge=1,
+        alias="CHROMA_INSERT_BATCH_SIZE",
+        description="Max chunks inserted in one request while a document is being indexed",
+    )
+    insert_batch_max_bytes: int = Field(
+        default=4 * 1024 * 1024,
+        ge=1,
+        alias="CHROMA_INSERT_BATCH_MAX_BYTES",
+        description="Approximate max size of one insert request, a single larger chunk is sent alone",
+    )
+    insert_concurrency: int = Field(
+        default=4,
+        ge=1,
+        alias="CHROMA_INSERT_CONCURRENCY",
+        description="Insert requests of one document in flight at once",
+    )
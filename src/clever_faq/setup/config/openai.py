@@ -30,6 +30,11 @@ class OpenAIEmbeddingsSettings(BaseModel):
         ge=1,
         description="Chunk size used when sending texts for embedding.",
     )
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Number of embedding requests sent at once when splitting a document.",
+    )
     langsmith_tracing: bool = Field(
         alias="LANGSMITH_TRACING",
     )
@@ -96,6 +101,18 @@ class OpenAISettings(BaseModel):
         alias="OPENAI_BASE_URL",
         description="Override for OpenAI-compatible API base URL.",
     )
+    http_max_connections: int = Field(
+        default=100,
+        ge=1,
+        alias="OPENAI_HTTP_MAX_CONNECTIONS",
+        description="Max connections in the HTTP pool shared by chat and embedding clients.",
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        alias="OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        description="Max idle keep-alive connections in the shared HTTP pool.",
+    )
     embeddings: OpenAIEmbeddingsSettings = Field(
         default_factory=lambda: OpenAIEmbeddingsSettings(**os.environ),
         description="Embedding-model specific settings.",
@@ -0,0 +1,79 @@
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class RetrievalConfig(BaseModel):
+    top_k: int = Field(
+        default=12,
+        ge=1,
+        alias="RETRIEVAL_TOP_K",
+        description="Fused chunks passed to reranking, the context is packed from them",
+        validate_default=True
+    )
+    candidates: int = Field(
+        default=20,
+        ge=1,
+        alias="RETRIEVAL_CANDIDATES",
+        description="Chunks taken from each of the vector and the keyword search before they are fused",
+        validate_default=True
+    )
+    rrf_k: int = Field(
+        default=60,
+        ge=1,
+        alias="RETRIEVAL_RRF_K",
+        description="Reciprocal rank fusion constant, bigger values flatten the difference between top ranks",
+        validate_default=True
+    )
+    bm25_k1: float = Field(
+        default=1.2,
+        ge=0.0,
+        alias="RETRIEVAL_BM25_K1",
+        description="BM25 term frequency saturation",
+        validate_default=True
+    )
+    bm25_b: float = Field(
+        default=0.75,
+        ge=0.0,
+        le=1.0,
+        alias="RETRIEVAL_BM25_B",
+        description="BM25 chunk length normalization",
+        validate_default=True
+    )
+    context_token_budget: int = Field(
+        default=1500,
+        ge=1,
+        alias="RETRIEVAL_CONTEXT_TOKEN_BUDGET",
+        description="Max tokens of chunks passed to the model as the context of one question",
+        validate_default=True
+    )
+    duplicate_similarity_threshold: float = Field(
+        default=0.8,
+        gt=0.0,
+        le=1.0,
+        alias="RETRIEVAL_DUPLICATE_SIMILARITY_THRESHOLD",
+        description="Word overlap from which a less relevant chunk is dropped from the context as a duplicate",
+        validate_default=True
+    )
+    cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        alias="RETRIEVAL_CACHE_TTL_SECONDS",
+        description="How long chunks retrieved for a question are reused, 0 disables the retrieval cache",
+        validate_default=True
+    )
+    lexical_sync_interval_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        alias="RETRIEVAL_LEXICAL_SYNC_INTERVAL_SECONDS",
+        description="How often the local keyword index pulls chunks indexed by other processes",
+        validate_default=True
+    )
+
+    @model_validator(mode="after")
+    def validate_candidates(self) -> Self:
+        if self.candidates < self.top_k:
+            raise ValueError(
+                f"RETRIEVAL_CANDIDATES must be at least RETRIEVAL_TOP_K, got {self.candidates} < {self.top_k}."
+            )
+        return self
@@ -1,7 +1,11 @@
+from typing import Final
+
 from pydantic import BaseModel, Field, field_validator
 
 from clever_faq.setup.config.consts import PORT_MAX, PORT_MIN
 
+S3_MIN_MULTIPART_CHUNK_SIZE_BYTES: Final[int] = 5 * 1024 * 1024
+
 
 class S3Config(BaseModel):
     host: str = Field(..., alias="MINIO_HOST")
@@ -12,6 +16,24 @@ class S3Config(BaseModel):
     region_name: str = "us-east-1"
 
     documents_bucket_name: str = Field(..., alias="MINIO_FILES_BUCKET")
+    max_upload_size_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        alias="MINIO_MAX_UPLOAD_SIZE_BYTES",
+        description="Biggest document accepted for upload, enforced while it is streamed to storage.",
+        validate_default=True,
+    )
+    multipart_chunk_size_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        alias="MINIO_MULTIPART_CHUNK_SIZE_BYTES",
+        description="Size of one multipart upload part, the most memory one upload holds at once.",
+        validate_default=True,
+    )
+    read_spool_max_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        alias="MINIO_READ_SPOOL_MAX_BYTES",
+        description="Size up to which a downloaded document is kept in memory before spilling to a temporary file.",
+        validate_default=True,
+    )
 
     @field_validator("port")
     @classmethod
@@ -22,6 +44,29 @@ class S3Config(BaseModel):
             )
         return v
 
+    @field_validator("max_upload_size_bytes")
+    @classmethod
+    def validate_max_upload_size_bytes(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError(f"MINIO_MAX_UPLOAD_SIZE_BYTES must be positive, got {v}.")
+        return v
+
+    @field_validator("read_spool_max_bytes")
+    @classmethod
+    def validate_read_spool_max_bytes(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError(f"MINIO_READ_SPOOL_MAX_BYTES must be non-negative, got {v}.")
+        return v
+
+    @field_validator("multipart_chunk_size_bytes")
+    @classmethod
+    def validate_multipart_chunk_size_bytes(cls, v: int) -> int:
+        if v < S3_MIN_MULTIPART_CHUNK_SIZE_BYTES:
+            raise ValueError(
+                f"MINIO_MULTIPART_CHUNK_SIZE_BYTES must be at least {S3_MIN_MULTIPART_CHUNK_SIZE_BYTES}, got {v}."
+            )
+        return v
+
     @property
     def uri(self) -> str:
         return f"http://{self.host}:{self.port}"
@@ -4,11 +4,12 @@ import os
 from pydantic import BaseModel, Field
 
 from clever_faq.setup.config.asgi import ASGIConfig
-from clever_faq.setup.config.cache import RedisConfig
+from clever_faq.setup.config.cache import AnswerCacheConfig, RedisConfig
 from clever_faq.setup.config.chroma import ChromaDBConfig
 from clever_faq.setup.config.database import PostgresConfig, SQLAlchemyConfig
 from clever_faq.setup.config.openai import OpenAIEmbeddingsSettings, OpenAISettings
 from clever_faq.setup.config.rabbit import RabbitConfig
+from clever_faq.setup.config.retrieval import RetrievalConfig
 from clever_faq.setup.config.s3 import S3Config
 from clever_faq.setup.config.worker import TaskIQWorkerConfig
 
@@ -36,6 +37,14 @@ class AppConfig(BaseModel):
         default_factory=lambda: RedisConfig(**os.environ),
         description="Redis settings",
     )
+    answer_cache: AnswerCacheConfig = Field(
+        default_factory=lambda: AnswerCacheConfig(**os.environ),
+        description="Question answer cache settings",
+    )
+    retrieval: RetrievalConfig = Field(
+        default_factory=lambda: RetrievalConfig(**os.environ),
+        description="Knowledge base retrieval settings",
+    )
     worker: TaskIQWorkerConfig = Field(
         default_factory=lambda: TaskIQWorkerConfig(**os.environ),
         description="Worker settings",
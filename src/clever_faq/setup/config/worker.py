@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field, field_validator
 RETRY_COUNT_MIN: Final[int] = 0
 DELAY_MIN: Final[int] = 0
 MAX_DELAY_COMPONENT_MIN: Final[int] = 1
+EXTRACTION_PROCESSES_MIN: Final[int] = 1
+PDF_PAGES_PER_TASK_MIN: Final[int] = 1
 
 
 class TaskIQWorkerConfig(BaseModel):
@@ -16,6 +18,8 @@ class TaskIQWorkerConfig(BaseModel):
     durable_queue: bool = Field(default=True, description="Create durable queue for tasks or not")
     durable_exchange: bool = Field(default=True, description="Create exchange for tasks or not")
     declare_exchange: bool = Field(default=True, description="Declare exchange for tasks or not")
+    extraction_processes: int = Field(default=2, description="Processes extracting text from uploaded files")
+    pdf_pages_per_task: int = Field(default=8, description="PDF pages extracted by one process at a time")
 
     @field_validator("default_retry_count")
     @classmethod
@@ -43,3 +47,21 @@ class TaskIQWorkerConfig(BaseModel):
                 f"max_delay_component must be at least {MAX_DELAY_COMPONENT_MIN} seconds, got {v}."
             )
         return v
+
+    @field_validator("extraction_processes")
+    @classmethod
+    def validate_extraction_processes(cls, v: int) -> int:
+        if v < EXTRACTION_PROCESSES_MIN:
+            raise ValueError(
+                f"extraction_processes must be at least {EXTRACTION_PROCESSES_MIN}, got {v}."
+            )
+        return v
+
+    @field_validator("pdf_pages_per_task")
+    @classmethod
+    def validate_pdf_pages_per_task(cls, v: int) -> int:
+        if v < PDF_PAGES_PER_TASK_MIN:
+            raise ValueError(
+                f"pdf_pages_per_task must be at least {PDF_PAGES_PER_TASK_MIN}, got {v}."
+            )
+        return v
@@ -3,6 +3,7 @@ from typing import Final
 
 from dishka import Provider, Scope
 from dishka.integrations.fastapi import FastapiProvider
+from langchain_core.embeddings import Embeddings
 from sqlalchemy.ext.asyncio import AsyncSession
 from taskiq import AsyncBroker
 
@@ -11,10 +12,16 @@ from clever_faq.application.commands.document.retrieval_augmentation_for_documen
     RetrievalAugmentationForDocumentCommandHandler,
 )
 from clever_faq.application.commands.questions.answer_the_question import AnswerTheQuestionCommandHandler
+from clever_faq.application.commands.questions.stream_the_answer import StreamTheAnswerCommandHandler
 from clever_faq.application.common.ports.cache_store import CacheStore
 from clever_faq.application.common.ports.dialog.dialog_command_gateway import DialogCommandGateway
 from clever_faq.application.common.ports.document.document_command_gateway import DocumentCommandGateway
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
 from clever_faq.application.common.ports.document.document_storage import DocumentStorage
+from clever_faq.application.common.ports.document.indexing_checkpoint_store import IndexingCheckpointStore
+from clever_faq.application.common.ports.document.lexical_index import LexicalIndex
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.application.common.ports.question.answer_cache_invalidator import AnswerCacheInvalidator
 from clever_faq.application.common.ports.question.question_answering_port import QuestionAnsweringPort
 from clever_faq.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from clever_faq.application.common.ports.transaction_manager import TransactionManager
@@ -25,15 +32,44 @@ from clever_faq.domain.document.ports.document_id_generator import DocumentIDGen
 from clever_faq.domain.document.ports.text_splitter import TextSplitter
 from clever_faq.domain.document.services.document import DocumentService
 from clever_faq.infrastructure.adapters.common.langchain_text_splitter import SemanticTextSplitter
-from clever_faq.infrastructure.adapters.common.uuid4_chunk_id_generator import UUID4ChunkIDGenerator
 from clever_faq.infrastructure.adapters.common.uuid4_dialog_id_generator import UUID4DialogIDGenerator
 from clever_faq.infrastructure.adapters.common.uuid4_document_id_generator import UUID4DocumentIDGenerator
-from clever_faq.infrastructure.adapters.file.provider import get_file_processor_factory
+from clever_faq.infrastructure.adapters.common.uuid5_chunk_id_generator import UUID5ChunkIDGenerator
+from clever_faq.infrastructure.adapters.file.provider import get_extraction_process_pool, get_file_processor_factory
+from clever_faq.infrastructure.adapters.question.bm25_index import RedisBM25Index
 from clever_faq.infrastructure.adapters.question.langchain_question_answering_port import LangChainQuestionAnsweringPort
-from clever_faq.infrastructure.adapters.question.provider import get_chat_model, get_embeddings
+from clever_faq.infrastructure.adapters.question.provider import (
+    get_bm25_index,
+    get_chat_model,
+    get_embeddings,
+    get_openai_http_client,
+    get_reranker,
+    get_retriever,
+)
 from clever_faq.infrastructure.cache.adapters.cached_question_answering_port import CachedQuestionAnsweringPort
-from clever_faq.infrastructure.cache.provider import get_redis, get_redis_pool
+from clever_faq.infrastructure.cache.adapters.semantic_cached_question_answering_port import (
+    SemanticCachedQuestionAnsweringPort,
+)
+from clever_faq.infrastructure.cache.answer_cache_key import AnswerCacheKeyBuilder
+from clever_faq.infrastructure.cache.provider import (
+    get_cached_embeddings,
+    get_embedding_cache_stats,
+    get_local_cache_store,
+    get_redis,
+    get_redis_pool,
+    get_retrieval_cache,
+    get_retrieval_cache_stats,
+    get_semantic_answer_index,
+    get_semantic_cache_stats,
+    get_single_flight,
+    get_single_flight_stats,
+    get_sync_redis,
+)
+from clever_faq.infrastructure.cache.redis_answer_cache_invalidator import RedisAnswerCacheInvalidator
 from clever_faq.infrastructure.cache.redis_cache_store import RedisCacheStore
+from clever_faq.infrastructure.cache.redis_document_content_index import RedisDocumentContentIndex
+from clever_faq.infrastructure.cache.redis_indexing_checkpoint_store import RedisIndexingCheckpointStore
+from clever_faq.infrastructure.cache.redis_knowledge_base_generation import RedisKnowledgeBaseGeneration
 from clever_faq.infrastructure.persistence.adapters.aiobotocore_document_storage import AiobotocoreDocumentStorage
 from clever_faq.infrastructure.persistence.adapters.alchemy_dialog_command_gateway import SqlAlchemyDialogCommandGateway
 from clever_faq.infrastructure.persistence.adapters.alchemy_transaction_manager import SQLAlchemyTransactionManager
@@ -51,10 +87,12 @@ from clever_faq.infrastructure.persistence.provider import (
 from clever_faq.infrastructure.scheduler.task_iq_task_scheduler import TaskIQTaskScheduler
 from clever_faq.setup.bootstrap import setup_schedule_source
 from clever_faq.setup.config.asgi import ASGIConfig
-from clever_faq.setup.config.cache import RedisConfig
+from clever_faq.setup.config.cache import AnswerCacheConfig, RedisConfig
 from clever_faq.setup.config.chroma import ChromaDBConfig
 from clever_faq.setup.config.database import PostgresConfig, SQLAlchemyConfig
 from clever_faq.setup.config.openai import OpenAISettings
+from clever_faq.setup.config.retrieval import RetrievalConfig
+from clever_faq.setup.config.worker import TaskIQWorkerConfig
 
 
 def configs_provider() -> Provider:
@@ -65,15 +103,19 @@ def configs_provider() -> Provider:
     provider.from_context(SQLAlchemyConfig)
     provider.from_context(PostgresConfig)
     provider.from_context(RedisConfig)
+    provider.from_context(AnswerCacheConfig)
+    provider.from_context(RetrievalConfig)
+    provider.from_context(TaskIQWorkerConfig)
     provider.from_context(AsyncBroker)
     return provider
 
 
 def db_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
-    provider.provide(get_vector_store)
-    provider.provide(get_embeddings)
-    provider.provide(get_chat_model)
+    provider.provide(get_openai_http_client, scope=Scope.APP)
+    provider.provide(get_vector_store, scope=Scope.APP)
+    provider.provide(get_embeddings, scope=Scope.APP)
+    provider.provide(get_chat_model, scope=Scope.APP)
     provider.provide(get_engine, scope=Scope.APP)
     provider.provide(get_sessionmaker, scope=Scope.APP)
     provider.provide(get_session, provides=AsyncSession)
@@ -85,8 +127,24 @@ def db_provider() -> Provider:
 def cache_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
     provider.provide(get_redis_pool, scope=Scope.APP)
-    provider.provide(get_redis)
-    provider.provide(RedisCacheStore, provides=CacheStore)
+    provider.provide(get_redis, scope=Scope.APP)
+    provider.provide(get_sync_redis, scope=Scope.APP)
+    provider.provide(RedisCacheStore, provides=CacheStore, scope=Scope.APP)
+    provider.decorate(get_local_cache_store, provides=CacheStore)
+    provider.provide(RedisKnowledgeBaseGeneration, provides=KnowledgeBaseGeneration, scope=Scope.APP)
+    provider.provide(RedisDocumentContentIndex, provides=DocumentContentIndex, scope=Scope.APP)
+    provider.provide(RedisIndexingCheckpointStore, provides=IndexingCheckpointStore, scope=Scope.APP)
+    provider.provide(AnswerCacheKeyBuilder, scope=Scope.APP)
+    provider.provide(RedisAnswerCacheInvalidator, provides=AnswerCacheInvalidator, scope=Scope.APP)
+    provider.provide(get_semantic_answer_index, scope=Scope.APP)
+    provider.provide(get_semantic_cache_stats, scope=Scope.APP)
+    provider.provide(get_single_flight_stats, scope=Scope.APP)
+    provider.provide(get_single_flight, scope=Scope.APP)
+    provider.provide(get_embedding_cache_stats, scope=Scope.APP)
+    provider.provide(get_retrieval_cache_stats, scope=Scope.APP)
+    provider.provide(get_retrieval_cache, scope=Scope.APP)
+    provider.decorate(get_cached_embeddings, provides=Embeddings)
+    provider.decorate(SemanticCachedQuestionAnsweringPort, provides=QuestionAnsweringPort)
     provider.decorate(CachedQuestionAnsweringPort, provides=QuestionAnsweringPort)
     return provider
 
@@ -103,8 +161,13 @@ def gateways_provider() -> Provider:
 def application_ports_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
     provider.provide(source=setup_schedule_source, scope=Scope.APP)
-    provider.provide(LangChainQuestionAnsweringPort, provides=QuestionAnsweringPort)
+    provider.provide(get_bm25_index, scope=Scope.APP)
+    provider.alias(source=RedisBM25Index, provides=LexicalIndex)
+    provider.provide(get_reranker, scope=Scope.APP)
+    provider.provide(get_retriever, scope=Scope.APP)
+    provider.provide(LangChainQuestionAnsweringPort, provides=QuestionAnsweringPort, scope=Scope.APP)
     provider.provide(TaskIQTaskScheduler, provides=TaskScheduler)
+    provider.provide(get_extraction_process_pool, scope=Scope.APP)
     provider.provide(get_file_processor_factory)
     return provider
 
@@ -112,7 +175,7 @@ def application_ports_provider() -> Provider:
 def domain_ports_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
     provider.provide(UUID4DocumentIDGenerator, provides=DocumentIDGenerator)
-    provider.provide(UUID4ChunkIDGenerator, provides=ChunkIDGenerator)
+    provider.provide(UUID5ChunkIDGenerator, provides=ChunkIDGenerator)
     provider.provide(UUID4DialogIDGenerator, provides=DialogIDGenerator)
     provider.provide(SemanticTextSplitter, provides=TextSplitter)
     provider.provide(DocumentService)
@@ -123,7 +186,10 @@ def domain_ports_provider() -> Provider:
 def interactors_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
     provider.provide_all(
-        AnswerTheQuestionCommandHandler, CreateDocumentCommandHandler, RetrievalAugmentationForDocumentCommandHandler
+        AnswerTheQuestionCommandHandler,
+        StreamTheAnswerCommandHandler,
+        CreateDocumentCommandHandler,
+        RetrievalAugmentationForDocumentCommandHandler,
     )
     return provider
 
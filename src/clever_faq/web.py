@@ -23,11 +23,13 @@ from clever_faq.setup.bootstrap import (
     setup_task_manager_tasks,
 )
 from clever_faq.setup.config.asgi import ASGIConfig
-from clever_faq.setup.config.cache import RedisConfig
+from clever_faq.setup.config.cache import AnswerCacheConfig, RedisConfig
 from clever_faq.setup.config.chroma import ChromaDBConfig
 from clever_faq.setup.config.database import PostgresConfig, SQLAlchemyConfig
 from clever_faq.setup.config.openai import OpenAISettings
+from clever_faq.setup.config.retrieval import RetrievalConfig
 from clever_faq.setup.config.s3 import S3Config
+from clever_faq.setup.config.worker import TaskIQWorkerConfig
 from clever_faq.setup.ioc import setup_providers
 
 if TYPE_CHECKING:
@@ -112,9 +114,12 @@ def create_fastapi_app() -> FastAPI:  # pragma: no cover
     context = {
         ASGIConfig: configs.asgi,
         RedisConfig: configs.redis,
+        AnswerCacheConfig: configs.answer_cache,
+        RetrievalConfig: configs.retrieval,
         SQLAlchemyConfig: configs.alchemy,
         PostgresConfig: configs.postgres,
         S3Config: configs.s3,
+        TaskIQWorkerConfig: configs.worker,
         AsyncBroker: task_manager,
         OpenAISettings: configs.openai,
         ChromaDBConfig: configs.chroma,
@@ -123,7 +128,7 @@ def create_fastapi_app() -> FastAPI:  # pragma: no cover
     container: AsyncContainer = make_async_container(*setup_providers(), context=context)
     setup_http_routes(app)
     setup_exc_handlers(app)
-    setup_http_middlewares(app, api_config=configs.asgi)
+    setup_http_middlewares(app, api_config=configs.asgi, s3_config=configs.s3)
     setup_dishka(container, app)
     logger.info("App created", extra={"app_version": app.version})
     return app
@@ -10,12 +10,14 @@ from clever_faq.setup.bootstrap import (
     setup_task_manager_tasks,
 )
 from clever_faq.setup.config.asgi import ASGIConfig
-from clever_faq.setup.config.cache import RedisConfig
+from clever_faq.setup.config.cache import AnswerCacheConfig, RedisConfig
 from clever_faq.setup.config.chroma import ChromaDBConfig
 from clever_faq.setup.config.database import PostgresConfig, SQLAlchemyConfig
 from clever_faq.setup.config.openai import OpenAISettings
+from clever_faq.setup.config.retrieval import RetrievalConfig
 from clever_faq.setup.config.s3 import S3Config
 from clever_faq.setup.config.settings import AppConfig
+from clever_faq.setup.config.worker import TaskIQWorkerConfig
 from clever_faq.setup.ioc import setup_providers
 
 
@@ -44,9 +46,12 @@ def create_worker_taskiq_app() -> AsyncBroker:
     context = {
         ASGIConfig: configs.asgi,
         RedisConfig: configs.redis,
+        AnswerCacheConfig: configs.answer_cache,
+        RetrievalConfig: configs.retrieval,
         SQLAlchemyConfig: configs.alchemy,
         PostgresConfig: configs.postgres,
         S3Config: configs.s3,
+        TaskIQWorkerConfig: configs.worker,
         AsyncBroker: task_manager,
         OpenAISettings: configs.openai,
         ChromaDBConfig: configs.chroma,
@@ -27,13 +27,15 @@ from clever_faq.setup.bootstrap import (
     setup_task_manager_tasks,
 )
 from clever_faq.setup.config.asgi import ASGIConfig
-from clever_faq.setup.config.cache import RedisConfig
+from clever_faq.setup.config.cache import AnswerCacheConfig, RedisConfig
 from clever_faq.setup.config.chroma import ChromaDBConfig
 from clever_faq.setup.config.database import PostgresConfig, SQLAlchemyConfig
 from clever_faq.setup.config.openai import OpenAISettings
 from clever_faq.setup.config.rabbit import RabbitConfig
+from clever_faq.setup.config.retrieval import RetrievalConfig
 from clever_faq.setup.config.s3 import S3Config
 from clever_faq.setup.config.settings import AppConfig
+from clever_faq.setup.config.worker import TaskIQWorkerConfig
 from clever_faq.web import lifespan
 from tests.integration.ioc import setup_providers
 
@@ -145,9 +147,12 @@ def broker(configs: AppConfig) -> AsyncBroker:
     context = {
         ASGIConfig: configs.asgi,
         RedisConfig: configs.redis,
+        AnswerCacheConfig: configs.answer_cache,
+        RetrievalConfig: configs.retrieval,
         SQLAlchemyConfig: configs.alchemy,
         PostgresConfig: configs.postgres,
         S3Config: configs.s3,
+        TaskIQWorkerConfig: configs.worker,
         AsyncBroker: broker,
         OpenAISettings: configs.openai,
         ChromaDBConfig: configs.chroma,
@@ -173,9 +178,12 @@ async def app(broker: AsyncBroker) -> AsyncIterator[FastAPI]:
     context = {
         ASGIConfig: configs.asgi,
         RedisConfig: configs.redis,
+        AnswerCacheConfig: configs.answer_cache,
+        RetrievalConfig: configs.retrieval,
         SQLAlchemyConfig: configs.alchemy,
         PostgresConfig: configs.postgres,
         S3Config: configs.s3,
+        TaskIQWorkerConfig: configs.worker,
         AsyncBroker: broker,
         OpenAISettings: configs.openai,
         ChromaDBConfig: configs.chroma,
@@ -184,7 +192,7 @@ async def app(broker: AsyncBroker) -> AsyncIterator[FastAPI]:
     setup_map_tables()
     setup_http_routes(app)
     setup_exc_handlers(app)
-    setup_http_middlewares(app, api_config=configs.asgi)
+    setup_http_middlewares(app, api_config=configs.asgi, s3_config=configs.s3)
     setup_dishka_fastapi(container, app)
 
     engine = await container.get(AsyncEngine)
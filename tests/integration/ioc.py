@@ -36,9 +36,9 @@ def fake_chat_model() -> BaseChatModel:
 
 def db_provider() -> Provider:
     provider: Final[Provider] = Provider(scope=Scope.REQUEST)
-    provider.provide(get_vector_store)
-    provider.provide(fake_embeddings)
-    provider.provide(fake_chat_model)
+    provider.provide(get_vector_store, scope=Scope.APP)
+    provider.provide(fake_embeddings, scope=Scope.APP)
+    provider.provide(fake_chat_model, scope=Scope.APP)
     provider.provide(get_engine, scope=Scope.APP)
     provider.provide(get_sessionmaker, scope=Scope.APP)
     provider.provide(get_session, provides=AsyncSession)
@@ -1,3 +1,4 @@
+from io import BytesIO
 from uuid import uuid4
 
 import pytest
@@ -6,7 +7,8 @@ from clever_faq.application.commands.document.create_document import (
     CreateDocumentCommand,
     CreateDocumentCommandHandler,
 )
-from clever_faq.application.common.ports.document.document_storage import DocumentDTO, DocumentStorage
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
+from clever_faq.application.common.ports.document.document_storage import DocumentStorage, DocumentUploadDTO
 from clever_faq.application.common.ports.scheduler.payloads.documents import RetrievalAugmentedGenerationPayload
 from clever_faq.application.common.ports.scheduler.task_id import TaskID, TaskKey
 from clever_faq.application.common.ports.scheduler.task_scheduler import TaskScheduler
@@ -16,11 +18,20 @@ from clever_faq.domain.document.values.document_id import DocumentID
 from clever_faq.domain.document.values.document_type import DocumentType
 
 
+class FakeDocumentContentStream:
+    def __init__(self, content: bytes) -> None:
+        self._content = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._content.read(size)
+
+
 @pytest.mark.asyncio
 async def test_create_document_handler_stores_document_and_schedules_task(
     fake_document_id_generator: DocumentIDGenerator,
     fake_document_storage: DocumentStorage,
     fake_task_scheduler: TaskScheduler,
+    fake_document_content_index: DocumentContentIndex,
 ) -> None:
     document_id = DocumentID(uuid4())
     fake_document_id_generator.return_value = document_id  # type: ignore[attr-defined]
@@ -32,11 +43,12 @@ async def test_create_document_handler_stores_document_and_schedules_task(
         document_id_generator=fake_document_id_generator,
         document_storage=fake_document_storage,
         scheduler=fake_task_scheduler,
+        document_content_index=fake_document_content_index,
     )
 
     command = CreateDocumentCommand(
         name="Manual.pdf",
-        content=b"binary",
+        content=FakeDocumentContentStream(b"binary"),
         mime_type="application/pdf",
     )
 
@@ -45,7 +57,7 @@ async def test_create_document_handler_stores_document_and_schedules_task(
     assert result == CreateDocumentView(document_id=document_id, task_id=expected_task_id)
 
     fake_document_storage.add.assert_awaited_once()
-    stored_document: DocumentDTO = fake_document_storage.add.await_args.kwargs["document"]
+    stored_document: DocumentUploadDTO = fake_document_storage.add.await_args.kwargs["document"]
     assert stored_document.document_id == document_id
     assert stored_document.document_name.value == command.name
     assert stored_document.document_type == DocumentType.PDF
@@ -62,3 +74,85 @@ async def test_create_document_handler_stores_document_and_schedules_task(
     payload = schedule_kwargs["payload"]
     assert isinstance(payload, RetrievalAugmentedGenerationPayload)
     assert payload.document_id == document_id
+    assert payload.content_hash == "0" * 64
+
+
+@pytest.mark.asyncio
+async def test_create_document_handler_returns_existing_document_for_same_content(
+    fake_document_id_generator: DocumentIDGenerator,
+    fake_document_storage: DocumentStorage,
+    fake_task_scheduler: TaskScheduler,
+    fake_document_content_index: DocumentContentIndex,
+) -> None:
+    new_document_id = DocumentID(uuid4())
+    existing_document_id = DocumentID(uuid4())
+    fake_document_id_generator.return_value = new_document_id  # type: ignore[attr-defined]
+    fake_document_content_index.claim.side_effect = None  # type: ignore[attr-defined]
+    fake_document_content_index.claim.return_value = existing_document_id  # type: ignore[attr-defined]
+
+    expected_task_id = TaskID(f"retrieval_augmented_generation_document:{existing_document_id}")
+    fake_task_scheduler.make_task_id.return_value = expected_task_id  # type: ignore[attr-defined]
+
+    handler = CreateDocumentCommandHandler(
+        document_id_generator=fake_document_id_generator,
+        document_storage=fake_document_storage,
+        scheduler=fake_task_scheduler,
+        document_content_index=fake_document_content_index,
+    )
+
+    result = await handler(
+        CreateDocumentCommand(
+            name="Manual.pdf",
+            content=FakeDocumentContentStream(b"binary"),
+            mime_type="application/pdf",
+        )
+    )
+
+    assert result == CreateDocumentView(document_id=existing_document_id, task_id=expected_task_id)
+    fake_document_storage.exists.assert_awaited_once_with(existing_document_id)  # type: ignore[attr-defined]
+    fake_document_storage.delete.assert_awaited_once_with(new_document_id)
+    fake_task_scheduler.make_task_id.assert_called_once_with(
+        key=TaskKey("retrieval_augmented_generation_document"),
+        value=str(existing_document_id),
+    )
+    fake_task_scheduler.schedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_document_handler_takes_over_content_of_removed_document(
+    fake_document_id_generator: DocumentIDGenerator,
+    fake_document_storage: DocumentStorage,
+    fake_task_scheduler: TaskScheduler,
+    fake_document_content_index: DocumentContentIndex,
+) -> None:
+    new_document_id = DocumentID(uuid4())
+    removed_document_id = DocumentID(uuid4())
+    fake_document_id_generator.return_value = new_document_id  # type: ignore[attr-defined]
+    fake_document_content_index.claim.side_effect = [removed_document_id, new_document_id]  # type: ignore[attr-defined]
+    fake_document_storage.exists.return_value = False  # type: ignore[attr-defined]
+
+    expected_task_id = TaskID(f"retrieval_augmented_generation_document:{new_document_id}")
+    fake_task_scheduler.make_task_id.return_value = expected_task_id  # type: ignore[attr-defined]
+
+    handler = CreateDocumentCommandHandler(
+        document_id_generator=fake_document_id_generator,
+        document_storage=fake_document_storage,
+        scheduler=fake_task_scheduler,
+        document_content_index=fake_document_content_index,
+    )
+
+    result = await handler(
+        CreateDocumentCommand(
+            name="Manual.pdf",
+            content=FakeDocumentContentStream(b"binary"),
+            mime_type="application/pdf",
+        )
+    )
+
+    assert result == CreateDocumentView(document_id=new_document_id, task_id=expected_task_id)
+    fake_document_storage.exists.assert_awaited_once_with(removed_document_id)  # type: ignore[attr-defined]
+    fake_document_content_index.release.assert_awaited_once_with(  # type: ignore[attr-defined]
+        content_hash="0" * 64, document_id=removed_document_id
+    )
+    fake_document_storage.delete.assert_not_awaited()  # type: ignore[attr-defined]
+    fake_task_scheduler.schedule.assert_called_once()  # type: ignore[attr-defined]
@@ -0,0 +1,140 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from io import BytesIO
+from typing import IO, TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from clever_faq.application.commands.document.retrieval_augmentation_for_document import (
+    RetrievalAugmentationForDocumentCommand,
+    RetrievalAugmentationForDocumentCommandHandler,
+)
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
+from clever_faq.application.common.ports.document.document_storage import DocumentDTO, DocumentStorage
+from clever_faq.application.common.ports.document.file_processor_factory import FileProcessorFactory
+from clever_faq.application.common.ports.transaction_manager import TransactionManager
+from clever_faq.application.errors.document import DocumentNotFoundError
+from clever_faq.domain.document.entities.chunk import Chunk
+from clever_faq.domain.document.entities.document import Document
+from clever_faq.domain.document.services.document import DocumentService
+from clever_faq.domain.document.values.chunk_id import ChunkID
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.domain.document.values.document_name import DocumentName
+from clever_faq.domain.document.values.document_text import DocumentText
+from clever_faq.domain.document.values.document_type import DocumentType
+
+if TYPE_CHECKING:
+    from clever_faq.application.common.ports.document.document_command_gateway import DocumentCommandGateway
+    from clever_faq.application.common.ports.document.indexing_checkpoint_store import IndexingCheckpointStore
+    from clever_faq.application.common.ports.document.lexical_index import LexicalIndex
+    from clever_faq.application.common.ports.question.answer_cache_invalidator import AnswerCacheInvalidator
+    from clever_faq.domain.document.ports.document_id_generator import DocumentIDGenerator
+    from clever_faq.domain.document.ports.text_splitter import TextSplitter
+
+
+class FakeFileProcessor:
+    async def extract_text(self, file: IO[bytes]) -> AsyncIterator[str]:
+        for line in file.read().decode().splitlines():
+            yield line
+
+
+class FakeTextSplitter:
+    async def split_text(self, document_id: DocumentID, texts: AsyncIterable[DocumentText]) -> AsyncIterator[Chunk]:
+        async for text in texts:
+            yield Chunk(id=ChunkID(document_id), text=text)
+
+
+class FakeDocumentCommandGateway:
+    def __init__(self, batch_size: int) -> None:
+        self.stored_texts: list[str] = []
+        self._batch_size = batch_size
+
+    async def add_chunks(self, document: Document, chunks: AsyncIterable[Chunk]) -> AsyncIterator[int]:  # noqa: ARG002
+        stored_count = 0
+        async for chunk in chunks:
+            self.stored_texts.append(chunk.text.value)
+            stored_count += 1
+            if stored_count % self._batch_size == 0:
+                yield stored_count
+        if stored_count % self._batch_size:
+            yield stored_count
+
+
+@pytest.mark.asyncio
+async def test_retrieval_augmentation_resumes_after_indexed_chunks(
+    fake_transaction: TransactionManager,
+    fake_document_content_index: DocumentContentIndex,
+) -> None:
+    document_id = DocumentID(uuid4())
+
+    fake_document_storage = Mock()
+    fake_document_storage.read_by_id = AsyncMock(
+        return_value=DocumentDTO(
+            document_id=document_id,
+            document_name=DocumentName("Manual.txt"),
+            document_type=DocumentType.TXT,
+            document_content=BytesIO(b"first\nsecond\nthird\nfourth\nfifth"),
+        )
+    )
+    fake_checkpoint_store = Mock()
+    fake_checkpoint_store.read = AsyncMock(return_value=2)
+    fake_checkpoint_store.save = AsyncMock()
+    fake_checkpoint_store.delete = AsyncMock()
+    fake_lexical_index = Mock()
+    fake_lexical_index.add_chunks = AsyncMock()
+    gateway = FakeDocumentCommandGateway(batch_size=2)
+
+    handler = RetrievalAugmentationForDocumentCommandHandler(
+        file_processor_factory=FileProcessorFactory({DocumentType.TXT: FakeFileProcessor()}),
+        document_service=DocumentService(
+            text_splitter=cast("TextSplitter", FakeTextSplitter()),
+            document_id_generator=cast("DocumentIDGenerator", Mock()),
+        ),
+        document_command_gateway=cast("DocumentCommandGateway", gateway),
+        transaction_manager=fake_transaction,
+        document_storage=cast("DocumentStorage", fake_document_storage),
+        answer_cache_invalidator=cast("AnswerCacheInvalidator", Mock(invalidate_document=AsyncMock())),
+        indexing_checkpoint_store=cast("IndexingCheckpointStore", fake_checkpoint_store),
+        lexical_index=cast("LexicalIndex", fake_lexical_index),
+        document_content_index=fake_document_content_index,
+    )
+
+    await handler(RetrievalAugmentationForDocumentCommand(document_id=document_id))
+
+    assert gateway.stored_texts == ["third", "fourth", "fifth"]
+    assert [call.args for call in fake_checkpoint_store.save.await_args_list] == [(document_id, 4), (document_id, 5)]
+    fake_checkpoint_store.delete.assert_awaited_once_with(document_id)
+    assert [[chunk.text.value for chunk in call.args[0]] for call in fake_lexical_index.add_chunks.await_args_list] == [
+        ["third", "fourth"],
+        ["fifth"],
+    ]
+    fake_document_content_index.release.assert_not_awaited()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_retrieval_augmentation_failure_releases_the_content_hash(
+    fake_transaction: TransactionManager,
+    fake_document_storage: DocumentStorage,
+    fake_document_content_index: DocumentContentIndex,
+) -> None:
+    document_id = DocumentID(uuid4())
+
+    handler = RetrievalAugmentationForDocumentCommandHandler(
+        file_processor_factory=FileProcessorFactory({}),
+        document_service=cast("DocumentService", Mock()),
+        document_command_gateway=cast("DocumentCommandGateway", Mock()),
+        transaction_manager=fake_transaction,
+        document_storage=fake_document_storage,
+        answer_cache_invalidator=cast("AnswerCacheInvalidator", Mock()),
+        indexing_checkpoint_store=cast("IndexingCheckpointStore", Mock()),
+        lexical_index=cast("LexicalIndex", Mock()),
+        document_content_index=fake_document_content_index,
+    )
+
+    with pytest.raises(DocumentNotFoundError):
+        await handler(RetrievalAugmentationForDocumentCommand(document_id=document_id, content_hash="a" * 64))
+
+    fake_document_content_index.release.assert_awaited_once_with(  # type: ignore[attr-defined]
+        content_hash="a" * 64, document_id=document_id
+    )
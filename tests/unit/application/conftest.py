@@ -3,7 +3,8 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from clever_faq.application.common.ports.document.document_storage import DocumentStorage
+from clever_faq.application.common.ports.document.document_content_index import DocumentContentIndex
+from clever_faq.application.common.ports.document.document_storage import DocumentStorage, StoredDocumentDTO
 from clever_faq.application.common.ports.scheduler.task_scheduler import TaskScheduler
 from clever_faq.application.common.ports.transaction_manager import TransactionManager
 from clever_faq.domain.document.ports.document_id_generator import DocumentIDGenerator
@@ -20,8 +21,10 @@ def fake_transaction() -> TransactionManager:
 @pytest.fixture
 def fake_document_storage() -> DocumentStorage:
     fake = Mock()
-    fake.add = AsyncMock()
+    fake.add = AsyncMock(return_value=StoredDocumentDTO(content_hash="0" * 64, size=0))
     fake.read_by_id = AsyncMock(return_value=None)
+    fake.exists = AsyncMock(return_value=True)
+    fake.delete = AsyncMock()
     return cast("DocumentStorage", fake)
 
 
@@ -38,3 +41,11 @@ def fake_task_scheduler() -> TaskScheduler:
 def fake_document_id_generator() -> DocumentIDGenerator:
     fake = Mock()
     return cast("DocumentIDGenerator", fake)
+
+
+@pytest.fixture
+def fake_document_content_index() -> DocumentContentIndex:
+    fake = Mock()
+    fake.claim = AsyncMock(side_effect=lambda content_hash, document_id: document_id)  # noqa: ARG005
+    fake.release = AsyncMock()
+    return cast("DocumentContentIndex", fake)
@@ -0,0 +1,219 @@
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from types import TracebackType
+from typing import Any, Self
+
+
+def _to_bytes(value: str | bytes | float) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+def _to_score(bound: str | float) -> float:
+    if bound in ("-inf", "+inf"):
+        return float(bound)
+    return float(bound)
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the subset of ``redis.asyncio.Redis`` used by the cache adapters.
+
+    Commands are coroutines on the client and are queued by ``pipeline()`` until ``execute``,
+    as in redis-py. Keys expire by ``time.monotonic``.
+    """
+
+    def __init__(self) -> None:
+        self.strings: dict[str, bytes] = {}
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.sorted_sets: dict[str, dict[bytes, float]] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.expires_at: dict[str, float] = {}
+        self.published: list[tuple[str, bytes]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        command: Callable[..., Any] = getattr(self, f"_{name}")
+
+        async def run(*args: object, **kwargs: object) -> object:
+            return command(*args, **kwargs)
+
+        return run
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":  # noqa: ARG002, FBT002
+        return FakePipeline(self)
+
+    def _expire_stale(self, name: str) -> None:
+        if name in self.expires_at and self.expires_at[name] <= time.monotonic():
+            self._delete_key(name)
+
+    def _delete_key(self, name: str) -> bool:
+        self.expires_at.pop(name, None)
+        return any(
+            store.pop(name, None) is not None for store in (self.strings, self.hashes, self.sorted_sets, self.sets)
+        )
+
+    def _exists_key(self, name: str) -> bool:
+        self._expire_stale(name)
+        return any(name in store for store in (self.strings, self.hashes, self.sorted_sets, self.sets))
+
+    def _get(self, name: str) -> bytes | None:
+        self._expire_stale(name)
+        return self.strings.get(name)
+
+    def _set(
+        self,
+        name: str,
+        value: str | bytes,
+        ex: int | None = None,
+        px: int | None = None,
+        nx: bool = False,  # noqa: FBT002
+        get: bool = False,  # noqa: FBT002
+    ) -> bytes | bool | None:
+        previous: bytes | None = self._get(name)
+        if nx and previous is not None:
+            return previous if get else None
+
+        self.strings[name] = _to_bytes(value)
+        self.expires_at.pop(name, None)
+        if ex is not None:
+            self.expires_at[name] = time.monotonic() + ex
+        if px is not None:
+            self.expires_at[name] = time.monotonic() + px / 1000
+        return previous if get else True
+
+    def _mget(self, names: Iterable[str]) -> list[bytes | None]:
+        return [self._get(name) for name in names]
+
+    def _pttl(self, name: str) -> int:
+        if not self._exists_key(name):
+            return -2
+        if name not in self.expires_at:
+            return -1
+        return math.ceil((self.expires_at[name] - time.monotonic()) * 1000)
+
+    def _expire(
+        self,
+        name: str,
+        seconds: int,
+        nx: bool = False,  # noqa: FBT002
+        gt: bool = False,  # noqa: FBT002
+    ) -> bool:
+        if not self._exists_key(name):
+            return False
+
+        expires_at: float = time.monotonic() + seconds
+        current: float | None = self.expires_at.get(name)
+        if (nx and current is not None) or (gt and (current is None or expires_at <= current)):
+            return False
+
+        self.expires_at[name] = expires_at
+        return True
+
+    def _unlink(self, *names: str) -> int:
+        return sum(self._delete_key(name) for name in names)
+
+    def _delete(self, *names: str) -> int:
+        return self._unlink(*names)
+
+    def _hset(self, name: str, mapping: Mapping[str, str | bytes]) -> int:
+        self._expire_stale(name)
+        hash_: dict[bytes, bytes] = self.hashes.setdefault(name, {})
+        added: int = sum(_to_bytes(field) not in hash_ for field in mapping)
+        hash_.update({_to_bytes(field): _to_bytes(value) for field, value in mapping.items()})
+        return added
+
+    def _hmget(self, name: str, fields: Iterable[str]) -> list[bytes | None]:
+        self._expire_stale(name)
+        hash_: dict[bytes, bytes] = self.hashes.get(name, {})
+        return [hash_.get(_to_bytes(field)) for field in fields]
+
+    def _hdel(self, name: str, *fields: str) -> int:
+        hash_: dict[bytes, bytes] = self.hashes.get(name, {})
+        return sum(hash_.pop(_to_bytes(field), None) is not None for field in fields)
+
+    def _zadd(self, name: str, mapping: Mapping[str, float]) -> int:
+        self._expire_stale(name)
+        sorted_set: dict[bytes, float] = self.sorted_sets.setdefault(name, {})
+        added: int = sum(_to_bytes(member) not in sorted_set for member in mapping)
+        sorted_set.update({_to_bytes(member): float(score) for member, score in mapping.items()})
+        return added
+
+    def _zcard(self, name: str) -> int:
+        self._expire_stale(name)
+        return len(self.sorted_sets.get(name, {}))
+
+    def _zrangebyscore(
+        self,
+        name: str,
+        min: str | float,  # noqa: A002
+        max: str | float,  # noqa: A002
+        withscores: bool = False,  # noqa: FBT002
+    ) -> list[Any]:
+        self._expire_stale(name)
+        entries: list[tuple[bytes, float]] = sorted(
+            (
+                (member, score)
+                for member, score in self.sorted_sets.get(name, {}).items()
+                if _to_score(min) <= score <= _to_score(max)
+            ),
+            key=lambda entry: (entry[1], entry[0]),
+        )
+        return entries if withscores else [member for member, _ in entries]
+
+    def _zpopmin(self, name: str, count: int = 1) -> list[tuple[bytes, float]]:
+        popped: list[tuple[bytes, float]] = self._zrangebyscore(name, "-inf", "+inf", withscores=True)[:count]
+        for member, _ in popped:
+            del self.sorted_sets[name][member]
+        return popped
+
+    def _zrem(self, name: str, *members: str) -> int:
+        sorted_set: dict[bytes, float] = self.sorted_sets.get(name, {})
+        return sum(sorted_set.pop(_to_bytes(member), None) is not None for member in members)
+
+    def _sadd(self, name: str, *members: str) -> int:
+        self._expire_stale(name)
+        set_: set[bytes] = self.sets.setdefault(name, set())
+        added: int = sum(_to_bytes(member) not in set_ for member in members)
+        set_.update(_to_bytes(member) for member in members)
+        return added
+
+    def _sunion(self, names: Iterable[str]) -> set[bytes]:
+        members: set[bytes] = set()
+        for name in names:
+            self._expire_stale(name)
+            members |= self.sets.get(name, set())
+        return members
+
+    def _publish(self, channel: str, message: bytes) -> int:
+        self.published.append((channel, message))
+        return 0
+
+
+class FakePipeline:
+    def __init__(self, redis_client: FakeRedis) -> None:
+        self._redis_client = redis_client
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._commands.clear()
+
+    def __getattr__(self, name: str) -> Callable[..., Self]:
+        def queue(*args: object, **kwargs: object) -> Self:
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [getattr(self._redis_client, f"_{name}")(*args, **kwargs) for name, args, kwargs in commands]
@@ -144,6 +144,30 @@ def create_redis_settings_data(
     )
 
 
+class AnswerCacheSettingsData(TypedDict):
+    ANSWER_CACHE_TTL_SECONDS: int
+    ANSWER_CACHE_SEMANTIC_SIMILARITY_THRESHOLD: float
+    ANSWER_CACHE_SEMANTIC_NEAR_HIT_THRESHOLD: float
+    ANSWER_CACHE_SEMANTIC_MAX_ENTRIES: int
+    ANSWER_CACHE_SEMANTIC_SYNC_INTERVAL_SECONDS: float
+
+
+def create_answer_cache_settings_data(
+    ttl_seconds: int = 3600,
+    semantic_similarity_threshold: float = 0.92,
+    semantic_near_hit_threshold: float = 0.85,
+    semantic_max_entries: int = 10_000,
+    semantic_sync_interval_seconds: float = 30.0,
+) -> AnswerCacheSettingsData:
+    return AnswerCacheSettingsData(
+        ANSWER_CACHE_TTL_SECONDS=ttl_seconds,
+        ANSWER_CACHE_SEMANTIC_SIMILARITY_THRESHOLD=semantic_similarity_threshold,
+        ANSWER_CACHE_SEMANTIC_NEAR_HIT_THRESHOLD=semantic_near_hit_threshold,
+        ANSWER_CACHE_SEMANTIC_MAX_ENTRIES=semantic_max_entries,
+        ANSWER_CACHE_SEMANTIC_SYNC_INTERVAL_SECONDS=semantic_sync_interval_seconds,
+    )
+
+
 class RabbitSettingsData(TypedDict):
     RABBITMQ_HOST: str
     RABBITMQ_PORT: int
@@ -198,6 +222,9 @@ class S3SettingsData(TypedDict):
     MINIO_ROOT_USER: str
     MINIO_ROOT_PASSWORD: str
     MINIO_FILES_BUCKET: str
+    MINIO_MAX_UPLOAD_SIZE_BYTES: int
+    MINIO_MULTIPART_CHUNK_SIZE_BYTES: int
+    MINIO_READ_SPOOL_MAX_BYTES: int
 
 
 def create_s3_settings_data(
@@ -206,6 +233,9 @@ def create_s3_settings_data(
     aws_access_key_id: str = "minioadmin",
     aws_secret_access_key: str = "minioadmin",  # noqa: S107
     files_bucket_name: str = "images",
+    max_upload_size_bytes: int = 100 * 1024 * 1024,
+    multipart_chunk_size_bytes: int = 8 * 1024 * 1024,
+    read_spool_max_bytes: int = 8 * 1024 * 1024,
 ) -> S3SettingsData:
     return S3SettingsData(
         MINIO_HOST=host,
@@ -213,6 +243,9 @@ def create_s3_settings_data(
         MINIO_ROOT_USER=aws_access_key_id,
         MINIO_ROOT_PASSWORD=aws_secret_access_key,
         MINIO_FILES_BUCKET=files_bucket_name,
+        MINIO_MAX_UPLOAD_SIZE_BYTES=max_upload_size_bytes,
+        MINIO_MULTIPART_CHUNK_SIZE_BYTES=multipart_chunk_size_bytes,
+        MINIO_READ_SPOOL_MAX_BYTES=read_spool_max_bytes,
     )
 
 
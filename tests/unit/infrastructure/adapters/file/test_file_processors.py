@@ -0,0 +1,121 @@
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import IO
+
+import docx
+import pypdfium2 as pdfium
+import pytest
+
+from clever_faq.application.common.ports.document.file_processor import FileProcessor
+from clever_faq.infrastructure.adapters.file.docx import DocxFileProcessor
+from clever_faq.infrastructure.adapters.file.pdf import PdfFileProcessor
+from clever_faq.infrastructure.adapters.file.text import TextFileProcessor
+from clever_faq.infrastructure.errors.file import CantReadFileError
+
+DATA_DIR = Path(__file__).parents[4] / "data"
+
+
+async def extract(processor: FileProcessor, file: IO[bytes]) -> str:
+    return "".join([text async for text in processor.extract_text(file)])
+
+
+@pytest.fixture(scope="module")
+def process_pool() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        yield executor
+
+
+async def test_pdf_text_is_extracted_in_process_pool(process_pool: ProcessPoolExecutor) -> None:
+    # Arrange
+    processor = PdfFileProcessor(process_pool, pages_per_task=1, max_ranges_in_flight=2)
+
+    # Act
+    with (DATA_DIR / "SmartTask_Overview.pdf").open("rb") as file:
+        extracted_text = await extract(processor, file)
+
+    # Assert
+    assert "SmartTask" in extracted_text
+
+
+@pytest.fixture(scope="module")
+def multipage_pdf() -> bytes:
+    document = pdfium.PdfDocument.new()
+    for path in sorted(DATA_DIR.glob("*.pdf")):
+        document.import_pages(pdfium.PdfDocument(path))
+    # a page without a text layer
+    document.new_page(200, 200)
+
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "pages_per_task",
+    [
+        pytest.param(1, id="page_per_task"),
+        pytest.param(4, id="uneven_ranges"),
+        pytest.param(100, id="whole_document"),
+    ],
+)
+async def test_pdf_pages_are_joined_in_order(
+    process_pool: ProcessPoolExecutor,
+    multipage_pdf: bytes,
+    pages_per_task: int,
+) -> None:
+    # Arrange
+    processor = PdfFileProcessor(process_pool, pages_per_task=pages_per_task, max_ranges_in_flight=2)
+
+    # Act
+    extracted_text = await extract(processor, BytesIO(multipage_pdf))
+
+    # Assert
+    titles = [line for line in extracted_text.splitlines() if line.startswith("SmartTask ") and len(line) < 40]
+    assert titles == [
+        "SmartTask API Guide",
+        "SmartTask Overview",
+        "SmartTask Security & Privacy",
+        "SmartTask Troubleshooting Guide",
+        "SmartTask User Manual",
+    ]
+    assert extracted_text.endswith("\n")
+
+
+async def test_process_pool_error_reaches_caller(process_pool: ProcessPoolExecutor) -> None:
+    # Arrange
+    processor = PdfFileProcessor(process_pool, pages_per_task=1, max_ranges_in_flight=2)
+
+    # Act & Assert
+    with pytest.raises(CantReadFileError):
+        await extract(processor, BytesIO(b"not a pdf"))
+
+
+async def test_docx_text_is_extracted_in_process_pool(process_pool: ProcessPoolExecutor) -> None:
+    # Arrange
+    document = docx.Document()
+    document.add_paragraph("Сброс пароля")
+    document.add_paragraph("Откройте профиль.")
+    content = BytesIO()
+    document.save(content)
+    content.seek(0)
+    processor = DocxFileProcessor(process_pool)
+
+    # Act
+    extracted_text = await extract(processor, content)
+
+    # Assert
+    assert extracted_text == "Сброс пароля\nОткройте профиль."
+
+
+async def test_text_file_is_decoded() -> None:
+    # Arrange
+    processor = TextFileProcessor()
+
+    # Act
+    extracted_text = await extract(processor, BytesIO("Привет".encode()))
+
+    # Assert
+    assert extracted_text == "Привет"
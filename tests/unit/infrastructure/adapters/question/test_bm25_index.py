@@ -0,0 +1,99 @@
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from clever_faq.domain.document.entities.chunk import Chunk
+from clever_faq.domain.document.values.chunk_id import ChunkID
+from clever_faq.domain.document.values.document_text import DocumentText
+from clever_faq.infrastructure.adapters.question.bm25_index import RedisBM25Index, tokenize
+from tests.unit.factories.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def fake_redis() -> Redis:
+    return cast("Redis", FakeRedis())
+
+
+def create_index(redis_client: Redis) -> RedisBM25Index:
+    return RedisBM25Index(redis_client, namespace="test", k1=1.2, b=0.75, sync_interval_seconds=0.0)
+
+
+def create_chunk(text: str) -> Chunk:
+    return Chunk(id=ChunkID(uuid4()), text=DocumentText(text))
+
+
+def test_joined_words_are_kept_whole_and_split() -> None:
+    # Act
+    tokens = list(tokenize("Ошибка E-1023 в /api/v1/tasks"))
+
+    # Assert
+    assert tokens == ["ошибка", "e-1023", "e", "1023", "в", "api/v1/tasks", "api", "v1", "tasks"]
+
+
+async def test_added_chunks_are_only_written_to_redis() -> None:
+    # Arrange
+    pipe = Mock(execute=AsyncMock())
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipe
+    redis_client = Mock(pipeline=Mock(return_value=pipeline))
+    index = create_index(cast("Redis", redis_client))
+    chunk = create_chunk("Webhook retries use exponential backoff")
+
+    # Act
+    await index.add_chunks([chunk])
+
+    # Assert
+    pipe.hset.assert_called_once_with("test:texts", mapping={str(chunk.id): chunk.text.value})
+    pipe.zadd.assert_called_once()
+    pipe.execute.assert_awaited_once()
+    assert len(index) == 0
+
+
+async def test_chunk_with_rare_term_is_ranked_first(fake_redis: Redis) -> None:
+    # Arrange
+    index = create_index(fake_redis)
+    error_chunk = create_chunk("SmartTask returns error E-1023 when the token expired")
+    chunks = [
+        create_chunk("SmartTask creates tasks and assigns them to users"),
+        error_chunk,
+        create_chunk("SmartTask error messages are shown in the task card"),
+    ]
+    await index.add_chunks(chunks)
+
+    # Act
+    hits = await index.search("What does SmartTask error E-1023 mean?", limit=2)
+
+    # Assert
+    assert [hit.chunk_id for hit in hits] == [str(error_chunk.id), str(chunks[2].id)]
+
+
+async def test_indexing_chunk_again_replaces_its_text(fake_redis: Redis) -> None:
+    # Arrange
+    index = create_index(fake_redis)
+    chunk_id = ChunkID(uuid4())
+    await index.add_chunks([Chunk(id=chunk_id, text=DocumentText("old endpoint /api/v1/tasks"))])
+    assert await index.search("v1", limit=5) != []
+
+    # Act
+    await index.add_chunks([Chunk(id=chunk_id, text=DocumentText("new endpoint /api/v2/tasks"))])
+
+    # Assert
+    assert await index.search("v1", limit=5) == []
+    assert await index.search("v2", limit=5) != []
+    assert len(index) == 1
+
+
+async def test_chunks_indexed_by_other_processes_are_synced(fake_redis: Redis) -> None:
+    # Arrange
+    chunk = create_chunk("Webhook retries use exponential backoff")
+    await create_index(fake_redis).add_chunks([chunk])
+    index = create_index(fake_redis)
+
+    # Act
+    hits = await index.search("webhook backoff", limit=5)
+
+    # Assert
+    assert [hit.chunk_id for hit in hits] == [str(chunk.id)]
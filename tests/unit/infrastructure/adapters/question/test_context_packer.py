@@ -0,0 +1,66 @@
+from langchain_core.documents import Document as LangchainDocument
+
+from clever_faq.infrastructure.adapters.question.context_packer import TokenBudgetContextPacker, estimate_tokens
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+async def test_context_is_packed_by_relevance_within_budget_without_duplicates() -> None:
+    # Arrange
+    packer = TokenBudgetContextPacker(token_budget=12, duplicate_threshold=0.8, count_tokens=count_words)
+    documents = [
+        LangchainDocument(id="best", page_content="Reset the password in the profile settings page"),
+        LangchainDocument(id="copy", page_content="Reset the password in the profile settings page."),
+        LangchainDocument(
+            id="long", page_content="Passwords expire every ninety days unless an administrator changes it"
+        ),
+        LangchainDocument(id="short", page_content="Contact support otherwise"),
+    ]
+
+    # Act
+    packed = await packer.acompress_documents(documents, "How to reset the password?")
+
+    # Assert
+    assert [document.id for document in packed] == ["best", "short"]
+
+
+async def test_most_relevant_chunk_is_kept_even_over_budget() -> None:
+    # Arrange
+    packer = TokenBudgetContextPacker(token_budget=1, duplicate_threshold=0.8, count_tokens=count_words)
+    documents = [LangchainDocument(id="only", page_content="Reset the password in the profile settings page")]
+
+    # Act
+    packed = await packer.acompress_documents(documents, "How to reset the password?")
+
+    # Assert
+    assert [document.id for document in packed] == ["only"]
+
+
+def test_russian_text_is_estimated_at_two_characters_per_token() -> None:
+    # Arrange
+    text = "Сброс пароля выполняется в настройках профиля"
+
+    # Act
+    tokens = estimate_tokens(text)
+
+    # Assert
+    assert tokens == 22
+
+
+async def test_russian_context_is_packed_within_budget() -> None:
+    # Arrange
+    packer = TokenBudgetContextPacker(token_budget=40, duplicate_threshold=0.8)
+    documents = [
+        LangchainDocument(id="best", page_content="Сброс пароля выполняется в настройках профиля"),
+        LangchainDocument(id="second", page_content="Пароль действует девяносто дней, потом его нужно сменить"),
+        LangchainDocument(id="short", page_content="Код ошибки E-1023"),
+    ]
+
+    # Act
+    packed = await packer.acompress_documents(documents, "Как сбросить пароль?")
+
+    # Assert
+    assert [document.id for document in packed] == ["best", "short"]
+    assert sum(estimate_tokens(document.page_content) for document in packed) <= 40
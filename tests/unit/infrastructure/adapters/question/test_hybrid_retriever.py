@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from langchain_core.documents import Document as LangchainDocument
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.infrastructure.adapters.question.bm25_index import LexicalHit, RedisBM25Index
+from clever_faq.infrastructure.adapters.question.hybrid_retriever import HybridRetriever
+from clever_faq.infrastructure.cache.retrieval_cache import RetrievalCache
+from clever_faq.infrastructure.cache.stats import RetrievalCacheStats
+
+
+@pytest.fixture
+def vector_store() -> Mock:
+    fake = Mock(spec=VectorStore)
+    fake.asimilarity_search_by_vector = AsyncMock(
+        return_value=[LangchainDocument(id=chunk_id, page_content=chunk_id) for chunk_id in ("a", "b", "c")]
+    )
+    fake.aget_by_ids = AsyncMock(return_value=[LangchainDocument(id="d", page_content="d")])
+    fake.similarity_search_by_vector = Mock(return_value=fake.asimilarity_search_by_vector.return_value)
+    fake.get_by_ids = Mock(return_value=fake.aget_by_ids.return_value)
+    return fake
+
+
+@pytest.fixture
+def lexical_index() -> Mock:
+    fake = Mock(spec=RedisBM25Index)
+    fake.search = AsyncMock(return_value=[LexicalHit(chunk_id="d", score=9.0), LexicalHit(chunk_id="c", score=5.0)])
+    fake.search_local = Mock(return_value=fake.search.return_value)
+    return fake
+
+
+def create_retriever(vector_store: Mock, lexical_index: Mock, cache: RetrievalCache | None = None) -> HybridRetriever:
+    embeddings = Mock(spec=Embeddings)
+    embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    embeddings.embed_query = Mock(return_value=[0.1, 0.2, 0.3])
+    return HybridRetriever(
+        vector_store=vector_store,
+        embeddings=embeddings,
+        lexical_index=lexical_index,
+        top_k=3,
+        candidates=10,
+        rrf_k=60,
+        cache=cache,
+    )
+
+
+async def test_chunks_found_by_both_searches_are_ranked_first(vector_store: Mock, lexical_index: Mock) -> None:
+    # Arrange
+    retriever = create_retriever(vector_store, lexical_index)
+
+    # Act
+    documents = await retriever.ainvoke("Question?")
+
+    # Assert
+    assert [document.id for document in documents] == ["c", "a", "d"]
+    vector_store.aget_by_ids.assert_awaited_once_with(["d"])
+    lexical_index.search.assert_awaited_once_with("question", limit=10)
+
+
+def test_sync_retrieval_fuses_the_same_way(vector_store: Mock, lexical_index: Mock) -> None:
+    # Arrange
+    retriever = create_retriever(vector_store, lexical_index)
+
+    # Act
+    documents = retriever.invoke("Question?")
+
+    # Assert
+    assert [document.id for document in documents] == ["c", "a", "d"]
+    vector_store.get_by_ids.assert_called_once_with(["d"])
+    lexical_index.search_local.assert_called_once_with("question", limit=10)
+
+
+async def test_cached_results_skip_both_searches(vector_store: Mock, lexical_index: Mock) -> None:
+    # Arrange
+    cached_values: dict[str, bytes] = {}
+    cache_store = Mock(spec=CacheStore)
+    cache_store.get = AsyncMock(side_effect=cached_values.get)
+    cache_store.set = AsyncMock(side_effect=lambda name, value, **_: cached_values.__setitem__(name, value))
+    knowledge_base_generation = Mock(spec=KnowledgeBaseGeneration)
+    knowledge_base_generation.current = AsyncMock(return_value=1)
+    stats = RetrievalCacheStats()
+    cache = RetrievalCache(cache_store, knowledge_base_generation, settings_version="v1", ttl_seconds=60, stats=stats)
+    retriever = create_retriever(vector_store, lexical_index, cache)
+
+    # Act
+    first = await retriever.ainvoke("Question?")
+    second = await retriever.ainvoke("  question ")
+
+    # Assert
+    assert second == first
+    vector_store.asimilarity_search_by_vector.assert_awaited_once()
+    lexical_index.search.assert_awaited_once()
+    assert (stats.hits, stats.misses) == (1, 1)
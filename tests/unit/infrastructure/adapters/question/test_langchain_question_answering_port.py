@@ -0,0 +1,119 @@
+from typing import override
+from uuid import uuid4
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document as LangchainDocument
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel, GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.retrievers import BaseRetriever
+
+from clever_faq.application.common.ports.question.question_answering_port import AnswerDeltaDTO, MessageWithTokenDTO
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.infrastructure.adapters.question.langchain_question_answering_port import (
+    LangChainQuestionAnsweringPort,
+    _StreamingAnswerRewriter,
+)
+
+DOCUMENT_ID = uuid4()
+
+
+class FakeRetriever(BaseRetriever):
+    @override
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[LangchainDocument]:
+        return [LangchainDocument(page_content="Пароль меняется в профиле", metadata={"document_id": str(DOCUMENT_ID)})]
+
+
+async def test_tokens_are_taken_from_usage_metadata() -> None:
+    # Arrange
+    chat_model = FakeMessagesListChatModel(
+        responses=[
+            AIMessage(
+                "Откройте профиль и смените пароль.",
+                usage_metadata={
+                    "input_tokens": 850,
+                    "output_tokens": 12,
+                    "total_tokens": 862,
+                    "input_token_details": {"cache_read": 512},
+                },
+                response_metadata={"model_name": "fake"},
+            )
+        ]
+    )
+    port = LangChainQuestionAnsweringPort(chat_model, FakeRetriever())
+
+    # Act
+    answer = await port.answer_the_question(Message("Как сменить пароль?"))
+
+    # Assert
+    assert answer.tokens == Tokens(prompt=850, completion=12, cached_prompt=512)
+    assert answer.tokens.total == 862
+    assert {str(document_id) for document_id in answer.source_document_ids} == {str(DOCUMENT_ID)}
+
+
+async def test_streamed_deltas_add_up_to_the_answer() -> None:
+    # Arrange
+    chat_model = GenericFakeChatModel(messages=iter([AIMessage("Согласно контексту пароль меняется в профиле.")]))
+    port = LangChainQuestionAnsweringPort(chat_model, FakeRetriever())
+
+    # Act
+    items = [item async for item in port.stream_the_answer(Message("Как сменить пароль?"))]
+
+    # Assert
+    *deltas, answer = items
+    assert all(isinstance(delta, AnswerDeltaDTO) for delta in deltas)
+    assert isinstance(answer, MessageWithTokenDTO)
+    assert "".join(delta.text for delta in deltas if isinstance(delta, AnswerDeltaDTO)) == answer.message.value
+    assert answer.message.value == "Согласно документации пароль меняется в профиле."
+
+
+async def test_closed_stream_stops_without_error() -> None:
+    # Arrange
+    chat_model = GenericFakeChatModel(messages=iter([AIMessage("Откройте профиль и смените пароль.")]))
+    port = LangChainQuestionAnsweringPort(chat_model, FakeRetriever())
+    stream = port.stream_the_answer(Message("Как сменить пароль?"))
+
+    # Act
+    first_item = await anext(stream)
+    await stream.aclose()
+
+    # Assert
+    assert first_item == AnswerDeltaDTO(text="Откройте")
+
+
+def test_phrase_split_between_deltas_is_rewritten() -> None:
+    # Arrange
+    rewriter = _StreamingAnswerRewriter()
+
+    # Act
+    parts = [rewriter.feed("Согласно кон"), rewriter.feed("тексту, пароль"), rewriter.flush()]
+
+    # Assert
+    assert parts[0] == ""
+    assert "".join(parts) == "Согласно документации, пароль"
+
+
+def test_text_that_cant_start_a_phrase_is_not_held_back() -> None:
+    # Arrange
+    rewriter = _StreamingAnswerRewriter()
+
+    # Act
+    ready = rewriter.feed("Откройте профиль. ")
+
+    # Assert
+    assert ready == "Откройте профиль. "
+    assert rewriter.flush() == ""
+
+
+def test_held_back_tail_that_is_not_a_phrase_is_released() -> None:
+    # Arrange
+    rewriter = _StreamingAnswerRewriter()
+
+    # Act
+    parts = [rewriter.feed("См. раздел 2. В"), rewriter.feed(" нём описан сброс."), rewriter.flush()]
+
+    # Assert
+    assert parts[0] == "См. раздел 2. "
+    assert "".join(parts) == "См. раздел 2. В нём описан сброс."
@@ -0,0 +1,19 @@
+from langchain_core.documents import Document as LangchainDocument
+
+from clever_faq.infrastructure.adapters.question.term_overlap_reranker import TermOverlapReranker
+
+
+async def test_chunk_covering_the_question_is_moved_up() -> None:
+    # Arrange
+    documents = [
+        LangchainDocument(id="general", page_content="SmartTask помогает командам планировать задачи"),
+        LangchainDocument(id="other", page_content="Отчеты SmartTask выгружаются в формате CSV"),
+        LangchainDocument(id="error", page_content="Ошибку E-1023 SmartTask возвращает при истекшем токене"),
+    ]
+
+    # Act
+    reranked = await TermOverlapReranker().acompress_documents(documents, "Что значит ошибка E-1023 в SmartTask?")
+
+    # Assert
+    assert [document.id for document in reranked] == ["error", "general", "other"]
+    assert all("relevance_score" in document.metadata for document in reranked)
@@ -0,0 +1,144 @@
+from collections.abc import AsyncIterator
+from typing import cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from clever_faq.domain.document.entities.chunk import Chunk
+from clever_faq.domain.document.ports.chunk_id_generator import ChunkIDGenerator
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.domain.document.values.document_text import DocumentText
+from clever_faq.infrastructure.adapters.common.langchain_text_splitter import SemanticTextSplitter
+from clever_faq.infrastructure.adapters.common.uuid5_chunk_id_generator import UUID5ChunkIDGenerator
+from clever_faq.setup.config.openai import OpenAIEmbeddingsSettings, OpenAISettings
+
+DOCUMENT_ID = DocumentID(uuid4())
+TOPIC_VECTORS = {"billing": [1.0, 0.0, 0.0], "security": [0.0, 1.0, 0.0]}
+
+
+async def embed_by_topic(texts: list[str]) -> list[list[float]]:
+    return [
+        [sum(vector[axis] for topic, vector in TOPIC_VECTORS.items() if topic in text) + 0.01 for axis in range(3)]
+        for text in texts
+    ]
+
+
+async def as_parts(*texts: str) -> AsyncIterator[DocumentText]:
+    for text in texts:
+        yield DocumentText(text)
+
+
+async def split(splitter: SemanticTextSplitter, *texts: str) -> list[Chunk]:
+    return [chunk async for chunk in splitter.split_text(DOCUMENT_ID, as_parts(*texts))]
+
+
+@pytest.fixture
+def fake_embeddings() -> Embeddings:
+    fake = Mock()
+    fake.aembed_documents = AsyncMock(side_effect=embed_by_topic)
+    return cast("Embeddings", fake)
+
+
+@pytest.fixture
+def openai_config() -> OpenAISettings:
+    return OpenAISettings(
+        OPENAI_API_KEY="test",
+        embeddings=OpenAIEmbeddingsSettings(
+            chunk_size=3,
+            max_concurrency=2,
+            LANGSMITH_TRACING=False,
+            LANGSMITH_API_KEY="test",
+        ),
+    )
+
+
+@pytest.fixture
+def chunk_id_generator() -> ChunkIDGenerator:
+    return UUID5ChunkIDGenerator()
+
+
+async def test_chunks_reuse_batched_sentence_embeddings(
+    fake_embeddings: Embeddings,
+    chunk_id_generator: ChunkIDGenerator,
+    openai_config: OpenAISettings,
+) -> None:
+    # Arrange
+    splitter = SemanticTextSplitter(fake_embeddings, chunk_id_generator, openai_config)
+    text = " ".join(
+        [
+            *(f"The billing plan {index} is paid monthly." for index in range(4)),
+            *(f"The security key {index} is rotated yearly." for index in range(4)),
+        ]
+    )
+
+    # Act
+    chunks = await split(splitter, text)
+
+    # Assert
+    assert " ".join(chunk.text.value for chunk in chunks) == text
+    assert all(chunk.embedding is not None for chunk in chunks)
+    batches = cast("AsyncMock", fake_embeddings.aembed_documents).call_args_list
+    assert sum(len(batch.args[0]) for batch in batches) == 8
+    assert all(len(batch.args[0]) <= openai_config.embeddings.chunk_size for batch in batches)
+
+
+async def test_overlong_sentence_is_split_before_embedding(
+    fake_embeddings: Embeddings,
+    chunk_id_generator: ChunkIDGenerator,
+    openai_config: OpenAISettings,
+) -> None:
+    # Arrange
+    splitter = SemanticTextSplitter(fake_embeddings, chunk_id_generator, openai_config)
+    text = "Short billing intro.\n\n" + " ".join(["security"] * 150) + "."
+
+    # Act
+    chunks = await split(splitter, text)
+
+    # Assert
+    assert chunks[0].text.value == "Short billing intro."
+    assert len(chunks) == 3
+    assert all(chunk.embedding is not None for chunk in chunks)
+
+
+async def test_parts_are_split_in_windows_embedding_each_sentence_once(
+    fake_embeddings: Embeddings,
+    chunk_id_generator: ChunkIDGenerator,
+    openai_config: OpenAISettings,
+) -> None:
+    # Arrange
+    splitter = SemanticTextSplitter(fake_embeddings, chunk_id_generator, openai_config)
+    sentences = [
+        *(f"The billing plan {index} is paid monthly." for index in range(7)),
+        *(f"The security key {index} is rotated yearly." for index in range(7)),
+    ]
+    text = " ".join(sentences)
+    # parts end in the middle of sentences
+    parts = [text[start : start + 50] for start in range(0, len(text), 50)]
+
+    # Act
+    chunks = await split(splitter, *parts)
+
+    # Assert
+    assert " ".join(chunk.text.value for chunk in chunks) == text
+    batches = cast("AsyncMock", fake_embeddings.aembed_documents).call_args_list
+    assert sum(len(batch.args[0]) for batch in batches) == len(sentences)
+
+
+async def test_splitting_again_gives_same_chunk_ids(
+    fake_embeddings: Embeddings,
+    chunk_id_generator: ChunkIDGenerator,
+    openai_config: OpenAISettings,
+) -> None:
+    # Arrange
+    splitter = SemanticTextSplitter(fake_embeddings, chunk_id_generator, openai_config)
+    text = " ".join(f"The billing plan {index} is paid monthly." for index in range(20))
+
+    # Act
+    first_chunks = await split(splitter, text)
+    second_chunks = await split(splitter, text)
+
+    # Assert
+    assert [chunk.id for chunk in first_chunks] == [chunk.id for chunk in second_chunks]
+    assert len({chunk.id for chunk in first_chunks}) == len(first_chunks)
@@ -0,0 +1,32 @@
+import pytest
+
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.infrastructure.cache.answer_cache_key import AnswerCacheKeyBuilder, normalize_question
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        pytest.param("Как сменить пароль?", "как сменить пароль", id="case_and_punctuation"),
+        pytest.param("  как   сменить\tпароль ", "как сменить пароль", id="whitespace"),
+        pytest.param("Где моё резюме?", "где мое резюме", id="yo"),
+        pytest.param("«Как войти?»", "как войти", id="quotes"),
+        pytest.param("ｗｉｆｉ пароль", "wifi пароль", id="fullwidth"),
+    ],
+)
+def test_normalize_question_folds_equivalent_questions(first: str, second: str) -> None:
+    # Act & Assert
+    assert normalize_question(first) == normalize_question(second)
+
+
+def test_normalize_question_keeps_inner_punctuation() -> None:
+    # Act & Assert
+    assert normalize_question("Что такое Wi-Fi?") == "что такое wi-fi"
+
+
+def test_cache_key_depends_on_version() -> None:
+    # Arrange
+    question = Message("Как сменить пароль?")
+
+    # Act & Assert
+    assert AnswerCacheKeyBuilder.build_key(question, "v:1") != AnswerCacheKeyBuilder.build_key(question, "v:2")
@@ -0,0 +1,104 @@
+from uuid import uuid4
+
+import ormsgpack
+import pytest
+
+from clever_faq.application.common.ports.question.question_answering_port import MessageWithTokenDTO
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.infrastructure.cache.adapters.answer_payload import (
+    build_dto_from_cache,
+    decode_answer,
+    encode_answer,
+    is_expired,
+    is_stale,
+)
+
+
+def test_answer_survives_cache_round_trip() -> None:
+    # Arrange
+    answer_dto = MessageWithTokenDTO(
+        message=Message("Откройте настройки профиля."),
+        tokens=Tokens(prompt=1200, completion=42, cached_prompt=1024),
+        source_document_ids=frozenset({DocumentID(uuid4()), DocumentID(uuid4())}),
+    )
+
+    # Act
+    payload = decode_answer(encode_answer(Message("Как сменить пароль?"), answer_dto, version="v:1"))
+
+    # Assert
+    assert payload is not None
+    assert payload["version"] == "v:1"
+    assert build_dto_from_cache(payload) == answer_dto
+
+
+def test_answer_without_sources_is_decoded() -> None:
+    # Arrange
+    cached_bytes = b'{"question": "q", "answer": "a", "tokens": 1}'
+
+    # Act
+    payload = decode_answer(cached_bytes)
+
+    # Assert
+    assert payload is not None
+    assert build_dto_from_cache(payload).source_document_ids == frozenset()
+
+
+def test_answer_with_malformed_sources_is_rejected() -> None:
+    # Act & Assert
+    assert decode_answer(b'{"question": "q", "answer": "a", "tokens": 1, "source_document_ids": ["x"]}') is None
+
+
+def test_answer_past_soft_ttl_is_stale_but_not_expired() -> None:
+    # Arrange
+    answer_dto = MessageWithTokenDTO(message=Message("Ответ"), tokens=Tokens(prompt=10, completion=1))
+
+    # Act
+    payload = decode_answer(encode_answer(Message("Вопрос"), answer_dto, version="v:1", soft_ttl=0, hard_ttl=60))
+
+    # Assert
+    assert payload is not None
+    assert is_stale(payload)
+    assert not is_expired(payload)
+
+
+@pytest.mark.parametrize(
+    "compression_threshold",
+    [
+        pytest.param(0, id="compressed"),
+        pytest.param(1_000_000, id="uncompressed"),
+    ],
+)
+def test_binary_answer_survives_cache_round_trip(compression_threshold: int) -> None:
+    # Arrange
+    answer_dto = MessageWithTokenDTO(
+        message=Message("Откройте настройки профиля. " * 20),
+        tokens=Tokens(prompt=900, completion=100),
+        source_document_ids=frozenset({DocumentID(uuid4())}),
+    )
+
+    # Act
+    payload = decode_answer(encode_answer(None, answer_dto, version="v:1", compression_threshold=compression_threshold))
+
+    # Assert
+    assert payload is not None
+    assert "question" not in payload
+    assert build_dto_from_cache(payload) == answer_dto
+
+
+def test_answer_with_completion_tokens_only_is_decoded() -> None:
+    # Arrange
+    cached_bytes = bytes((1,)) + ormsgpack.packb(["Ответ", 7, "v:1", [], None, None, None])
+
+    # Act
+    payload = decode_answer(cached_bytes)
+
+    # Assert
+    assert payload is not None
+    assert build_dto_from_cache(payload).tokens == Tokens(prompt=0, completion=7)
+
+
+def test_answer_in_unknown_format_is_rejected() -> None:
+    # Act & Assert
+    assert decode_answer(b"\xff garbage") is None
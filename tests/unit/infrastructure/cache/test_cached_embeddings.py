@@ -0,0 +1,97 @@
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+from clever_faq.infrastructure.cache.cached_embeddings import CachedEmbeddings
+from clever_faq.infrastructure.cache.stats import EmbeddingCacheStats
+
+CACHED_VECTOR = [0.5, 0.25]
+
+
+@pytest.fixture
+def fake_embeddings() -> Embeddings:
+    fake = Mock()
+    fake.embed_documents = Mock(side_effect=lambda texts: [[float(len(text)), 1.0] for text in texts])
+    fake.aembed_documents = AsyncMock(side_effect=lambda texts: [[float(len(text)), 1.0] for text in texts])
+    return cast("Embeddings", fake)
+
+
+@pytest.fixture
+def fake_redis() -> Redis:
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock()
+
+    fake = Mock()
+    fake.mget = AsyncMock(return_value=[np.asarray(CACHED_VECTOR, dtype=np.float32).tobytes(), None, None])
+    fake.pipeline = Mock(return_value=pipe)
+    return cast("Redis", fake)
+
+
+@pytest.fixture
+def fake_sync_redis() -> SyncRedis:
+    pipe = MagicMock()
+    pipe.__enter__.return_value = pipe
+
+    fake = Mock()
+    fake.mget = Mock(return_value=[np.asarray(CACHED_VECTOR, dtype=np.float32).tobytes(), None, None])
+    fake.pipeline = Mock(return_value=pipe)
+    return cast("SyncRedis", fake)
+
+
+def create_cached_embeddings(
+    embeddings: Embeddings,
+    redis_client: Redis,
+    sync_redis_client: SyncRedis,
+    stats: EmbeddingCacheStats,
+) -> CachedEmbeddings:
+    return CachedEmbeddings(
+        embeddings=embeddings,
+        redis_client=redis_client,
+        sync_redis_client=sync_redis_client,
+        namespace="embedding:test",
+        ttl_seconds=60,
+        stats=stats,
+    )
+
+
+async def test_only_missing_texts_are_embedded(
+    fake_embeddings: Embeddings,
+    fake_redis: Redis,
+    fake_sync_redis: SyncRedis,
+) -> None:
+    # Arrange
+    stats = EmbeddingCacheStats()
+    embeddings = create_cached_embeddings(fake_embeddings, fake_redis, fake_sync_redis, stats)
+
+    # Act
+    vectors = await embeddings.aembed_documents(["cached", "footer", "footer"])
+
+    # Assert
+    assert vectors == [CACHED_VECTOR, [6.0, 1.0], [6.0, 1.0]]
+    cast("AsyncMock", fake_embeddings.aembed_documents).assert_awaited_once_with(["footer"])
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_sync_calls_share_the_cache(
+    fake_embeddings: Embeddings,
+    fake_redis: Redis,
+    fake_sync_redis: SyncRedis,
+) -> None:
+    # Arrange
+    stats = EmbeddingCacheStats()
+    embeddings = create_cached_embeddings(fake_embeddings, fake_redis, fake_sync_redis, stats)
+
+    # Act
+    vectors = embeddings.embed_documents(["cached", "header", "footer"])
+
+    # Assert
+    assert vectors == [CACHED_VECTOR, [6.0, 1.0], [6.0, 1.0]]
+    cast("Mock", fake_embeddings.embed_documents).assert_called_once_with(["header", "footer"])
+    assert cast("Mock", fake_sync_redis.pipeline).return_value.set.call_count == 2
+    assert stats.hit_ratio == pytest.approx(1 / 3)
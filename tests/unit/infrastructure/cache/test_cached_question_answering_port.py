@@ -0,0 +1,177 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from clever_faq.application.common.ports.question.question_answering_port import (
+    MessageWithTokenDTO,
+    QuestionAnsweringPort,
+)
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.infrastructure.cache.adapters.answer_payload import decode_answer, encode_answer, is_stale
+from clever_faq.infrastructure.cache.adapters.cached_question_answering_port import CachedQuestionAnsweringPort
+from clever_faq.infrastructure.cache.answer_cache_key import AnswerCacheKeyBuilder
+from clever_faq.infrastructure.cache.redis_cache_store import RedisCacheStore
+from clever_faq.infrastructure.cache.single_flight import RedisSingleFlight
+from clever_faq.setup.config.cache import AnswerCacheConfig
+from tests.unit.factories.fake_redis import FakeRedis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+VERSION = "v:1"
+
+
+def create_answer(text: str) -> MessageWithTokenDTO:
+    return MessageWithTokenDTO(message=Message(text), tokens=Tokens(prompt=100, completion=10))
+
+
+async def settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def cache() -> RedisCacheStore:
+    return RedisCacheStore(cast("Redis", FakeRedis()))
+
+
+@pytest.fixture
+def model_release() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture
+def question_answering_port(model_release: asyncio.Event) -> Mock:
+    async def answer(question: Message) -> MessageWithTokenDTO:
+        await model_release.wait()
+        return create_answer(f"Новый ответ на {question.value}")
+
+    port = Mock(spec=QuestionAnsweringPort)
+    port.answer_the_question = AsyncMock(side_effect=answer)
+    return port
+
+
+async def run_alone(
+    key: str,  # noqa: ARG001
+    compute: Callable[[], Awaitable[MessageWithTokenDTO]],
+    read_result: Callable[[], Awaitable[MessageWithTokenDTO | None]],  # noqa: ARG001
+) -> MessageWithTokenDTO:
+    return await compute()
+
+
+def create_port(
+    question_answering_port: Mock,
+    cache: RedisCacheStore,
+    refresh_concurrency: int = 4,
+) -> CachedQuestionAnsweringPort:
+    key_builder = Mock(spec=AnswerCacheKeyBuilder)
+    key_builder.version = AsyncMock(return_value=VERSION)
+    key_builder.build_key = AnswerCacheKeyBuilder.build_key
+    single_flight = Mock(spec=RedisSingleFlight)
+    single_flight.run = AsyncMock(side_effect=run_alone)
+    config = AnswerCacheConfig(
+        ANSWER_CACHE_TTL_SECONDS=60,
+        ANSWER_CACHE_STALE_WHILE_REVALIDATE_SECONDS=600,
+        ANSWER_CACHE_REFRESH_CONCURRENCY=refresh_concurrency,
+    )
+    return CachedQuestionAnsweringPort(question_answering_port, cache, key_builder, single_flight, config)
+
+
+async def cache_stale_answer(cache: RedisCacheStore, question: str) -> str:
+    cache_key = AnswerCacheKeyBuilder.build_key(Message(question), VERSION)
+    await cache.set(
+        cache_key, encode_answer(None, create_answer(f"Старый ответ на {question}"), VERSION, -1, 600), ttl=600
+    )
+    return cache_key
+
+
+async def test_stale_answer_is_served_while_refreshed(
+    question_answering_port: Mock,
+    cache: RedisCacheStore,
+    model_release: asyncio.Event,
+) -> None:
+    # Arrange
+    cache_key = await cache_stale_answer(cache, "Как сменить пароль?")
+    port = create_port(question_answering_port, cache)
+
+    # Act
+    answer = await port.answer_the_question(Message("Как сменить пароль?"))
+    model_release.set()
+    await settle()
+
+    # Assert
+    assert answer.message == Message("Старый ответ на Как сменить пароль?")
+    question_answering_port.answer_the_question.assert_awaited_once()
+    refreshed_bytes = await cache.get(cache_key)
+    assert refreshed_bytes is not None
+    refreshed_payload = decode_answer(refreshed_bytes)
+    assert refreshed_payload is not None
+    assert refreshed_payload["answer"] == "Новый ответ на Как сменить пароль?"
+    assert not is_stale(refreshed_payload)
+
+
+async def test_key_is_refreshed_once_at_a_time(
+    question_answering_port: Mock,
+    cache: RedisCacheStore,
+    model_release: asyncio.Event,
+) -> None:
+    # Arrange
+    await cache_stale_answer(cache, "Как сменить пароль?")
+    port = create_port(question_answering_port, cache)
+
+    # Act
+    for _ in range(3):
+        await port.answer_the_question(Message("Как сменить пароль?"))
+    await settle()
+    model_release.set()
+    await settle()
+
+    # Assert
+    question_answering_port.answer_the_question.assert_awaited_once()
+
+
+async def test_refreshes_over_concurrency_limit_are_skipped(
+    question_answering_port: Mock,
+    cache: RedisCacheStore,
+    model_release: asyncio.Event,
+) -> None:
+    # Arrange
+    await cache_stale_answer(cache, "Как сменить пароль?")
+    await cache_stale_answer(cache, "Как удалить задачу?")
+    port = create_port(question_answering_port, cache, refresh_concurrency=1)
+
+    # Act
+    await port.answer_the_question(Message("Как сменить пароль?"))
+    await settle()
+    answer = await port.answer_the_question(Message("Как удалить задачу?"))
+    model_release.set()
+    await settle()
+
+    # Assert
+    assert answer.message == Message("Старый ответ на Как удалить задачу?")
+    question_answering_port.answer_the_question.assert_awaited_once_with(Message("Как сменить пароль?"))
+
+
+async def test_failed_refresh_keeps_stale_answer(
+    question_answering_port: Mock,
+    cache: RedisCacheStore,
+) -> None:
+    # Arrange
+    await cache_stale_answer(cache, "Как сменить пароль?")
+    question_answering_port.answer_the_question.side_effect = RuntimeError("Model is unavailable")
+    port = create_port(question_answering_port, cache)
+
+    # Act
+    await port.answer_the_question(Message("Как сменить пароль?"))
+    await settle()
+    answer = await port.answer_the_question(Message("Как сменить пароль?"))
+    await settle()
+
+    # Assert
+    assert answer.message == Message("Старый ответ на Как сменить пароль?")
+    # the failed refresh released the key, so the next stale hit tries again
+    assert question_answering_port.answer_the_question.await_count == 2
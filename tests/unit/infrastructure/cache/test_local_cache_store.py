@@ -0,0 +1,166 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from redis.asyncio import Redis
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.infrastructure.cache.local_cache_store import LocalLRUCacheStore
+
+
+async def _listen_forever() -> AsyncIterator[dict[str, Any]]:
+    await asyncio.Event().wait()
+    yield {}
+
+
+@pytest.fixture
+def fake_redis() -> Redis:
+    pubsub = Mock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.listen = _listen_forever
+    pubsub.aclose = AsyncMock()
+
+    fake = Mock()
+    fake.pubsub = Mock(return_value=pubsub)
+    fake.publish = AsyncMock()
+    return cast("Redis", fake)
+
+
+@pytest.fixture
+def fake_cache_store() -> CacheStore:
+    fake = Mock()
+    fake.get_many_with_ttl = AsyncMock(side_effect=lambda names: [(name.encode() * 4, 60.0) for name in names])
+    fake.set_many = AsyncMock()
+    fake.delete_many = AsyncMock()
+    return cast("CacheStore", fake)
+
+
+async def test_repeated_get_is_served_locally(fake_cache_store: CacheStore, fake_redis: Redis) -> None:
+    # Arrange
+    store = LocalLRUCacheStore(
+        fake_cache_store, fake_redis, channel="test", max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30
+    )
+
+    # Act
+    first = await store.get("key")
+    second = await store.get("key")
+    await store.aclose()
+
+    # Assert
+    assert first == second == b"keykeykeykey"
+    cast("AsyncMock", fake_cache_store.get_many_with_ttl).assert_awaited_once_with(["key"])
+
+
+async def test_least_recently_used_value_is_evicted_when_budget_is_exceeded(
+    fake_cache_store: CacheStore,
+    fake_redis: Redis,
+) -> None:
+    # Arrange
+    store = LocalLRUCacheStore(
+        fake_cache_store, fake_redis, channel="test", max_bytes=8, max_entry_bytes=8, ttl_seconds=30
+    )
+
+    # Act
+    await store.get("a")
+    await store.get("b")
+    await store.get("a")
+    await store.get("c")
+    await store.get("a")
+    await store.get("b")
+    await store.aclose()
+
+    # Assert
+    assert [call.args[0] for call in cast("AsyncMock", fake_cache_store.get_many_with_ttl).await_args_list] == [
+        ["a"],
+        ["b"],
+        ["c"],
+        ["b"],
+    ]
+
+
+async def test_delete_drops_local_value_and_notifies_replicas(fake_cache_store: CacheStore, fake_redis: Redis) -> None:
+    # Arrange
+    store = LocalLRUCacheStore(
+        fake_cache_store, fake_redis, channel="test", max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30
+    )
+    await store.get("key")
+
+    # Act
+    await store.delete("key")
+    await store.get("key")
+    await store.aclose()
+
+    # Assert
+    assert cast("AsyncMock", fake_cache_store.get_many_with_ttl).await_count == 2
+    cast("Mock", fake_redis.pubsub).return_value.subscribe.assert_awaited_once()
+    cast("AsyncMock", fake_redis.publish).assert_awaited_once()
+
+
+async def test_get_many_reads_only_missing_values_from_remote_store(
+    fake_cache_store: CacheStore,
+    fake_redis: Redis,
+) -> None:
+    # Arrange
+    store = LocalLRUCacheStore(
+        fake_cache_store, fake_redis, channel="test", max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30
+    )
+    await store.get("a")
+
+    # Act
+    values = await store.get_many(["a", "b", "a"])
+    await store.aclose()
+
+    # Assert
+    assert values == [b"aaaa", b"bbbb", b"aaaa"]
+    cast("AsyncMock", fake_cache_store.get_many_with_ttl).assert_awaited_with(["b"])
+
+
+async def test_local_value_expires_with_remote_value(fake_cache_store: CacheStore, fake_redis: Redis) -> None:
+    # Arrange
+    cast("AsyncMock", fake_cache_store.get_many_with_ttl).side_effect = lambda names: [(b"value", 0.01) for _ in names]
+    store = LocalLRUCacheStore(
+        fake_cache_store, fake_redis, channel="test", max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30
+    )
+    await store.get("key")
+
+    # Act
+    await asyncio.sleep(0.02)
+    await store.get("key")
+    await store.aclose()
+
+    # Assert
+    assert cast("AsyncMock", fake_cache_store.get_many_with_ttl).await_count == 2
+    cast("Mock", fake_redis.pubsub).return_value.subscribe.assert_awaited_once()
+
+
+async def test_local_cache_is_cleared_when_subscription_is_restored(
+    fake_cache_store: CacheStore,
+    fake_redis: Redis,
+) -> None:
+    # Arrange
+    messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def listen() -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await messages.get()
+
+    cast("Mock", fake_redis.pubsub).return_value.listen = listen
+    store = LocalLRUCacheStore(
+        fake_cache_store, fake_redis, channel="test", max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30
+    )
+    await store.get("key")
+
+    # Act
+    # redis-py resubscribes after a reconnect and the server confirms it
+    await messages.put({"type": "subscribe", "channel": b"test", "data": 1})
+    await asyncio.sleep(0)
+    await store.get("key")
+    await store.get("key")
+    await store.aclose()
+
+    # Assert
+    # read again once after the confirmation, then served locally by the same subscription
+    assert cast("AsyncMock", fake_cache_store.get_many_with_ttl).await_count == 2
+    cast("Mock", fake_redis.pubsub).return_value.subscribe.assert_awaited_once()
@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from clever_faq.application.common.ports.cache_store import CacheStore
+from clever_faq.application.common.ports.knowledge_base_generation import KnowledgeBaseGeneration
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.infrastructure.cache.redis_answer_cache_invalidator import RedisAnswerCacheInvalidator
+from clever_faq.infrastructure.errors.cache import CacheError
+
+
+@pytest.fixture
+def cache() -> Mock:
+    cache = Mock(spec=CacheStore)
+    cache.delete_by_tags = AsyncMock(side_effect=CacheError("Redis is down"))
+    return cache
+
+
+@pytest.fixture
+def knowledge_base_generation() -> Mock:
+    knowledge_base_generation = Mock(spec=KnowledgeBaseGeneration)
+    knowledge_base_generation.bump = AsyncMock(return_value=2)
+    return knowledge_base_generation
+
+
+async def test_failed_tag_deletion_bumps_generation(cache: Mock, knowledge_base_generation: Mock) -> None:
+    # Arrange
+    invalidator = RedisAnswerCacheInvalidator(cache, knowledge_base_generation)
+
+    # Act
+    await invalidator.invalidate_document(DocumentID(uuid4()))
+
+    # Assert
+    knowledge_base_generation.bump.assert_awaited_once()
+
+
+async def test_failed_generation_bump_is_not_raised(cache: Mock, knowledge_base_generation: Mock) -> None:
+    # Arrange
+    knowledge_base_generation.bump.side_effect = CacheError("Redis is down")
+    invalidator = RedisAnswerCacheInvalidator(cache, knowledge_base_generation)
+
+    # Act
+    await invalidator.invalidate_document(DocumentID(uuid4()))
+
+    # Assert
+    cache.delete_by_tags.assert_awaited_once()
@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from clever_faq.infrastructure.cache.redis_cache_store import TAG_KEY_PREFIX, RedisCacheStore
+from tests.unit.factories.fake_redis import FakeRedis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def store(fake_redis: FakeRedis) -> RedisCacheStore:
+    return RedisCacheStore(cast("Redis", fake_redis))
+
+
+async def test_get_many_keeps_order_of_names_with_misses(store: RedisCacheStore) -> None:
+    # Arrange
+    await store.set_many({"a": b"1", "c": b"3"}, ttl=60)
+
+    # Act
+    values = await store.get_many(["c", "b", "a", "c"])
+
+    # Assert
+    assert values == [b"3", None, b"1", b"3"]
+
+
+async def test_get_many_with_ttl_maps_missing_and_persistent_values(
+    store: RedisCacheStore,
+    fake_redis: FakeRedis,
+) -> None:
+    # Arrange
+    await store.set("expiring", b"1", ttl=60)
+    fake_redis.strings["persistent"] = b"2"
+
+    # Act
+    values = await store.get_many_with_ttl(["expiring", "persistent", "missing"])
+
+    # Assert
+    [(expiring_value, expiring_ttl), persistent, missing] = values
+    assert expiring_value == b"1"
+    assert expiring_ttl == pytest.approx(60, abs=1)
+    assert persistent == (b"2", None)
+    assert missing == (None, None)
+
+
+async def test_delete_by_tags_deletes_values_of_any_tag(store: RedisCacheStore, fake_redis: FakeRedis) -> None:
+    # Arrange
+    await store.set_many({"a": b"1", "b": b"2"}, ttl=60, tags=["document:1"])
+    await store.set("c", b"3", ttl=60, tags=["document:2", "unanswered"])
+    await store.set("d", b"4", ttl=60, tags=["document:3"])
+
+    # Act
+    deleted = await store.delete_by_tags(["document:1", "unanswered"])
+
+    # Assert
+    assert deleted == {"a", "b", "c"}
+    assert await store.get_many(["a", "b", "c", "d"]) == [None, None, None, b"4"]
+    assert f"{TAG_KEY_PREFIX}document:1" not in fake_redis.sets
+    assert f"{TAG_KEY_PREFIX}unanswered" not in fake_redis.sets
+    assert f"{TAG_KEY_PREFIX}document:2" in fake_redis.sets
+
+
+async def test_tag_set_lives_as_long_as_its_longest_value(store: RedisCacheStore, fake_redis: FakeRedis) -> None:
+    # Arrange
+    await store.set("long", b"1", ttl=600, tags=["document:1"])
+
+    # Act
+    await store.set("short", b"2", ttl=60, tags=["document:1"])
+
+    # Assert
+    assert await fake_redis.pttl(f"{TAG_KEY_PREFIX}document:1") == pytest.approx(600_000, abs=1000)
+
+
+async def test_delete_many_unlinks_values(store: RedisCacheStore, fake_redis: FakeRedis) -> None:
+    # Arrange
+    await store.set("a", b"1", ttl=60)
+
+    # Act
+    await store.delete_many([])
+    await store.delete_many(["a"])
+
+    # Assert
+    assert fake_redis.strings == {}
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.infrastructure.cache.redis_document_content_index import (
+    DOCUMENT_CONTENT_KEY_PREFIX,
+    RedisDocumentContentIndex,
+)
+from tests.unit.factories.fake_redis import FakeRedis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+CONTENT_HASH = "a" * 64
+
+
+async def test_first_claim_registers_the_document_and_later_claims_get_it() -> None:
+    # Arrange
+    index = RedisDocumentContentIndex(cast("Redis", FakeRedis()))
+    first_document_id = DocumentID(uuid4())
+
+    # Act
+    first_holder = await index.claim(CONTENT_HASH, first_document_id)
+    second_holder = await index.claim(CONTENT_HASH, DocumentID(uuid4()))
+
+    # Assert
+    assert first_holder == first_document_id
+    assert second_holder == first_document_id
+
+
+async def test_release_compares_the_holder_before_deleting() -> None:
+    # Arrange
+    redis_client = Mock()
+    redis_client.eval = AsyncMock(return_value=1)
+    index = RedisDocumentContentIndex(cast("Redis", redis_client))
+    document_id = DocumentID(uuid4())
+
+    # Act
+    await index.release(CONTENT_HASH, document_id)
+
+    # Assert
+    script, numkeys, key, holder = redis_client.eval.await_args.args
+    assert "GET" in script
+    assert "DEL" in script
+    assert numkeys == 1
+    assert key == DOCUMENT_CONTENT_KEY_PREFIX + CONTENT_HASH
+    assert holder == document_id.bytes
+
+
+async def test_release_failure_is_not_raised() -> None:
+    # Arrange
+    redis_client = Mock()
+    redis_client.eval = AsyncMock(side_effect=RedisError("Redis is down"))
+    index = RedisDocumentContentIndex(cast("Redis", redis_client))
+
+    # Act
+    await index.release(CONTENT_HASH, DocumentID(uuid4()))
+
+    # Assert
+    redis_client.eval.assert_awaited_once()
@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from clever_faq.infrastructure.cache.redis_cache_store import RedisCacheStore
+from clever_faq.infrastructure.cache.semantic_answer_index import RedisSemanticAnswerIndex
+from tests.unit.factories.fake_redis import FakeRedis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+def create_index(fake_redis: FakeRedis, max_entries: int = 10) -> RedisSemanticAnswerIndex:
+    redis_client = cast("Redis", fake_redis)
+    return RedisSemanticAnswerIndex(
+        redis_client,
+        RedisCacheStore(redis_client),
+        namespace="semantic",
+        max_entries=max_entries,
+        sync_interval_seconds=60.0,
+    )
+
+
+async def test_nearest_entry_is_found_by_cosine_similarity(fake_redis: FakeRedis) -> None:
+    # Arrange
+    index = create_index(fake_redis)
+    await index.add([1.0, 0.0], b"first", ttl=60, source_document_ids=[])
+    await index.add([0.0, 2.0], b"second", ttl=60, source_document_ids=[])
+
+    # Act
+    neighbour = await index.nearest([0.1, 1.0])
+
+    # Assert
+    assert neighbour is not None
+    assert neighbour.similarity == pytest.approx(0.995, abs=1e-3)
+    assert await index.read_answer(neighbour.entry_id) == b"second"
+
+
+async def test_oldest_entry_is_evicted_at_capacity(fake_redis: FakeRedis) -> None:
+    # Arrange
+    index = create_index(fake_redis, max_entries=2)
+    await index.add([1.0, 0.0], b"oldest", ttl=60, source_document_ids=[])
+    await index.add([0.0, 1.0], b"second", ttl=60, source_document_ids=[])
+
+    # Act
+    await index.add([-1.0, 0.0], b"newest", ttl=60, source_document_ids=[])
+
+    # Assert
+    neighbour = await index.nearest([1.0, 0.0])
+    assert len(index) == 2
+    assert len(fake_redis.sorted_sets["semantic:entries"]) == 2
+    assert neighbour is not None
+    assert neighbour.similarity == pytest.approx(0.0)
+
+
+async def test_index_is_reloaded_from_redis(fake_redis: FakeRedis) -> None:
+    # Arrange
+    await create_index(fake_redis).add([3.0, 4.0], b"answer", ttl=60, source_document_ids=[])
+    reloaded_index = create_index(fake_redis)
+
+    # Act
+    neighbour = await reloaded_index.nearest([3.0, 4.0])
+
+    # Assert
+    assert len(reloaded_index) == 1
+    assert neighbour is not None
+    assert neighbour.similarity == pytest.approx(1.0)
+    assert await reloaded_index.read_answer(neighbour.entry_id) == b"answer"
+
+
+async def test_entry_with_expired_answer_is_forgotten(fake_redis: FakeRedis) -> None:
+    # Arrange
+    index = create_index(fake_redis)
+    await index.add([1.0, 0.0], b"answer", ttl=60, source_document_ids=[])
+    neighbour = await index.nearest([1.0, 0.0])
+    assert neighbour is not None
+    del fake_redis.strings[f"semantic:answer:{neighbour.entry_id}"]
+
+    # Act
+    answer = await index.read_answer(neighbour.entry_id)
+
+    # Assert
+    assert answer is None
+    assert len(index) == 0
+    assert len(fake_redis.sorted_sets["semantic:entries"]) == 0
@@ -0,0 +1,142 @@
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from clever_faq.application.common.ports.question.question_answering_port import (
+    MessageWithTokenDTO,
+    QuestionAnsweringPort,
+)
+from clever_faq.domain.dialog.values.message import Message
+from clever_faq.domain.dialog.values.tokens import Tokens
+from clever_faq.infrastructure.cache.adapters.semantic_cached_question_answering_port import (
+    SemanticCachedQuestionAnsweringPort,
+)
+from clever_faq.infrastructure.cache.answer_cache_key import AnswerCacheKeyBuilder
+from clever_faq.infrastructure.cache.redis_cache_store import RedisCacheStore
+from clever_faq.infrastructure.cache.semantic_answer_index import RedisSemanticAnswerIndex
+from clever_faq.infrastructure.cache.stats import SemanticCacheStats
+from clever_faq.setup.config.cache import AnswerCacheConfig
+from tests.unit.factories.fake_redis import FakeRedis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# cosine similarity to "как сменить пароль" is in the comment of each question
+EMBEDDINGS: dict[str, list[float]] = {
+    "как сменить пароль": [1.0, 0.0],
+    "как поменять пароль": [0.95, 0.312],  # 0.95, above the hit threshold
+    "как сменить логин": [0.88, 0.475],  # 0.88, above the near-hit threshold only
+    "как удалить задачу": [0.0, 1.0],  # 0.0
+}
+
+
+@pytest.fixture
+def question_answering_port() -> Mock:
+    port = Mock(spec=QuestionAnsweringPort)
+    port.answer_the_question = AsyncMock(
+        side_effect=lambda question: MessageWithTokenDTO(
+            message=Message(f"Ответ на {question.value}"), tokens=Tokens(prompt=100, completion=10)
+        )
+    )
+    return port
+
+
+@pytest.fixture
+def key_builder() -> Mock:
+    key_builder = Mock(spec=AnswerCacheKeyBuilder)
+    key_builder.version = AsyncMock(return_value="v:1")
+    return key_builder
+
+
+@pytest.fixture
+def stats() -> SemanticCacheStats:
+    return SemanticCacheStats()
+
+
+@pytest.fixture
+def port(
+    question_answering_port: Mock,
+    key_builder: Mock,
+    stats: SemanticCacheStats,
+) -> SemanticCachedQuestionAnsweringPort:
+    embeddings = Mock(spec=Embeddings)
+    embeddings.aembed_query = AsyncMock(side_effect=EMBEDDINGS.__getitem__)
+    redis_client = cast("Redis", FakeRedis())
+    index = RedisSemanticAnswerIndex(
+        redis_client, RedisCacheStore(redis_client), namespace="semantic", max_entries=10, sync_interval_seconds=60.0
+    )
+    return SemanticCachedQuestionAnsweringPort(
+        question_answering_port, embeddings, index, key_builder, stats, AnswerCacheConfig()
+    )
+
+
+async def test_same_question_is_answered_from_cache(
+    port: SemanticCachedQuestionAnsweringPort,
+    question_answering_port: Mock,
+    stats: SemanticCacheStats,
+) -> None:
+    # Arrange
+    first_answer = await port.answer_the_question(Message("Как сменить пароль?"))
+
+    # Act
+    second_answer = await port.answer_the_question(Message("как сменить пароль"))
+
+    # Assert
+    assert second_answer == first_answer
+    question_answering_port.answer_the_question.assert_awaited_once()
+    assert (stats.hits, stats.near_hits, stats.misses) == (1, 0, 1)
+
+
+async def test_paraphrase_above_threshold_is_answered_from_cache(
+    port: SemanticCachedQuestionAnsweringPort,
+    question_answering_port: Mock,
+    stats: SemanticCacheStats,
+) -> None:
+    # Arrange
+    await port.answer_the_question(Message("Как сменить пароль?"))
+
+    # Act
+    answer = await port.answer_the_question(Message("Как поменять пароль?"))
+
+    # Assert
+    assert answer.message == Message("Ответ на Как сменить пароль?")
+    question_answering_port.answer_the_question.assert_awaited_once()
+    assert stats.hits == 1
+
+
+async def test_question_below_threshold_is_answered_by_model(
+    port: SemanticCachedQuestionAnsweringPort,
+    question_answering_port: Mock,
+    stats: SemanticCacheStats,
+) -> None:
+    # Arrange
+    await port.answer_the_question(Message("Как сменить пароль?"))
+
+    # Act
+    near_answer = await port.answer_the_question(Message("Как сменить логин?"))
+    far_answer = await port.answer_the_question(Message("Как удалить задачу?"))
+
+    # Assert
+    assert near_answer.message == Message("Ответ на Как сменить логин?")
+    assert far_answer.message == Message("Ответ на Как удалить задачу?")
+    assert question_answering_port.answer_the_question.await_count == 3
+    assert (stats.hits, stats.near_hits, stats.misses) == (0, 1, 2)
+
+
+async def test_answer_of_other_knowledge_base_version_is_discarded(
+    port: SemanticCachedQuestionAnsweringPort,
+    question_answering_port: Mock,
+    key_builder: Mock,
+) -> None:
+    # Arrange
+    await port.answer_the_question(Message("Как сменить пароль?"))
+    key_builder.version.return_value = "v:2"
+
+    # Act
+    await port.answer_the_question(Message("Как сменить пароль?"))
+    await port.answer_the_question(Message("Как сменить пароль?"))
+
+    # Assert
+    assert question_answering_port.answer_the_question.await_count == 2
@@ -0,0 +1,58 @@
+import asyncio
+from typing import cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from redis.asyncio import Redis
+
+from clever_faq.infrastructure.cache.single_flight import RedisSingleFlight
+from clever_faq.infrastructure.cache.stats import SingleFlightStats
+
+
+@pytest.fixture
+def fake_redis() -> Redis:
+    fake = Mock()
+    fake.set = AsyncMock(return_value=True)
+    fake.publish = AsyncMock()
+    fake.register_script = Mock(return_value=AsyncMock())
+    return cast("Redis", fake)
+
+
+async def test_concurrent_calls_with_same_key_are_computed_once(fake_redis: Redis) -> None:
+    # Arrange
+    stats = SingleFlightStats()
+    single_flight = RedisSingleFlight(fake_redis, namespace="test", lock_ttl_seconds=1.0, stats=stats)
+    release = asyncio.Event()
+    compute = AsyncMock(side_effect=release.wait)
+    read_result = AsyncMock(return_value=None)
+
+    # Act
+    calls = [asyncio.create_task(single_flight.run("key", compute, read_result)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    # Assert
+    assert results == [True] * 5
+    compute.assert_awaited_once()
+    assert stats.leaders == 1
+    assert stats.coalesced_local == 4
+
+
+async def test_failure_is_shared_with_coalesced_calls(fake_redis: Redis) -> None:
+    # Arrange
+    single_flight = RedisSingleFlight(fake_redis, namespace="test", lock_ttl_seconds=1.0, stats=SingleFlightStats())
+    release = asyncio.Event()
+
+    async def compute() -> None:
+        await release.wait()
+        raise RuntimeError
+
+    # Act
+    calls = [asyncio.create_task(single_flight.run("key", compute, AsyncMock(return_value=None))) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,156 @@
+import hashlib
+from collections.abc import AsyncIterator
+from io import BytesIO
+from types import TracebackType
+from typing import cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from aiobotocore.client import AioBaseClient
+
+from clever_faq.application.common.ports.document.document_storage import DocumentUploadDTO
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.domain.document.values.document_name import DocumentName
+from clever_faq.domain.document.values.document_type import DocumentType
+from clever_faq.infrastructure.errors.file import DocumentTooLargeError
+from clever_faq.infrastructure.persistence.adapters.aiobotocore_document_storage import AiobotocoreDocumentStorage
+from clever_faq.setup.config.s3 import S3_MIN_MULTIPART_CHUNK_SIZE_BYTES, S3Config
+from tests.unit.factories.settings_data import create_s3_settings_data
+
+CHUNK_SIZE = S3_MIN_MULTIPART_CHUNK_SIZE_BYTES
+
+
+class FakeDocumentContentStream:
+    def __init__(self, content: bytes) -> None:
+        self._content = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._content.read(size)
+
+
+class FakeStreamingBody:
+    def __init__(self, content: bytes) -> None:
+        self._content = BytesIO(content)
+
+    async def __aenter__(self) -> "FakeStreamingBody":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._content.close()
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        while chunk := self._content.read(chunk_size):
+            yield chunk
+
+
+@pytest.fixture
+def fake_s3_client() -> AioBaseClient:
+    fake = Mock()
+    fake.put_object = AsyncMock()
+    fake.create_multipart_upload = AsyncMock(return_value={"UploadId": "upload"})
+    fake.upload_part = AsyncMock(side_effect=lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"})
+    fake.complete_multipart_upload = AsyncMock()
+    fake.abort_multipart_upload = AsyncMock()
+    return cast("AioBaseClient", fake)
+
+
+def create_storage(
+    client: AioBaseClient,
+    max_upload_size_bytes: int = 100 * CHUNK_SIZE,
+    read_spool_max_bytes: int = CHUNK_SIZE,
+) -> AiobotocoreDocumentStorage:
+    config = S3Config.model_validate(
+        create_s3_settings_data(
+            max_upload_size_bytes=max_upload_size_bytes,
+            multipart_chunk_size_bytes=CHUNK_SIZE,
+            read_spool_max_bytes=read_spool_max_bytes,
+        )
+    )
+    return AiobotocoreDocumentStorage(client, config)
+
+
+def create_upload(content: bytes) -> DocumentUploadDTO:
+    return DocumentUploadDTO(
+        document_id=DocumentID(uuid4()),
+        document_name=DocumentName("Manual.pdf"),
+        document_type=DocumentType.PDF,
+        document_content=FakeDocumentContentStream(content),
+    )
+
+
+async def test_document_smaller_than_part_is_put_at_once(fake_s3_client: AioBaseClient) -> None:
+    # Arrange
+    content = b"binary"
+    storage = create_storage(fake_s3_client)
+
+    # Act
+    stored_document = await storage.add(create_upload(content))
+
+    # Assert
+    assert stored_document.size == len(content)
+    assert stored_document.content_hash == hashlib.sha256(content).hexdigest()
+    assert cast("AsyncMock", fake_s3_client.put_object).await_args.kwargs["Body"] == content
+    cast("AsyncMock", fake_s3_client.create_multipart_upload).assert_not_awaited()
+
+
+async def test_big_document_is_uploaded_in_parts(fake_s3_client: AioBaseClient) -> None:
+    # Arrange
+    content = bytes(2 * CHUNK_SIZE + 1)
+    storage = create_storage(fake_s3_client)
+
+    # Act
+    stored_document = await storage.add(create_upload(content))
+
+    # Assert
+    assert stored_document.size == len(content)
+    assert stored_document.content_hash == hashlib.sha256(content).hexdigest()
+    part_sizes = [len(call.kwargs["Body"]) for call in cast("AsyncMock", fake_s3_client.upload_part).await_args_list]
+    assert part_sizes == [CHUNK_SIZE, CHUNK_SIZE, 1]
+    cast("AsyncMock", fake_s3_client.complete_multipart_upload).assert_awaited_once()
+    assert cast("AsyncMock", fake_s3_client.complete_multipart_upload).await_args.kwargs["MultipartUpload"] == {
+        "Parts": [{"ETag": f"etag-{number}", "PartNumber": number} for number in (1, 2, 3)]
+    }
+
+
+async def test_too_large_document_is_rejected_and_upload_aborted(fake_s3_client: AioBaseClient) -> None:
+    # Arrange
+    storage = create_storage(fake_s3_client, max_upload_size_bytes=CHUNK_SIZE + 1)
+
+    # Act & Assert
+    with pytest.raises(DocumentTooLargeError):
+        await storage.add(create_upload(bytes(CHUNK_SIZE + 2)))
+
+    cast("AsyncMock", fake_s3_client.abort_multipart_upload).assert_awaited_once()
+    cast("AsyncMock", fake_s3_client.complete_multipart_upload).assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "read_spool_max_bytes",
+    [
+        pytest.param(1024, id="spilled_to_disk"),
+        pytest.param(CHUNK_SIZE, id="kept_in_memory"),
+    ],
+)
+async def test_document_is_read_into_seekable_file(fake_s3_client: AioBaseClient, read_spool_max_bytes: int) -> None:
+    # Arrange
+    content = bytes(range(256)) * 16
+    cast("Mock", fake_s3_client).get_object = AsyncMock(
+        return_value={"Body": FakeStreamingBody(content), "Metadata": {"document_type": DocumentType.PDF.value}}
+    )
+    storage = create_storage(fake_s3_client, read_spool_max_bytes=read_spool_max_bytes)
+
+    # Act
+    document = await storage.read_by_id(DocumentID(uuid4()))
+
+    # Assert
+    assert document is not None
+    with document.document_content as document_file:
+        assert document_file.read() == content
+        document_file.seek(0)
+        assert document_file.read(4) == content[:4]
@@ -0,0 +1,114 @@
+from collections.abc import AsyncIterator
+from itertools import accumulate
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from tenacity import wait_none
+
+from clever_faq.domain.document.entities.chunk import Chunk
+from clever_faq.domain.document.entities.document import Document
+from clever_faq.domain.document.values.chunk_id import ChunkID
+from clever_faq.domain.document.values.document_id import DocumentID
+from clever_faq.domain.document.values.document_name import DocumentName
+from clever_faq.domain.document.values.document_text import DocumentText
+from clever_faq.domain.document.values.document_type import DocumentType
+from clever_faq.infrastructure.errors.persistence import EntityAddError
+from clever_faq.infrastructure.persistence.adapters.langchain_document_command_gateway import (
+    LangchainVectorStoreGateway,
+)
+from clever_faq.setup.config.chroma import ChromaDBConfig
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.vectorstores import VectorStore
+
+
+async def produce_chunks(count: int, text_length: int = 8) -> AsyncIterator[Chunk]:
+    for index in range(count):
+        yield Chunk(id=ChunkID(uuid4()), text=DocumentText(f"{index}".ljust(text_length, "x")))
+
+
+def create_gateway(vector_store: Mock, **config: int) -> LangchainVectorStoreGateway:
+    return LangchainVectorStoreGateway(
+        cast("VectorStore", vector_store),
+        cast("Embeddings", Mock()),
+        ChromaDBConfig.model_validate(
+            {"CHROMA_SERVER_HTTP_HOST": "localhost", "CHROMA_SERVER_HTTP_PORT": 8000} | config
+        ),
+    )
+
+
+@pytest.fixture
+def document() -> Document:
+    return Document(
+        id=DocumentID(uuid4()),
+        name=DocumentName("guide.pdf"),
+        chunks=[],
+        type=DocumentType.PDF,
+    )
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(LangchainVectorStoreGateway._upsert.retry, "wait", wait_none())  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    ("chunks_count", "config", "expected_batch_sizes"),
+    [
+        pytest.param(0, {}, [], id="no_chunks"),
+        pytest.param(3, {"CHROMA_INSERT_BATCH_SIZE": 4}, [3], id="partial_batch"),
+        pytest.param(9, {"CHROMA_INSERT_BATCH_SIZE": 4}, [4, 4, 1], id="full_and_partial_batches"),
+        pytest.param(9, {"CHROMA_INSERT_BATCH_MAX_BYTES": 24}, [3, 3, 3], id="batches_limited_by_size"),
+        pytest.param(2, {"CHROMA_INSERT_BATCH_MAX_BYTES": 4}, [1, 1], id="chunk_larger_than_size_limit"),
+        pytest.param(9, {"CHROMA_INSERT_BATCH_SIZE": 2, "CHROMA_INSERT_CONCURRENCY": 1}, [2, 2, 2, 2, 1], id="serial"),
+    ],
+)
+async def test_chunks_are_inserted_in_batches_as_they_arrive(
+    document: Document,
+    chunks_count: int,
+    config: dict[str, int],
+    expected_batch_sizes: list[int],
+) -> None:
+    # Arrange
+    vector_store = Mock()
+    vector_store.aadd_documents = AsyncMock()
+    gateway = create_gateway(vector_store, **config)
+
+    # Act
+    stored_counts = [stored_count async for stored_count in gateway.add_chunks(document, produce_chunks(chunks_count))]
+
+    # Assert
+    assert stored_counts == list(accumulate(expected_batch_sizes))
+    assert [len(call.args[0]) for call in vector_store.aadd_documents.call_args_list] == expected_batch_sizes
+
+
+@pytest.mark.usefixtures("no_retry_wait")
+async def test_failed_batch_is_retried_alone(document: Document) -> None:
+    # Arrange
+    vector_store = Mock()
+    vector_store.aadd_documents = AsyncMock(side_effect=[None, ConnectionError(), None, None])
+    gateway = create_gateway(vector_store, CHROMA_INSERT_BATCH_SIZE=2)
+
+    # Act
+    stored_counts = [stored_count async for stored_count in gateway.add_chunks(document, produce_chunks(6))]
+
+    # Assert
+    assert stored_counts == [2, 4, 6]
+    assert vector_store.aadd_documents.await_count == 4
+
+
+@pytest.mark.usefixtures("no_retry_wait")
+async def test_stored_counts_stop_before_batch_that_keeps_failing(document: Document) -> None:
+    # Arrange
+    vector_store = Mock()
+    vector_store.aadd_documents = AsyncMock(side_effect=[None, *[ConnectionError()] * 3])
+    gateway = create_gateway(vector_store, CHROMA_INSERT_BATCH_SIZE=2, CHROMA_INSERT_CONCURRENCY=1)
+    stored_counts = gateway.add_chunks(document, produce_chunks(6))
+
+    # Act & Assert
+    assert await anext(stored_counts) == 2
+    with pytest.raises(EntityAddError):
+        await anext(stored_counts)
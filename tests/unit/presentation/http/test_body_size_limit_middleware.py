@@ -0,0 +1,83 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+import httpx
+from fastapi import FastAPI, File, UploadFile, status
+
+from clever_faq.presentation.http.v1.middlewares.body_size_limit import BodySizeLimitMiddleware
+
+
+class UploadedSizes:
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+
+
+def _make_app(max_body_size: int) -> tuple[FastAPI, UploadedSizes]:
+    app = FastAPI()
+    uploaded = UploadedSizes()
+
+    @app.post("/documents")
+    async def upload(document: Annotated[UploadFile, File(...)]) -> dict[str, int]:
+        size: int = len(await document.read())
+        uploaded.sizes.append(size)
+        return {"size": size}
+
+    app.add_middleware(BodySizeLimitMiddleware, max_body_size=max_body_size)  # type: ignore[arg-type, unused-ignore]
+    return app, uploaded
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_upload_within_the_limit_reaches_the_handler() -> None:
+    # Arrange
+    app, uploaded = _make_app(max_body_size=1024)
+
+    # Act
+    async with _client(app) as client:
+        response = await client.post("/documents", files={"document": ("faq.txt", b"a" * 100, "text/plain")})
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert uploaded.sizes == [100]
+
+
+async def test_declared_content_length_over_the_limit_is_rejected_before_the_form_is_parsed() -> None:
+    # Arrange
+    app, uploaded = _make_app(max_body_size=1024)
+
+    # Act
+    async with _client(app) as client:
+        response = await client.post("/documents", files={"document": ("faq.txt", b"a" * 2048, "text/plain")})
+
+    # Assert
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert "1024" in response.json()["description"]
+    assert uploaded.sizes == []
+
+
+async def test_chunked_body_over_the_limit_is_cut_off_while_it_is_received() -> None:
+    # Arrange
+    app, uploaded = _make_app(max_body_size=1024)
+    boundary = "boundary"
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="document"; filename="faq.txt"\r\n'
+        f"Content-Type: text/plain\r\n\r\n{'a' * 2048}\r\n--{boundary}--\r\n"
+    ).encode()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), 256):
+            yield body[start : start + 256]
+
+    # Act
+    async with _client(app) as client:
+        response = await client.post(
+            "/documents",
+            content=chunks(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+
+    # Assert
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert uploaded.sizes == []
@@ -0,0 +1,103 @@
+from collections.abc import AsyncGenerator
+from typing import cast
+
+from fastapi.responses import StreamingResponse
+
+from clever_faq.application.commands.questions.stream_the_answer import (
+    StreamTheAnswerCommand,
+    StreamTheAnswerCommandHandler,
+)
+from clever_faq.application.common.views.questions import AnswerDeltaView, AnswerTheQuestionView
+from clever_faq.presentation.http.v1.routes.questions.ask_question.handlers import stream_the_answer_handler
+from clever_faq.presentation.http.v1.routes.questions.ask_question.schemas import AskQuestionSchemaRequest
+
+
+class FakeStreamTheAnswerInteractor:
+    def __init__(self, views: list[AnswerDeltaView | AnswerTheQuestionView], *, fail: bool = False) -> None:
+        self.views = views
+        self.fail = fail
+        self.closed = False
+        self.finished = False
+        self.questions: list[str] = []
+
+    async def __call__(
+        self, data: StreamTheAnswerCommand
+    ) -> AsyncGenerator[AnswerDeltaView | AnswerTheQuestionView, None]:
+        self.questions.append(data.question)
+        try:
+            for view in self.views:
+                yield view
+            if self.fail:
+                msg = "Model is unavailable"
+                raise RuntimeError(msg)
+            self.finished = True
+        finally:
+            self.closed = True
+
+
+async def _stream(interactor: FakeStreamTheAnswerInteractor) -> StreamingResponse:
+    return await stream_the_answer_handler(
+        AskQuestionSchemaRequest(question="Как сменить пароль?"),
+        cast("StreamTheAnswerCommandHandler", interactor),
+    )
+
+
+async def test_answer_is_framed_as_server_sent_events() -> None:
+    # Arrange
+    interactor = FakeStreamTheAnswerInteractor(
+        [
+            AnswerDeltaView(text="Откройте "),
+            AnswerDeltaView(text="профиль."),
+            AnswerTheQuestionView(answer="Откройте профиль."),
+        ]
+    )
+
+    # Act
+    response = await _stream(interactor)
+    events = [event async for event in response.body_iterator]
+
+    # Assert
+    assert interactor.questions == ["Как сменить пароль?"]
+    assert response.media_type == "text/event-stream"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert events == [
+        'event: delta\ndata: {"text":"Откройте "}\n\n',
+        'event: delta\ndata: {"text":"профиль."}\n\n',
+        'event: answer\ndata: {"answer":"Откройте профиль."}\n\n',
+    ]
+
+
+async def test_failure_after_first_event_is_sent_as_error_event() -> None:
+    # Arrange
+    interactor = FakeStreamTheAnswerInteractor([AnswerDeltaView(text="Откройте ")], fail=True)
+
+    # Act
+    response = await _stream(interactor)
+    events = [event async for event in response.body_iterator]
+
+    # Assert
+    assert events == [
+        'event: delta\ndata: {"text":"Откройте "}\n\n',
+        'event: error\ndata: {"description":"Internal server error."}\n\n',
+    ]
+
+
+async def test_client_disconnect_stops_the_answer() -> None:
+    # Arrange
+    interactor = FakeStreamTheAnswerInteractor(
+        [
+            AnswerDeltaView(text="Откройте "),
+            AnswerDeltaView(text="профиль."),
+            AnswerTheQuestionView(answer="Откройте профиль."),
+        ]
+    )
+    response = await _stream(interactor)
+    events = cast("AsyncGenerator[str, None]", response.body_iterator)
+
+    # Act
+    await anext(events)
+    await events.aclose()
+
+    # Assert
+    assert interactor.closed
+    assert not interactor.finished
@@ -1,9 +1,15 @@
 import pytest
 from pydantic import ValidationError
 
-from clever_faq.setup.config.cache import REDIS_DB_MAX, REDIS_DB_MIN, REDIS_MAX_CONNECTIONS_MIN, RedisConfig
+from clever_faq.setup.config.cache import (
+    REDIS_DB_MAX,
+    REDIS_DB_MIN,
+    REDIS_MAX_CONNECTIONS_MIN,
+    AnswerCacheConfig,
+    RedisConfig,
+)
 from clever_faq.setup.config.database import PORT_MAX, PORT_MIN
-from tests.unit.factories.settings_data import create_redis_settings_data
+from tests.unit.factories.settings_data import create_answer_cache_settings_data, create_redis_settings_data
 
 
 @pytest.mark.parametrize(
@@ -108,3 +114,48 @@ def test_redis_max_connections_rejects_incorrect_value(max_connections: int) ->
     # Act & Assert
     with pytest.raises(ValidationError):
         RedisConfig.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("similarity_threshold", "near_hit_threshold"),
+    [
+        pytest.param(0.92, 0.85, id="defaults"),
+        pytest.param(0.9, 0.9, id="equal"),
+        pytest.param(1.0, 0.5, id="exact_only"),
+    ],
+)
+def test_answer_cache_semantic_thresholds_accept_correct_value(
+    similarity_threshold: float,
+    near_hit_threshold: float,
+) -> None:
+    # Arrange
+    data = create_answer_cache_settings_data(
+        semantic_similarity_threshold=similarity_threshold,
+        semantic_near_hit_threshold=near_hit_threshold,
+    )
+
+    # Act & Assert
+    AnswerCacheConfig.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("similarity_threshold", "near_hit_threshold"),
+    [
+        pytest.param(0.85, 0.92, id="near_hit_above_hit"),
+        pytest.param(0.0, 0.0, id="zero"),
+        pytest.param(1.1, 0.9, id="above_one"),
+    ],
+)
+def test_answer_cache_semantic_thresholds_reject_incorrect_value(
+    similarity_threshold: float,
+    near_hit_threshold: float,
+) -> None:
+    # Arrange
+    data = create_answer_cache_settings_data(
+        semantic_similarity_threshold=similarity_threshold,
+        semantic_near_hit_threshold=near_hit_threshold,
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        AnswerCacheConfig.model_validate(data)
@@ -2,7 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from clever_faq.setup.config.database import PORT_MAX, PORT_MIN
-from clever_faq.setup.config.s3 import S3Config
+from clever_faq.setup.config.s3 import S3_MIN_MULTIPART_CHUNK_SIZE_BYTES, S3Config
 from tests.unit.factories.settings_data import create_s3_settings_data
 
 
@@ -38,3 +38,22 @@ def test_s3_port_rejects_incorrect_value(port: int) -> None:
     # Act & Assert
     with pytest.raises(ValidationError):
         S3Config.model_validate(data)
+
+
+@pytest.mark.parametrize(
+    ("max_upload_size_bytes", "multipart_chunk_size_bytes"),
+    [
+        pytest.param(0, S3_MIN_MULTIPART_CHUNK_SIZE_BYTES, id="zero_max_upload_size"),
+        pytest.param(1024, S3_MIN_MULTIPART_CHUNK_SIZE_BYTES - 1, id="chunk_below_s3_minimum"),
+    ],
+)
+def test_s3_upload_limits_reject_incorrect_value(max_upload_size_bytes: int, multipart_chunk_size_bytes: int) -> None:
+    # Arrange
+    data = create_s3_settings_data(
+        max_upload_size_bytes=max_upload_size_bytes,
+        multipart_chunk_size_bytes=multipart_chunk_size_bytes,
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        S3Config.model_validate(data)